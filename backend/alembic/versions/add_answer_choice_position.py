@@ -0,0 +1,30 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8c4e1f6a3d27'
+down_revision: Union[str, Sequence[str], None] = '2f8d6a1c7b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('answer', sa.Column('choice_position', sa.SmallInteger(), nullable=True))
+    op.execute(
+        "UPDATE answer SET choice_position = choice.position "
+        "FROM choice WHERE choice.id = answer.choice_id"
+    )
+    op.drop_index('ix_answer_question_id_choice_id', table_name='answer')
+    op.create_index('ix_answer_question_id_choice_position', 'answer', ['question_id', 'choice_position'], unique=False)
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE answer SET response = choice.content "
+        "FROM choice WHERE choice.id = answer.choice_id AND answer.response = ''"
+    )
+    op.drop_index('ix_answer_question_id_choice_position', table_name='answer')
+    op.create_index('ix_answer_question_id_choice_id', 'answer', ['question_id', 'choice_id'], unique=False)
+    op.drop_column('answer', 'choice_position')
@@ -0,0 +1,20 @@
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '5c8a1e7d3b46'
+down_revision: Union[str, Sequence[str], None] = '9f4b2d6e1a83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE answer SET response = choice.content "
+        "FROM choice WHERE choice.id = answer.choice_id AND answer.response = ''"
+    )
+
+
+def downgrade() -> None:
+    pass
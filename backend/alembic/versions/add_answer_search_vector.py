@@ -0,0 +1,30 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from app.core.config import settings
+
+
+revision: str = '3b9d7e2f5a18'
+down_revision: Union[str, Sequence[str], None] = '8c4e1f6a3d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('answer', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.get_bind().execute(
+        sa.text(
+            "UPDATE answer SET search_vector = to_tsvector(CAST(:config AS regconfig), answer.response) "
+            "FROM question WHERE question.id = answer.question_id "
+            "AND question.answer_type = 'open' AND answer.response <> ''"
+        ),
+        {"config": settings.SEARCH_TEXT_CONFIG}
+    )
+    op.create_index('ix_answer_search_vector', 'answer', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answer_search_vector', table_name='answer', postgresql_using='gin')
+    op.drop_column('answer', 'search_vector')
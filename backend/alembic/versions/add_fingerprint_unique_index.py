@@ -0,0 +1,25 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9f4b2d6e1a83'
+down_revision: Union[str, Sequence[str], None] = '0a5e8b3c6d72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DELETE FROM submissionfingerprint older USING submissionfingerprint newer "
+        "WHERE older.survey_id = newer.survey_id AND older.fingerprint_hash = newer.fingerprint_hash "
+        "AND (older.submitted_at, older.id) < (newer.submitted_at, newer.id)"
+    )
+    op.create_index('ix_submissionfingerprint_survey_id_hash', 'submissionfingerprint', ['survey_id', 'fingerprint_hash'], unique=True)
+    op.drop_index('ix_submissionfingerprint_survey_id_hash_submitted_at', table_name='submissionfingerprint')
+
+
+def downgrade() -> None:
+    op.create_index('ix_submissionfingerprint_survey_id_hash_submitted_at', 'submissionfingerprint', ['survey_id', 'fingerprint_hash', 'submitted_at'], unique=False)
+    op.drop_index('ix_submissionfingerprint_survey_id_hash', table_name='submissionfingerprint')
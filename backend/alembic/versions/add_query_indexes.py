@@ -0,0 +1,40 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '4c1d8e2a7f93'
+down_revision: Union[str, Sequence[str], None] = 'b9e798652b1c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_question_survey_id_position', 'question', ['survey_id', 'position'], unique=False)
+    op.create_index('ix_choice_question_id_position', 'choice', ['question_id', 'position'], unique=False)
+    op.create_index('ix_submission_survey_id_created_at', 'submission', ['survey_id', 'created_at'], unique=False)
+    op.create_index(op.f('ix_answer_submission_id'), 'answer', ['submission_id'], unique=False)
+    op.create_index(op.f('ix_survey_user_id'), 'survey', ['user_id'], unique=False)
+    op.create_index('ix_survey_status_expires_at', 'survey', ['status', 'expires_at'], unique=False)
+    op.create_index('ix_surveytemplate_user_id_created_at', 'surveytemplate', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_surveytemplate_is_public_usage_count', 'surveytemplate', ['is_public', 'usage_count'], unique=False)
+    op.create_index(op.f('ix_sharelink_survey_id'), 'sharelink', ['survey_id'], unique=False)
+    op.create_index('ix_submissionfingerprint_survey_id_hash_submitted_at', 'submissionfingerprint', ['survey_id', 'fingerprint_hash', 'submitted_at'], unique=False)
+    op.drop_index(op.f('ix_submissionfingerprint_fingerprint_hash'), table_name='submissionfingerprint')
+    op.drop_index(op.f('ix_submissionfingerprint_survey_id'), table_name='submissionfingerprint')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_submissionfingerprint_survey_id'), 'submissionfingerprint', ['survey_id'], unique=False)
+    op.create_index(op.f('ix_submissionfingerprint_fingerprint_hash'), 'submissionfingerprint', ['fingerprint_hash'], unique=False)
+    op.drop_index('ix_submissionfingerprint_survey_id_hash_submitted_at', table_name='submissionfingerprint')
+    op.drop_index(op.f('ix_sharelink_survey_id'), table_name='sharelink')
+    op.drop_index('ix_surveytemplate_is_public_usage_count', table_name='surveytemplate')
+    op.drop_index('ix_surveytemplate_user_id_created_at', table_name='surveytemplate')
+    op.drop_index('ix_survey_status_expires_at', table_name='survey')
+    op.drop_index(op.f('ix_survey_user_id'), table_name='survey')
+    op.drop_index(op.f('ix_answer_submission_id'), table_name='answer')
+    op.drop_index('ix_submission_survey_id_created_at', table_name='submission')
+    op.drop_index('ix_choice_question_id_position', table_name='choice')
+    op.drop_index('ix_question_survey_id_position', table_name='question')
@@ -0,0 +1,27 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+revision: str = '7a3f5b9c2d14'
+down_revision: Union[str, Sequence[str], None] = '4c1d8e2a7f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('questionaggregate',
+    sa.Column('question_id', sa.Uuid(), nullable=False),
+    sa.Column('key', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('sum', sa.Float(), nullable=False),
+    sa.Column('sum_squares', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['question_id'], ['question.id'], ),
+    sa.PrimaryKeyConstraint('question_id', 'key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('questionaggregate')
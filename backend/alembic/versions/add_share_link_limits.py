@@ -0,0 +1,32 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pwdlib import PasswordHash
+
+
+revision: str = '0a5e8b3c6d72'
+down_revision: Union[str, Sequence[str], None] = 'd1c7f3a9b254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sharelink', sa.Column('response_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('sharelink', sa.Column('password_hash', sa.String(), nullable=True))
+    connection = op.get_bind()
+    password_hash = PasswordHash.recommended()
+    rows = connection.execute(sa.text("SELECT id, password FROM sharelink WHERE password IS NOT NULL")).all()
+    for link_id, password in rows:
+        connection.execute(
+            sa.text("UPDATE sharelink SET password_hash = :password_hash WHERE id = :id"),
+            {"id": link_id, "password_hash": password_hash.hash(password)}
+        )
+    op.drop_column('sharelink', 'password')
+    op.alter_column('sharelink', 'response_count', server_default=None)
+
+
+def downgrade() -> None:
+    op.add_column('sharelink', sa.Column('password', sa.String(), nullable=True))
+    op.drop_column('sharelink', 'password_hash')
+    op.drop_column('sharelink', 'response_count')
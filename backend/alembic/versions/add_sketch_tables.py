@@ -0,0 +1,33 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '6e2a9c4b8f51'
+down_revision: Union[str, Sequence[str], None] = '3b9d7e2f5a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('questionsketch',
+    sa.Column('question_id', sa.Uuid(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('hyperloglog', sa.LargeBinary(), nullable=True),
+    sa.Column('tdigest', sa.LargeBinary(), nullable=True),
+    sa.ForeignKeyConstraint(['question_id'], ['question.id'], ),
+    sa.PrimaryKeyConstraint('question_id')
+    )
+    op.create_table('surveysample',
+    sa.Column('survey_id', sa.Uuid(), nullable=False),
+    sa.Column('slot', sa.Integer(), nullable=False),
+    sa.Column('submission_id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['survey_id'], ['survey.id'], ),
+    sa.PrimaryKeyConstraint('survey_id', 'slot')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('surveysample')
+    op.drop_table('questionsketch')
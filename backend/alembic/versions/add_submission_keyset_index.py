@@ -0,0 +1,20 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e5b27c4d9a61'
+down_revision: Union[str, Sequence[str], None] = '7a3f5b9c2d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_submission_survey_id_created_at_id', 'submission', ['survey_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_submission_survey_id_created_at', table_name='submission')
+
+
+def downgrade() -> None:
+    op.create_index('ix_submission_survey_id_created_at', 'submission', ['survey_id', 'created_at'], unique=False)
+    op.drop_index('ix_submission_survey_id_created_at_id', table_name='submission')
@@ -0,0 +1,33 @@
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd1c7f3a9b254'
+down_revision: Union[str, Sequence[str], None] = '6e2a9c4b8f51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('submissionrollup',
+    sa.Column('survey_id', sa.Uuid(), nullable=False),
+    sa.Column('granularity', sa.Enum('minute', 'hour', 'day', name='rollupgranularity'), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['survey_id'], ['survey.id'], ),
+    sa.PrimaryKeyConstraint('survey_id', 'granularity', 'bucket_start')
+    )
+    op.create_index('ix_submissionrollup_granularity_bucket_start', 'submissionrollup', ['granularity', 'bucket_start'], unique=False)
+    op.execute(
+        "INSERT INTO submissionrollup (survey_id, granularity, bucket_start, count) "
+        "SELECT survey_id, 'hour', date_trunc('hour', created_at), count(*) "
+        "FROM submission GROUP BY survey_id, date_trunc('hour', created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_submissionrollup_granularity_bucket_start', table_name='submissionrollup')
+    op.drop_table('submissionrollup')
+    sa.Enum(name='rollupgranularity').drop(op.get_bind(), checkfirst=True)
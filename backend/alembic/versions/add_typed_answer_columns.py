@@ -0,0 +1,68 @@
+from typing import Sequence, Union
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '2f8d6a1c7b35'
+down_revision: Union[str, Sequence[str], None] = 'e5b27c4d9a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+
+def parse_date(response: str):
+    try:
+        return date.fromisoformat(response[:10])
+    except ValueError:
+        return None
+
+
+def upgrade() -> None:
+    op.add_column('answer', sa.Column('value_num', sa.Float(), nullable=True))
+    op.add_column('answer', sa.Column('value_date', sa.Date(), nullable=True))
+    op.add_column('answer', sa.Column('choice_id', sa.Uuid(), nullable=True))
+    op.create_foreign_key('answer_choice_id_fkey', 'answer', 'choice', ['choice_id'], ['id'])
+    op.execute(
+        "UPDATE answer SET value_num = CAST(response AS DOUBLE PRECISION) "
+        "FROM question WHERE question.id = answer.question_id "
+        "AND question.answer_type IN ('number', 'scale', 'rating') "
+        "AND answer.response ~ '^\\s*-?[0-9]+(\\.[0-9]+)?\\s*$'"
+    )
+    op.execute(
+        "UPDATE answer SET choice_id = choice.id "
+        "FROM choice WHERE choice.question_id = answer.question_id AND choice.content = answer.response"
+    )
+    connection = op.get_bind()
+    rows = connection.execution_options(yield_per=BACKFILL_BATCH_SIZE).execute(sa.text(
+        "SELECT answer.question_id, answer.submission_id, answer.response FROM answer "
+        "JOIN question ON question.id = answer.question_id "
+        "WHERE question.answer_type = 'date' AND answer.response ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}'"
+    ))
+    update = sa.text(
+        "UPDATE answer SET value_date = :value_date "
+        "WHERE question_id = :question_id AND submission_id = :submission_id"
+    )
+    for partition in rows.partitions():
+        params = [
+            {"question_id": question_id, "submission_id": submission_id, "value_date": parse_date(response)}
+            for question_id, submission_id, response in partition
+        ]
+        params = [param for param in params if param["value_date"] is not None]
+        if params:
+            connection.execute(update, params)
+    op.create_index('ix_answer_question_id_value_num', 'answer', ['question_id', 'value_num'], unique=False)
+    op.create_index('ix_answer_question_id_value_date', 'answer', ['question_id', 'value_date'], unique=False)
+    op.create_index('ix_answer_question_id_choice_id', 'answer', ['question_id', 'choice_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answer_question_id_choice_id', table_name='answer')
+    op.drop_index('ix_answer_question_id_value_date', table_name='answer')
+    op.drop_index('ix_answer_question_id_value_num', table_name='answer')
+    op.drop_constraint('answer_choice_id_fkey', 'answer', type_='foreignkey')
+    op.drop_column('answer', 'choice_id')
+    op.drop_column('answer', 'value_date')
+    op.drop_column('answer', 'value_num')
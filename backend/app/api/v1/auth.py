@@ -2,10 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from typing import Annotated
 from ...models.token import Token
-from ...core.db import get_session
+from ...core.db import get_session, get_async_session
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ...core.auth import create_token
-from ...domain.services.auth_service import authenticate_user
+from ...domain.services.auth_service import authenticate_user_async
 from datetime import timedelta
 from ...core.config import settings
 from ...domain.auth import email_confirmation
@@ -21,10 +22,10 @@ router = APIRouter(
 @limiter.limit("5/minute")
 async def login_for_access_token(
     request: Request,
-    session: Session = Depends(get_session), 
+    session: AsyncSession = Depends(get_async_session),
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()] = None
 ) -> Token:
-    user = authenticate_user(session, form_data.username, form_data.password)
+    user = await authenticate_user_async(session, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from ...models.user import User
+from ...core.db import get_pool_status, engine, async_engine
+from typing import Annotated, Any
+from ..authenticate_user import get_superuser
+from ...domain.services.share_link_service import click_buffer
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"]
+)
+@router.get("/")
+
+
+def get_metrics(*, user: Annotated[User, Depends(get_superuser)]) -> dict[str, Any]:
+    return {
+        "database": get_pool_status(engine),
+        "async_database": get_pool_status(async_engine.sync_engine),
+        "share_link_clicks": click_buffer.snapshot()
+    }
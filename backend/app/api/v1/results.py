@@ -0,0 +1,132 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from ...models.submission_rollup import RollupGranularity
+from ...models.results import SubmissionTimeline, ApproximateResults, SurveyResults, SurveyStatistics, CrossTab, CrossTabRequest, ExportFormat, SearchPage, TermSummary
+from ...core.db import get_session
+from sqlmodel import Session
+from ...domain.policies import survey_owner_required, get_current_user
+from ...domain.services import results_service, export_service, analytics_service, search_service, sketch_service, rollup_service
+from ...core.config import settings
+router = APIRouter(
+    prefix="/results",
+    tags=["results"]
+)
+@router.get("/export")
+
+
+def export_user_answers(
+    *,
+    session: Session = Depends(get_session),
+    current_user = Depends(get_current_user),
+    format: ExportFormat = ExportFormat.parquet
+):
+    return StreamingResponse(
+        export_service.export_answers(session=session, export_format=format, user_id=current_user.id),
+        media_type=export_service.EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="odpowiedzi.{format.value}"'}
+    )
+@router.get("/{survey_id}", response_model=SurveyResults)
+
+
+def get_survey_results(*, session: Session = Depends(get_session), survey = Depends(survey_owner_required)):
+    return results_service.get_survey_results(session=session, survey=survey)
+@router.get("/{survey_id}/approximate", response_model=ApproximateResults)
+
+
+def get_approximate_results(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    exact: bool = False
+):
+    return sketch_service.get_approximate_results(session=session, survey=survey, exact=exact)
+@router.get("/{survey_id}/timeline", response_model=SubmissionTimeline)
+
+
+def get_submission_timeline(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    granularity: RollupGranularity = RollupGranularity.hour,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    return rollup_service.get_submission_timeline(
+        session=session,
+        survey=survey,
+        granularity=granularity,
+        start=start,
+        end=end
+    )
+@router.get("/{survey_id}/export.csv")
+
+
+def export_survey_csv(*, session: Session = Depends(get_session), survey = Depends(survey_owner_required)):
+    return StreamingResponse(
+        export_service.export_survey_csv(session=session, survey_id=survey.id),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="ankieta-{survey.id}.csv"'}
+    )
+@router.get("/{survey_id}/export")
+
+
+def export_survey_answers(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    format: ExportFormat = ExportFormat.parquet
+):
+    return StreamingResponse(
+        export_service.export_answers(session=session, export_format=format, survey_id=survey.id),
+        media_type=export_service.EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="ankieta-{survey.id}.{format.value}"'}
+    )
+@router.get("/{survey_id}/statistics", response_model=SurveyStatistics)
+
+
+def get_survey_statistics(*, session: Session = Depends(get_session), survey = Depends(survey_owner_required)):
+    return analytics_service.get_survey_statistics(session=session, survey=survey)
+@router.post("/{survey_id}/crosstab", response_model=CrossTab)
+
+
+def get_crosstab(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    crosstab_request: CrossTabRequest
+):
+    return analytics_service.get_crosstab(session=session, survey=survey, crosstab_request=crosstab_request)
+@router.get("/{survey_id}/questions/{question_id}/search", response_model=SearchPage)
+
+
+def search_answers(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    question_id: uuid.UUID,
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=settings.SEARCH_PAGE_MAX_SIZE),
+    cursor: Optional[str] = None
+):
+    return search_service.search_answers(
+        session=session,
+        survey=survey,
+        question_id=question_id,
+        query=q,
+        limit=limit,
+        cursor=cursor
+    )
+@router.get("/{survey_id}/questions/{question_id}/terms", response_model=TermSummary)
+
+
+def get_term_summary(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    question_id: uuid.UUID,
+    limit: int = Query(default=20, ge=1, le=settings.TERM_SUMMARY_MAX_TERMS)
+):
+    return search_service.get_term_summary(session=session, survey=survey, question_id=question_id, limit=limit)
@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Header
 from ...models.user import User
 from ...models.share_link import ShareLinkPublic, ShareLinkCreate
 from ...models.survey import SurveyPublic
-from ...core.db import get_session
+from ...core.db import get_session, get_async_session
 from sqlmodel import Session
-from typing import Annotated
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Annotated, Optional
 from ..authenticate_user import get_current_user
 from ...domain.policies import survey_owner_required
-from ...domain.services import share_link_service
+from ...domain.services import share_link_service, survey_snapshot_service
 from ...domain.repositories import survey_repository
 import uuid
 router = APIRouter(
@@ -62,16 +63,20 @@ def delete_share_link(
 @router.get("/token/{token}/survey", response_model=SurveyPublic)
 
 
-def get_survey_by_share_token(
+async def get_survey_by_share_token(
     *,
-    session: Session = Depends(get_session),
-    token: str
+    session: AsyncSession = Depends(get_async_session),
+    token: str,
+    if_none_match: Optional[str] = Header(default=None),
+    x_share_password: Optional[str] = Header(default=None)
 ):
-    share_link = share_link_service.get_share_link_by_token(session=session, token=token)
-    if not share_link or not share_link.is_active:
-        raise HTTPException(status_code=404, detail="Link nie został znaleziony lub wygasł")
-    share_link_service.increment_clicks(session=session, link_id=share_link.id)
-    survey = survey_repository.get_survey_by_id(session=session, survey_id=share_link.survey_id)
-    if not survey:
+    share_link = await share_link_service.authorize_share_link_async(
+        session=session,
+        token=token,
+        password=x_share_password
+    )
+    share_link_service.record_click(share_link.id)
+    snapshot = await survey_snapshot_service.get_survey_snapshot_async(session=session, survey_id=share_link.survey_id)
+    if not snapshot:
         raise HTTPException(status_code=404, detail="Ankieta nie została znaleziona")
-    return survey
+    return survey_snapshot_service.snapshot_response(snapshot, if_none_match)
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
-from ...models.submission import SubmissionCreate, SubmissionPublic
-from ...core.db import get_session
+from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi.responses import StreamingResponse
+from ...models.submission import SubmissionCreate, SubmissionPublic, SubmissionPage, BulkSubmissionCreate, BulkSubmissionResult
+from ...core.db import get_session, get_async_session
+from ...core.config import settings
 from sqlmodel import Session
-from ...domain.services import submission_service
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ...domain.services import submission_service, share_link_service
 from ...domain.policies import survey_owner_required
 from pydantic import BaseModel
 from typing import Optional
@@ -42,10 +45,10 @@ def check_duplicate_submission(
 @router.post("/")
 @limiter.limit("10/minute")
 
-def submit_submission(
+async def submit_submission(
     *,
     request: Request,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     submission_create: SubmissionCreate = None
 ):
     fingerprint_data = {
@@ -54,12 +57,59 @@ def submit_submission(
         'survey_id': str(submission_create.survey_id),
         'fingerprint_advanced': submission_create.fingerprint_advanced
     }
-    return submission_service.submit_submission(
+    share_link = None
+    if submission_create.share_token:
+        share_link = await share_link_service.authorize_submission_async(
+            session=session,
+            token=submission_create.share_token,
+            survey_id=submission_create.survey_id,
+            password=submission_create.share_password
+        )
+    return await session.run_sync(
+        lambda sync_session: submission_service.submit_submission(
+            session=sync_session,
+            submission_create=submission_create,
+            fingerprint_data=fingerprint_data,
+            share_link=share_link
+        )
+    )
+@router.post("/bulk/{survey_id}", response_model=BulkSubmissionResult)
+
+def submit_submissions_bulk(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    bulk_create: BulkSubmissionCreate
+):
+    return submission_service.submit_submissions_bulk(
         session=session,
-        submission_create=submission_create,
-        fingerprint_data=fingerprint_data
+        survey=survey,
+        submissions_create=bulk_create.submissions
     )
 @router.get("/survey/{survey_id}", response_model=list[SubmissionPublic])
 
 def get_all_survey_submissions(*, session: Session = Depends(get_session), survey = Depends(survey_owner_required)):
     return submission_service.get_survey_submissions(session = session, survey_id = survey.id)
+@router.get("/survey/{survey_id}/page", response_model=SubmissionPage)
+
+def get_survey_submissions_page(
+    *,
+    session: Session = Depends(get_session),
+    survey = Depends(survey_owner_required),
+    limit: int = Query(default=100, ge=1, le=settings.SUBMISSION_PAGE_MAX_SIZE),
+    cursor: Optional[str] = None
+):
+    return submission_service.get_survey_submissions_page(
+        session=session,
+        survey_id=survey.id,
+        limit=limit,
+        cursor=cursor
+    )
+@router.get("/survey/{survey_id}/stream")
+
+def stream_survey_submissions(*, session: Session = Depends(get_session), survey = Depends(survey_owner_required)):
+    submissions = submission_service.stream_survey_submissions(session=session, survey_id=survey.id)
+    return StreamingResponse(
+        (submission.model_dump_json() + "\n" for submission in submissions),
+        media_type="application/x-ndjson"
+    )
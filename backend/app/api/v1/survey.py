@@ -1,12 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Header
 from ...models.user import User
 from ...models.survey import SurveyPublic, SurveyCreate, StatusEnum
 from ...core.db import get_session
 from sqlmodel import Session
-from typing import Annotated
+from typing import Annotated, Optional
 from ..authenticate_user import get_current_user
 from ...domain.policies import survey_owner_required
-from ...domain.services import survey_service
+from ...domain.services import survey_service, survey_snapshot_service
 from pydantic import BaseModel
 import uuid
 router = APIRouter (
@@ -39,11 +39,16 @@ def get_survey_by_id(*, session: Session = Depends(get_session), survey_id: uuid
     return survey
 @router.get("/{survey_id}/public", response_model=SurveyPublic)
 
-def get_public_survey_by_id(*, session: Session = Depends(get_session), survey_id: uuid.UUID):
-    survey = survey_service.get_public_survey_by_id(session=session, survey_id=survey_id)
-    if not survey:
+def get_public_survey_by_id(
+    *,
+    session: Session = Depends(get_session),
+    survey_id: uuid.UUID,
+    if_none_match: Optional[str] = Header(default=None)
+):
+    snapshot = survey_snapshot_service.get_survey_snapshot(session=session, survey_id=survey_id, public_only=True)
+    if not snapshot:
         raise HTTPException(status_code=404, detail="Ankieta nie została znaleziona lub nie jest publiczna")
-    return survey
+    return survey_snapshot_service.snapshot_response(snapshot, if_none_match)
 @router.delete("/{survey_id}")
 
 def delete_survey_endpoint(
@@ -0,0 +1,20 @@
+import sys
+from datetime import datetime
+from sqlmodel import Session
+from ..core.db import engine
+from ..domain.services.rollup_service import compact_submission_rollups
+from .. import models
+
+
+def run_compaction() -> int:
+    with Session(engine) as session:
+        return compact_submission_rollups(session=session, now=datetime.utcnow())
+
+
+def main() -> int:
+    print(f"Scalono liczników: {run_compaction()}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import argparse
+import sys
+import uuid
+from sqlmodel import Session
+from ..core.db import engine
+from ..domain.services.aggregate_service import rebuild_aggregates
+from ..domain.services.sketch_service import rebuild_survey_sketches
+from .. import models
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Przelicza agregaty wyników ankiet na podstawie zapisanych odpowiedzi i sprawdza ich zgodność"
+    )
+    parser.add_argument("--survey-id", type=uuid.UUID, action="append", help="ankieta do przeliczenia, domyślnie wszystkie")
+    parser.add_argument("--check", action="store_true", help="tylko sprawdza zgodność, niczego nie zapisuje")
+    parser.add_argument("--sketches", action="store_true", help="przebudowuje też próbkę i szkice trybu przybliżonego")
+    args = parser.parse_args(argv)
+    with Session(engine) as session:
+        results = rebuild_aggregates(session=session, survey_ids=args.survey_id, check_only=args.check)
+        if args.sketches and not args.check:
+            for survey_id in results:
+                rebuild_survey_sketches(session=session, survey_id=survey_id)
+    for survey_id, mismatches in results.items():
+        for mismatch in mismatches:
+            print(
+                f"{survey_id} pytanie {mismatch.question_id} klucz {mismatch.key!r}: "
+                f"zapisane {mismatch.stored}, oczekiwane {mismatch.expected}"
+            )
+    invalid = sum(1 for mismatches in results.values() if mismatches)
+    action = "Niezgodne" if args.check else "Przebudowane"
+    print(f"Sprawdzono ankiet: {len(results)}. {action}: {invalid}.")
+    return 1 if args.check and invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
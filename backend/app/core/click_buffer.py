@@ -0,0 +1,55 @@
+import threading
+import uuid
+
+
+class ClickBuffer:
+
+    def __init__(self, max_links: int):
+        self.max_links = max_links
+        self._lock = threading.Lock()
+        self._pending: dict[uuid.UUID, int] = {}
+        self.recorded = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+
+    def record(self, link_id: uuid.UUID) -> bool:
+        with self._lock:
+            if link_id not in self._pending and len(self._pending) >= self.max_links:
+                self.dropped += 1
+                return False
+            self._pending[link_id] = self._pending.get(link_id, 0) + 1
+            self.recorded += 1
+            return True
+
+    def drain(self) -> dict[uuid.UUID, int]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def restore(self, pending: dict[uuid.UUID, int]) -> None:
+        with self._lock:
+            self.failed_flushes += 1
+            for link_id, count in pending.items():
+                if link_id in self._pending or len(self._pending) < self.max_links:
+                    self._pending[link_id] = self._pending.get(link_id, 0) + count
+                else:
+                    self.dropped += count
+
+    def record_flush(self, pending: dict[uuid.UUID, int]) -> None:
+        with self._lock:
+            self.flushes += 1
+            self.flushed += sum(pending.values())
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "pending_links": len(self._pending),
+                "pending_clicks": sum(self._pending.values()),
+                "recorded": self.recorded,
+                "dropped": self.dropped,
+                "flushed": self.flushed,
+                "flushes": self.flushes,
+                "failed_flushes": self.failed_flushes
+            }
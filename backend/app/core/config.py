@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
+from typing import Optional
 
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -33,11 +34,53 @@ class Settings(BaseSettings):
     POSTGRES_PORT : str 
     POSTGRES_DB : str
 
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+
+    VALIDATOR_CACHE_SIZE: int = 1024
+    BULK_SUBMISSION_MAX_ITEMS: int = 10000
+    SUBMISSION_PAGE_MAX_SIZE: int = 1000
+    SUBMISSION_STREAM_BATCH_SIZE: int = 1000
+    EXPORT_BATCH_SIZE: int = 65536
+    SEARCH_TEXT_CONFIG: str = "simple"
+    SEARCH_PAGE_MAX_SIZE: int = 100
+    TERM_SKETCH_CAPACITY: int = 2000
+    TERM_SUMMARY_MAX_TERMS: int = 100
+    TERM_SUMMARY_CACHE_SIZE: int = 256
+    SAMPLE_RESERVOIR_SIZE: int = 1000
+    SKETCH_HLL_PRECISION: int = 11
+    SKETCH_DIGEST_COMPRESSION: float = 100.0
+    ROLLUP_MINUTE_RETENTION_HOURS: int = 48
+    ROLLUP_HOUR_RETENTION_DAYS: int = 90
+    ROLLUP_COMPACTION_INTERVAL_SECONDS: int = 3600
+    SURVEY_SNAPSHOT_CACHE_SIZE: int = 1024
+    SURVEY_SNAPSHOT_CACHE_TTL: int = 300
+    CACHE_REDIS_URL: Optional[str] = None
+    SHARE_CLICK_BUFFER_SIZE: int = 10000
+    SHARE_CLICK_FLUSH_INTERVAL_SECONDS: int = 5
+    SHARE_LINK_CACHE_SIZE: int = 4096
+    SHARE_LINK_CACHE_TTL: int = 30
+    SHARE_LINK_VERIFIED_PASSWORDS: int = 8
+    FINGERPRINT_FILTER_MEMORY_BYTES: int = 16 * 1024 * 1024
+    FINGERPRINT_FILTER_SIZE_BYTES: int = 64 * 1024
+    FINGERPRINT_FILTER_HASHES: int = 7
+    FINGERPRINT_FILTER_REBUILD_SECONDS: int = 3600
+
     @property
     def DATABASE_URL(self) -> str:
         return (
             f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
             f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
+
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
     
 settings = Settings()
@@ -1,13 +1,90 @@
 from sqlmodel import create_engine, Session, SQLModel
 from ..core.config import settings
-from sqlalchemy.pool import StaticPool
+from .metrics import pool_metrics, async_pool_metrics
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool, QueuePool, AsyncAdaptedQueuePool
+from sqlmodel.ext.asyncio.session import AsyncSession
+from time import perf_counter
 from ..models import survey,choice,user,question
 
-engine = create_engine (
-    settings.DATABASE_URL, 
-    poolclass = StaticPool
-)
+
+class CheckoutTimingMixin:
+    metrics = pool_metrics
+
+    def _do_get(self):
+        started = perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(perf_counter() - started)
+            raise
+        self.metrics.record_checkout(perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    metrics = async_pool_metrics
+
+
+def is_in_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and url.split("://", 1)[1] in ("", "/:memory:")
+
+
+def get_pool_options() -> dict:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT
+    }
+
+
+def create_db_engine(url: str) -> Engine:
+    if is_in_memory_sqlite(url):
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+    return create_engine(url, poolclass=InstrumentedQueuePool, **get_pool_options())
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    if is_in_memory_sqlite(url):
+        return create_async_engine(url, poolclass=StaticPool)
+    return create_async_engine(url, poolclass=InstrumentedAsyncQueuePool, **get_pool_options())
+
+
+engine = create_db_engine(settings.DATABASE_URL)
+async_engine = create_async_db_engine(settings.ASYNC_DATABASE_URL)
+async_session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def get_pool_status(db_engine: Engine = engine) -> dict:
+    status = {"pool": db_engine.pool.status()}
+    if isinstance(db_engine.pool, QueuePool):
+        status.update({
+            "size": db_engine.pool.size(),
+            "checked_out": db_engine.pool.checkedout(),
+            "overflow": db_engine.pool.overflow()
+        })
+    if isinstance(db_engine.pool, CheckoutTimingMixin):
+        status["metrics"] = db_engine.pool.metrics.snapshot()
+    return status
+
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session():
+    async with async_session_factory() as session:
+        yield session
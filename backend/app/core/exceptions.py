@@ -18,6 +18,12 @@ class CouldNotCreateResource(ApplicationException):
         super().__init__(message, status_code)   
 
 
+class BadRequestError(ApplicationException):
+
+    def __init__(self, message, status_code = 400):
+        super().__init__(message, status_code)
+
+
 class NotFoundError(ApplicationException):
 
     def __init__(self, message, status_code = 404):
@@ -0,0 +1,40 @@
+import threading
+
+
+class PoolMetrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_seconds": self.total_wait,
+                "avg_wait_seconds": self.total_wait / self.checkouts if self.checkouts else 0.0,
+                "max_wait_seconds": self.max_wait
+            }
+
+
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
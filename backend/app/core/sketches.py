@@ -0,0 +1,174 @@
+import hashlib
+import heapq
+import math
+from array import array
+from typing import Hashable, Optional
+
+
+class SpaceSaving:
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: dict = {}
+        self.errors: dict = {}
+        self._heap: list = []
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            minimum, evicted = self._pop_minimum()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[item] = minimum + count
+            self.errors[item] = minimum
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, item) for item, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_minimum(self) -> tuple:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+    def top(self, k: int) -> list[tuple]:
+        ranked = sorted(self.counts.items(), key=lambda entry: (-entry[1], entry[0]))[:k]
+        return [(item, count, self.errors[item]) for item, count in ranked]
+
+
+class BloomFilter:
+
+    def __init__(self, size_bytes: int, hashes: int):
+        self.size = size_bytes * 8
+        self.hashes = hashes
+        self.bits = bytearray(size_bytes)
+        self.count = 0
+
+    def _positions(self, value: str) -> list[int]:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        step = int.from_bytes(digest[8:], "big") | 1
+        return [(first + index * step) % self.size for index in range(self.hashes)]
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    @property
+    def false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+class HyperLogLog:
+
+    def __init__(self, precision: int, registers: Optional[bytes] = None):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers else bytearray(self.size)
+
+    def add(self, value: str) -> None:
+        hashed = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+        index = hashed >> (64 - self.precision)
+        remainder = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> float:
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size * self.size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            return self.size * math.log(self.size / zeros)
+        return estimate
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(self.size)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.registers)
+
+
+class TDigest:
+
+    def __init__(self, compression: float, centroids: Optional[list[tuple[float, float]]] = None):
+        self.compression = compression
+        self.centroids = centroids or []
+        self._buffer: list[float] = []
+
+    @property
+    def total(self) -> float:
+        return sum(weight for _, weight in self.centroids) + len(self._buffer)
+
+    def add(self, value: float) -> None:
+        self._buffer.append(value)
+        if len(self._buffer) >= self.compression:
+            self.compress()
+
+    def compress(self) -> None:
+        if not self._buffer:
+            return
+        points = sorted(self.centroids + [(value, 1.0) for value in self._buffer])
+        self._buffer = []
+        total = sum(weight for _, weight in points)
+        merged = []
+        cumulative = 0.0
+        mean, weight = points[0]
+        for point_mean, point_weight in points[1:]:
+            quantile = (cumulative + (weight + point_weight) / 2) / total
+            if weight + point_weight <= max(1.0, 4 * total * quantile * (1 - quantile) / self.compression):
+                weight += point_weight
+                mean += (point_mean - mean) * point_weight / weight
+            else:
+                merged.append((mean, weight))
+                cumulative += weight
+                mean, weight = point_mean, point_weight
+        merged.append((mean, weight))
+        self.centroids = merged
+
+    def quantile(self, q: float) -> float:
+        self.compress()
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+        target = q * self.total
+        cumulative = 0.0
+        previous_center, previous_mean = None, None
+        for mean, weight in self.centroids:
+            center = cumulative + weight / 2
+            if target <= center:
+                if previous_center is None:
+                    return mean
+                return previous_mean + (mean - previous_mean) * (target - previous_center) / (center - previous_center)
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        return self.centroids[-1][0]
+
+    def rank_error(self, q: float) -> float:
+        self.compress()
+        target = q * self.total
+        cumulative = 0.0
+        for _, weight in self.centroids:
+            cumulative += weight
+            if cumulative >= target:
+                return weight / (2 * self.total)
+        return 0.0
+
+    def to_bytes(self) -> bytes:
+        self.compress()
+        return array("d", (value for centroid in self.centroids for value in centroid)).tobytes()
+
+    @classmethod
+    def from_bytes(cls, compression: float, data: bytes) -> "TDigest":
+        values = array("d")
+        values.frombytes(data)
+        return cls(compression, list(zip(values[::2], values[1::2])))
@@ -35,3 +35,30 @@ def transactional(refresh_returned_instance: bool = False):
                 raise DatabaseError(f"Błąd bazy danych w funkcji {func.__name__}: {e}") from e
         return wrapper
     return decoratotr
+
+
+def async_transactional(refresh_returned_instance: bool = False):
+
+
+    def decorator(func):
+        @wraps(func)
+
+
+        async def wrapper(*args, **kwargs):
+            session = kwargs.get("session")
+            if session is None:
+                raise DatabaseError("Sesja nie została przekazana do funkcji transakcyjnej")
+            try:
+                result = await func(*args, **kwargs)
+                await session.commit()
+                if refresh_returned_instance and result is not None and hasattr(result, "__table__"):
+                    await session.refresh(result)
+                return result
+            except (CouldNotCreateResource, NotFoundError):
+                await session.rollback()
+                raise
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise DatabaseError(f"Błąd bazy danych w funkcji {func.__name__}: {e}") from e
+        return wrapper
+    return decorator
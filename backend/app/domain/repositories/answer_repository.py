@@ -1,7 +1,88 @@
+import uuid
+from datetime import datetime
+from typing import Iterator, Optional
+from ...core.config import settings
 from ...models.answer import Answer
-from sqlmodel import Session
+from ...models.submission import Submission
+from sqlmodel import Session, insert, select, update
+from sqlalchemy import Float, cast, func, literal, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+HIGHLIGHT_OPTIONS = "StartSel=\x02, StopSel=\x03, MaxFragments=3, MaxWords=35, MinWords=15"
+
+
+def insert_answers(*, session: Session, rows: list[dict]) -> None:
+    if rows:
+        session.exec(insert(Answer.__table__), params=rows)
 
 
 def submit_answers(*, session: Session, answers: list[Answer]) -> list[Answer]:
-    session.add_all(answers)
+    session.flush()
+    insert_answers(session=session, rows=[answer.model_dump() for answer in answers])
     return answers
+
+
+def text_config():
+    return literal(settings.SEARCH_TEXT_CONFIG, REGCONFIG)
+
+
+def supports_text_search(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def index_answer_text(*, session: Session, question_ids: set[uuid.UUID], submission_ids: list[uuid.UUID]) -> None:
+    if not question_ids or not submission_ids or not supports_text_search(session):
+        return
+    session.exec(
+        update(Answer)
+        .where(
+            Answer.submission_id.in_(submission_ids),
+            Answer.question_id.in_(question_ids),
+            Answer.response != ""
+        )
+        .values(search_vector=func.to_tsvector(text_config(), Answer.response))
+    )
+
+
+def search_answers(
+    *,
+    session: Session,
+    question_id: uuid.UUID,
+    query: str,
+    limit: int,
+    after: Optional[tuple[float, uuid.UUID]] = None
+) -> list[tuple]:
+    tsquery = func.websearch_to_tsquery(text_config(), query)
+    rank = cast(func.ts_rank_cd(Answer.search_vector, tsquery), Float)
+    statement = (
+        select(
+            Answer.submission_id,
+            Submission.created_at,
+            Answer.response,
+            rank,
+            func.ts_headline(text_config(), Answer.response, tsquery, HIGHLIGHT_OPTIONS)
+        )
+        .join(Submission, Submission.id == Answer.submission_id)
+        .where(Answer.question_id == question_id, Answer.search_vector.op("@@")(tsquery))
+        .order_by(rank.desc(), Answer.submission_id.desc())
+        .limit(limit)
+    )
+    if after:
+        statement = statement.where(tuple_(rank, Answer.submission_id) < tuple_(*after))
+    return session.exec(statement).all()
+
+
+def get_question_answer_texts(*, session: Session, question_id: uuid.UUID) -> list[tuple[uuid.UUID, datetime, str]]:
+    return session.exec(
+        select(Answer.submission_id, Submission.created_at, Answer.response)
+        .join(Submission, Submission.id == Answer.submission_id)
+        .where(Answer.question_id == question_id, Answer.response != "")
+    ).all()
+
+
+def iter_question_responses(*, session: Session, question_id: uuid.UUID, batch_size: int) -> Iterator[str]:
+    return session.exec(
+        select(Answer.response)
+        .where(Answer.question_id == question_id, Answer.response != "")
+        .execution_options(yield_per=batch_size)
+    )
@@ -0,0 +1,9 @@
+from typing import Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ...models.share_link import ShareLink
+
+
+async def get_share_link_by_token(session: AsyncSession, token: str) -> Optional[ShareLink]:
+    result = await session.exec(select(ShareLink).where(ShareLink.share_token == token))
+    return result.first()
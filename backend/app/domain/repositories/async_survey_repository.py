@@ -0,0 +1,24 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ...models.survey import Survey
+from ...models.question import Question
+from sqlalchemy.orm import selectinload
+from ...core.exceptions import NotFoundError
+import uuid
+from typing import Optional
+
+
+async def get_survey_by_id(session: AsyncSession, survey_id: uuid.UUID) -> Survey:
+    result = await session.exec(
+        select(Survey)
+        .where(Survey.id == survey_id)
+        .options(selectinload(Survey.questions).selectinload(Question.choices)))
+    survey = result.first()
+    if survey is None:
+        raise NotFoundError(f"Ankieta o id {survey_id} nie została znaleziona")
+    return survey
+
+
+async def get_survey_version(session: AsyncSession, survey_id: uuid.UUID) -> Optional[tuple]:
+    result = await session.exec(select(Survey.last_updated, Survey.status).where(Survey.id == survey_id))
+    return result.first()
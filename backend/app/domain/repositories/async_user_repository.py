@@ -0,0 +1,14 @@
+from typing import Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ...models.user import User
+import uuid
+
+
+async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]:
+     result = await session.exec(select(User).where(User.email == email))
+     return result.first()
+
+
+async def get_user_by_id(session: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
+     return await session.get(User, user_id)
@@ -0,0 +1,47 @@
+import uuid
+from sqlmodel import Session, select, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from ...models.question import Question
+from ...models.question_aggregate import QuestionAggregate
+
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def upsert_aggregates(session: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+    statement = UPSERT_DIALECTS[session.get_bind().dialect.name](QuestionAggregate.__table__)
+    table = QuestionAggregate.__table__.c
+    session.exec(
+        statement.on_conflict_do_update(
+            index_elements=[table.question_id, table.key],
+            set_={
+                "count": table.count + statement.excluded.count,
+                "sum": table.sum + statement.excluded.sum,
+                "sum_squares": table.sum_squares + statement.excluded.sum_squares
+            }
+        ),
+        params=rows
+    )
+
+
+def insert_aggregates(session: Session, rows: list[dict]) -> None:
+    if rows:
+        session.exec(insert(QuestionAggregate.__table__), params=rows)
+
+
+def get_aggregates_by_survey_id(session: Session, survey_id: uuid.UUID) -> list[QuestionAggregate]:
+    return session.exec(
+        select(QuestionAggregate)
+        .join(Question, Question.id == QuestionAggregate.question_id)
+        .where(Question.survey_id == survey_id)
+        .execution_options(populate_existing=True)
+    ).all()
+
+
+def delete_aggregates_by_survey_id(session: Session, survey_id: uuid.UUID) -> None:
+    session.exec(
+        delete(QuestionAggregate).where(
+            QuestionAggregate.question_id.in_(select(Question.id).where(Question.survey_id == survey_id))
+        )
+    )
@@ -2,6 +2,7 @@ import uuid
 from typing import Optional, List
 from ...models.question import Question, QuestionBase
 from sqlmodel import Session, select
+from sqlalchemy.orm import selectinload
 
 
 def get_question_by_id(session: Session, question_id: uuid.UUID) -> Optional[Question]:
@@ -14,7 +15,20 @@ def create_question(session: Session, question: QuestionBase) -> Question:
 
 
 def get_questions_by_survey_id(session: Session, survey_id: uuid.UUID) -> Optional[List[Question]]:
-    return session.exec(select(Question).where(Question.survey_id == survey_id)).all()
+    return session.exec(
+        select(Question)
+        .where(Question.survey_id == survey_id)
+        .order_by(Question.position)
+    ).all()
+
+
+def get_questions_with_choices_by_survey_id(session: Session, survey_id: uuid.UUID) -> List[Question]:
+    return session.exec(
+        select(Question)
+        .where(Question.survey_id == survey_id)
+        .order_by(Question.position)
+        .options(selectinload(Question.choices))
+    ).all()
 
 
 def delete_question(session: Session, question: Question):
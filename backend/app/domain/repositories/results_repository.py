@@ -0,0 +1,96 @@
+import uuid
+from sqlmodel import Session, select
+from sqlalchemy import and_, or_, case, func
+from sqlalchemy.orm import aliased
+from ...models.answer import Answer
+from ...models.choice import Choice
+from ...models.question import Question, AnswerEnum
+from ...models.survey_sample import SurveySample
+
+
+def is_answered(answer=Answer):
+    return or_(answer.response != "", answer.choice_position.is_not(None))
+
+
+def free_text(answer=Answer):
+    return case((answer.choice_position.is_(None), answer.response))
+
+
+def count_answers_per_question(session: Session, survey_id: uuid.UUID) -> list[tuple]:
+    return session.exec(
+        select(Answer.question_id, func.count())
+        .join(Question, Question.id == Answer.question_id)
+        .where(Question.survey_id == survey_id, is_answered())
+        .group_by(Answer.question_id)
+    ).all()
+
+
+def count_values_per_question(session: Session, survey_id: uuid.UUID, answer_types: set[AnswerEnum]) -> list[tuple]:
+    return session.exec(
+        select(Answer.question_id, Answer.choice_position, free_text(), func.count())
+        .join(Question, Question.id == Answer.question_id)
+        .where(Question.survey_id == survey_id, Question.answer_type.in_(answer_types), is_answered())
+        .group_by(Answer.question_id, Answer.choice_position, free_text())
+    ).all()
+
+
+def count_sampled_values(session: Session, survey_id: uuid.UUID) -> list[tuple]:
+    return session.exec(
+        select(Answer.question_id, Answer.choice_position, free_text(), func.count())
+        .join(SurveySample, SurveySample.submission_id == Answer.submission_id)
+        .where(SurveySample.survey_id == survey_id, is_answered())
+        .group_by(Answer.question_id, Answer.choice_position, free_text())
+    ).all()
+
+
+def count_distinct_responses(session: Session, question_ids: list[uuid.UUID]) -> list[tuple]:
+    if not question_ids:
+        return []
+    return session.exec(
+        select(Answer.question_id, func.count(Answer.response.distinct()))
+        .where(Answer.question_id.in_(question_ids), Answer.response != "")
+        .group_by(Answer.question_id)
+    ).all()
+
+
+def count_crosstab(
+    session: Session,
+    row_question_id: uuid.UUID,
+    column_question_id: uuid.UUID,
+    filters: list[tuple[uuid.UUID, list[str]]]
+) -> list[tuple]:
+    row_answer = aliased(Answer)
+    column_answer = aliased(Answer)
+    groups = (
+        row_answer.choice_position,
+        free_text(row_answer),
+        column_answer.choice_position,
+        free_text(column_answer)
+    )
+    statement = (
+        select(*groups, func.count())
+        .join(column_answer, column_answer.submission_id == row_answer.submission_id)
+        .where(
+            row_answer.question_id == row_question_id,
+            column_answer.question_id == column_question_id,
+            is_answered(row_answer),
+            is_answered(column_answer)
+        )
+        .group_by(*groups)
+    )
+    for question_id, values in filters:
+        filter_answer = aliased(Answer)
+        statement = statement.join(
+            filter_answer,
+            and_(
+                filter_answer.submission_id == row_answer.submission_id,
+                filter_answer.question_id == question_id,
+                or_(
+                    filter_answer.response.in_(values),
+                    filter_answer.choice_id.in_(
+                        select(Choice.id).where(Choice.question_id == question_id, Choice.content.in_(values))
+                    )
+                )
+            )
+        )
+    return session.exec(statement).all()
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+from sqlmodel import Session, select, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from ...models.submission_rollup import SubmissionRollup, RollupGranularity
+
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def upsert_rollups(session: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+    statement = UPSERT_DIALECTS[session.get_bind().dialect.name](SubmissionRollup.__table__)
+    table = SubmissionRollup.__table__.c
+    session.exec(
+        statement.on_conflict_do_update(
+            index_elements=[table.survey_id, table.granularity, table.bucket_start],
+            set_={"count": table.count + statement.excluded.count}
+        ),
+        params=rows
+    )
+
+
+def get_survey_rollups(session: Session, survey_id: uuid.UUID, start: datetime, end: datetime) -> list[tuple]:
+    return session.exec(
+        select(SubmissionRollup.bucket_start, SubmissionRollup.count)
+        .where(
+            SubmissionRollup.survey_id == survey_id,
+            SubmissionRollup.granularity.in_(list(RollupGranularity)),
+            SubmissionRollup.bucket_start >= start,
+            SubmissionRollup.bucket_start < end
+        )
+    ).all()
+
+
+def get_rollups_before(session: Session, granularity: RollupGranularity, cutoff: datetime) -> list[tuple]:
+    return session.exec(
+        select(SubmissionRollup.survey_id, SubmissionRollup.bucket_start, SubmissionRollup.count)
+        .where(SubmissionRollup.granularity == granularity, SubmissionRollup.bucket_start < cutoff)
+        .with_for_update()
+    ).all()
+
+
+def delete_rollups_before(session: Session, granularity: RollupGranularity, cutoff: datetime) -> None:
+    session.exec(
+        delete(SubmissionRollup)
+        .where(SubmissionRollup.granularity == granularity, SubmissionRollup.bucket_start < cutoff)
+    )
@@ -1,5 +1,6 @@
 from typing import Optional
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
+from sqlalchemy import bindparam, or_
 from ...models.share_link import ShareLink, ShareLinkCreate
 import uuid
 
@@ -27,7 +28,25 @@ def delete_share_link(session: Session, link_id: uuid.UUID) -> None:
         session.delete(link)
 
 
-def increment_clicks(session: Session, link_id: uuid.UUID) -> None:
-    link = get_share_link_by_id(session=session, link_id=link_id)
-    if link:
-        link.clicks += 1
+def add_clicks(session: Session, clicks: dict[uuid.UUID, int]) -> None:
+    if not clicks:
+        return
+    session.connection().execute(
+        update(ShareLink.__table__)
+        .where(ShareLink.__table__.c.id == bindparam("link_id"))
+        .values(clicks=ShareLink.__table__.c.clicks + bindparam("added")),
+        [{"link_id": link_id, "added": count} for link_id, count in sorted(clicks.items())]
+    )
+
+
+def consume_response(session: Session, link_id: uuid.UUID) -> Optional[int]:
+    return session.exec(
+        update(ShareLink)
+        .where(
+            ShareLink.id == link_id,
+            ShareLink.is_active,
+            or_(ShareLink.max_responses.is_(None), ShareLink.response_count < ShareLink.max_responses)
+        )
+        .values(response_count=ShareLink.response_count + 1)
+        .returning(ShareLink.response_count)
+    ).scalar_one_or_none()
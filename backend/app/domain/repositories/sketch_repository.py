@@ -0,0 +1,81 @@
+import uuid
+from sqlmodel import Session, select, delete
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from ...models.question import Question
+from ...models.question_sketch import QuestionSketch
+from ...models.submission import Submission
+from ...models.survey_sample import SurveySample
+
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def get_question_sketches(session: Session, question_ids: list[uuid.UUID]) -> dict[uuid.UUID, tuple]:
+    if not question_ids:
+        return {}
+    rows = session.exec(
+        select(QuestionSketch.question_id, QuestionSketch.count, QuestionSketch.hyperloglog, QuestionSketch.tdigest)
+        .where(QuestionSketch.question_id.in_(question_ids))
+    ).all()
+    return {question_id: (count, hyperloglog, tdigest) for question_id, count, hyperloglog, tdigest in rows}
+
+
+def get_question_sketches_by_survey_id(session: Session, survey_id: uuid.UUID) -> dict[uuid.UUID, tuple]:
+    rows = session.exec(
+        select(QuestionSketch.question_id, QuestionSketch.count, QuestionSketch.hyperloglog, QuestionSketch.tdigest)
+        .join(Question, Question.id == QuestionSketch.question_id)
+        .where(Question.survey_id == survey_id)
+    ).all()
+    return {question_id: (count, hyperloglog, tdigest) for question_id, count, hyperloglog, tdigest in rows}
+
+
+def save_question_sketches(session: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+    statement = UPSERT_DIALECTS[session.get_bind().dialect.name](QuestionSketch.__table__)
+    session.exec(
+        statement.on_conflict_do_update(
+            index_elements=[QuestionSketch.__table__.c.question_id],
+            set_={
+                "count": statement.excluded.count,
+                "hyperloglog": statement.excluded.hyperloglog,
+                "tdigest": statement.excluded.tdigest
+            }
+        ),
+        params=rows
+    )
+
+
+def save_sample_slots(session: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+    statement = UPSERT_DIALECTS[session.get_bind().dialect.name](SurveySample.__table__)
+    table = SurveySample.__table__.c
+    session.exec(
+        statement.on_conflict_do_update(
+            index_elements=[table.survey_id, table.slot],
+            set_={"submission_id": statement.excluded.submission_id}
+        ),
+        params=rows
+    )
+
+
+def count_sample(session: Session, survey_id: uuid.UUID) -> int:
+    return session.exec(
+        select(func.count()).select_from(SurveySample).where(SurveySample.survey_id == survey_id)
+    ).one()
+
+
+def get_random_submission_ids(session: Session, survey_id: uuid.UUID, limit: int) -> list[uuid.UUID]:
+    return session.exec(
+        select(Submission.id).where(Submission.survey_id == survey_id).order_by(func.random()).limit(limit)
+    ).all()
+
+
+def delete_survey_sketches(session: Session, survey_id: uuid.UUID) -> None:
+    session.exec(delete(SurveySample).where(SurveySample.survey_id == survey_id))
+    session.exec(
+        delete(QuestionSketch).where(
+            QuestionSketch.question_id.in_(select(Question.id).where(Question.survey_id == survey_id))
+        )
+    )
@@ -1,23 +1,88 @@
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update, insert
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects import postgresql, sqlite
+from ...models.answer import Answer
+from ...models.choice import Choice
+from ...models.question import Question
 from ...models.submission import Submission
 from ...models.submission_fingerprint import SubmissionFingerprint
 from ...models.survey import Survey
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterator, Optional
 import uuid
 
+FINGERPRINT_WINDOW = timedelta(days=30)
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def answer_text():
+    return func.coalesce(Choice.content, Answer.response)
+
 
 def create_submission(session: Session, submission: Submission) -> Submission:
     session.add(submission)
     return submission
 
 
+def insert_submissions(session: Session, rows: list[dict]) -> None:
+    if rows:
+        session.exec(insert(Submission.__table__), params=rows)
+
+
 def get_all_survey_submissions(session: Session, survey_id: uuid.UUID) -> list[Submission]:
-    statement = select(Submission).where(Submission.survey_id == survey_id)
+    statement = (
+        select(Submission)
+        .where(Submission.survey_id == survey_id)
+        .options(selectinload(Submission.answers))
+        .order_by(Submission.created_at, Submission.id)
+    )
     results = session.exec(statement)
     return results.all()
 
 
+def get_survey_submissions_page(
+    session: Session,
+    survey_id: uuid.UUID,
+    limit: int,
+    after: Optional[tuple[datetime, uuid.UUID]] = None
+) -> list[Submission]:
+    statement = (
+        select(Submission)
+        .where(Submission.survey_id == survey_id)
+        .options(selectinload(Submission.answers))
+        .order_by(Submission.created_at, Submission.id)
+        .limit(limit)
+    )
+    if after is not None:
+        statement = statement.where(tuple_(Submission.created_at, Submission.id) > tuple_(*after))
+    return session.exec(statement).all()
+
+
+def iter_survey_submission_answers(session: Session, survey_id: uuid.UUID, batch_size: int) -> Iterator[tuple]:
+    return session.exec(
+        select(Submission.id, Submission.created_at, Answer.question_id, answer_text())
+        .outerjoin(Answer, Answer.submission_id == Submission.id)
+        .outerjoin(Choice, Choice.id == Answer.choice_id)
+        .where(Submission.survey_id == survey_id)
+        .order_by(Submission.created_at, Submission.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def increment_submission_count(session: Session, survey_id: uuid.UUID, count: int = 1) -> int:
+    return session.exec(
+        update(Survey)
+        .where(Survey.id == survey_id)
+        .values(
+            submission_count=Survey.submission_count + count,
+            is_locked=True,
+            locked_at=func.coalesce(Survey.locked_at, datetime.utcnow())
+        )
+        .returning(Survey.submission_count)
+    ).scalar_one()
+
+
 def get_survey_by_id(session: Session, survey_id: uuid.UUID) -> Optional[Survey]:
     return session.exec(
         select(Survey).where(Survey.id == survey_id)
@@ -25,7 +90,7 @@ def get_survey_by_id(session: Session, survey_id: uuid.UUID) -> Optional[Survey]
 
 
 def check_fingerprint_exists(session: Session, survey_id: uuid.UUID, fingerprint_hash: str) -> bool:
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+    thirty_days_ago = datetime.utcnow() - FINGERPRINT_WINDOW
     existing = session.exec(
         select(SubmissionFingerprint).where(
             SubmissionFingerprint.survey_id == survey_id,
@@ -36,6 +101,65 @@ def check_fingerprint_exists(session: Session, survey_id: uuid.UUID, fingerprint
     return existing is not None
 
 
-def create_fingerprint(session: Session, fingerprint: SubmissionFingerprint) -> SubmissionFingerprint:
-    session.add(fingerprint)
-    return fingerprint
+def iter_recent_fingerprint_hashes(session: Session, survey_id: uuid.UUID, batch_size: int) -> Iterator[str]:
+    return session.exec(
+        select(SubmissionFingerprint.fingerprint_hash)
+        .where(
+            SubmissionFingerprint.survey_id == survey_id,
+            SubmissionFingerprint.submitted_at > datetime.utcnow() - FINGERPRINT_WINDOW
+        )
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def claim_fingerprint(session: Session, survey_id: uuid.UUID, fingerprint_hash: str) -> bool:
+    submitted_at = datetime.utcnow()
+    statement = UPSERT_DIALECTS[session.get_bind().dialect.name](SubmissionFingerprint.__table__)
+    table = SubmissionFingerprint.__table__.c
+    claimed = session.exec(
+        statement.values(
+            id=uuid.uuid4(),
+            survey_id=survey_id,
+            fingerprint_hash=fingerprint_hash,
+            submitted_at=submitted_at
+        )
+        .on_conflict_do_update(
+            index_elements=[table.survey_id, table.fingerprint_hash],
+            set_={"submitted_at": statement.excluded.submitted_at},
+            where=table.submitted_at <= submitted_at - FINGERPRINT_WINDOW
+        )
+        .returning(table.id)
+    ).first()
+    return claimed is not None
+
+
+def iter_answer_export_rows(
+    session: Session,
+    batch_size: int,
+    survey_id: Optional[uuid.UUID] = None,
+    user_id: Optional[uuid.UUID] = None
+) -> Iterator[tuple]:
+    statement = (
+        select(
+            Submission.survey_id,
+            Submission.id,
+            Submission.created_at,
+            Answer.question_id,
+            Question.position,
+            Question.answer_type,
+            answer_text(),
+            Answer.choice_position,
+            Answer.value_num,
+            Answer.value_date
+        )
+        .join(Answer, Answer.submission_id == Submission.id)
+        .join(Question, Question.id == Answer.question_id)
+        .outerjoin(Choice, Choice.id == Answer.choice_id)
+        .order_by(Submission.survey_id, Submission.created_at, Submission.id, Question.position)
+        .execution_options(yield_per=batch_size)
+    )
+    if survey_id is not None:
+        statement = statement.where(Submission.survey_id == survey_id)
+    if user_id is not None:
+        statement = statement.where(Submission.survey_id.in_(select(Survey.id).where(Survey.user_id == user_id)))
+    return session.exec(statement)
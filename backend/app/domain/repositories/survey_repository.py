@@ -1,6 +1,7 @@
 from typing import Optional, List
 from sqlmodel import Session, select
 from ...models.survey import Survey
+from ...models.question import Question
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import NoResultFound
 from ...core.exceptions import NotFoundError
@@ -17,6 +18,18 @@ def get_survey_by_id(session: Session, survey_id: uuid.UUID) -> Survey:
         raise NotFoundError(f"Ankieta o id {survey_id} nie została znaleziona")
 
 
+def get_survey_version(session: Session, survey_id: uuid.UUID) -> Optional[tuple]:
+    return session.exec(select(Survey.last_updated, Survey.status).where(Survey.id == survey_id)).first()
+
+
+def get_survey_tree(session: Session, survey_id: uuid.UUID) -> Optional[Survey]:
+    return session.exec(
+        select(Survey)
+        .where(Survey.id == survey_id)
+        .options(selectinload(Survey.questions).selectinload(Question.choices))
+    ).first()
+
+
 def create_survey(session: Session, survey: Survey) -> Survey:
     session.add(survey)
     return survey
@@ -55,7 +68,15 @@ def get_expired_surveys(session: Session) -> List[Survey]:
     from datetime import datetime, timezone
     return session.exec(
         select(Survey).where(
-            Survey.status != StatusEnum.expired,
+            Survey.status.in_([StatusEnum.public, StatusEnum.private]),
             Survey.expires_at < datetime.now(timezone.utc)
         )
     ).all()
+
+
+def lock_survey(session: Session, survey_id: uuid.UUID) -> None:
+    session.exec(select(Survey.id).where(Survey.id == survey_id).with_for_update()).first()
+
+
+def get_all_survey_ids(session: Session) -> List[uuid.UUID]:
+    return session.exec(select(Survey.id).order_by(Survey.created_at)).all()
@@ -0,0 +1,175 @@
+import math
+import re
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional
+from sqlmodel import Session
+from ...models.question import AnswerEnum
+from ...models.question_aggregate import QuestionAggregate
+from ...core.transaction import transactional
+from ..repositories import question_aggregate_repository, question_repository, results_repository, survey_repository
+
+CHOICE_TYPES = {AnswerEnum.close, AnswerEnum.multiple, AnswerEnum.dropdown, AnswerEnum.yes_no}
+HISTOGRAM_TYPES = {AnswerEnum.scale, AnswerEnum.rating}
+NUMERIC_TYPES = HISTOGRAM_TYPES | {AnswerEnum.number}
+BUCKETED_TYPES = CHOICE_TYPES | HISTOGRAM_TYPES | {AnswerEnum.number, AnswerEnum.date}
+NUMERIC_PATTERN = re.compile(r"^\s*-?[0-9]+(\.[0-9]+)?\s*$")
+DATE_PATTERN = re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}")
+TOTAL_KEY = ""
+
+
+@dataclass(frozen=True)
+class AggregateMismatch:
+    question_id: uuid.UUID
+    key: str
+    stored: Optional[tuple[int, float, float]]
+    expected: Optional[tuple[int, float, float]]
+
+
+def numeric_value(response: str) -> Optional[float]:
+    return float(response) if NUMERIC_PATTERN.match(response) else None
+
+
+def parse_date(response: str) -> Optional[date]:
+    if not DATE_PATTERN.match(response):
+        return None
+    try:
+        return date.fromisoformat(response[:10])
+    except ValueError:
+        return None
+
+
+def aggregate_bucket(answer_type: AnswerEnum, response: str) -> Optional[tuple[str, Optional[float]]]:
+    if answer_type in CHOICE_TYPES:
+        return response, None
+    if answer_type in HISTOGRAM_TYPES:
+        return response, numeric_value(response)
+    if answer_type == AnswerEnum.number:
+        value = numeric_value(response)
+        return (str(value), value) if value is not None else None
+    if answer_type == AnswerEnum.date and DATE_PATTERN.match(response):
+        return response[:10], None
+    return None
+
+
+def new_aggregates() -> defaultdict:
+    return defaultdict(lambda: [0, 0.0, 0.0])
+
+
+def add_to_bucket(aggregates: dict, question_id: uuid.UUID, key: str, value: Optional[float], count: int = 1) -> None:
+    bucket = aggregates[(question_id, key)]
+    bucket[0] += count
+    if value is not None:
+        bucket[1] += value * count
+        bucket[2] += value * value * count
+
+
+def accumulate_answers(
+    aggregates: dict,
+    answer_types: dict[uuid.UUID, AnswerEnum],
+    answers: Iterable[tuple[uuid.UUID, str]]
+) -> dict:
+    for question_id, response in answers:
+        if response == "":
+            continue
+        add_to_bucket(aggregates, question_id, TOTAL_KEY, None)
+        bucket = aggregate_bucket(answer_types[question_id], response)
+        if bucket is not None:
+            add_to_bucket(aggregates, question_id, *bucket)
+    return aggregates
+
+
+def build_aggregate_rows(aggregates: dict) -> list[dict]:
+    return [
+        {"question_id": question_id, "key": key, "count": count, "sum": total, "sum_squares": squares}
+        for (question_id, key), (count, total, squares) in sorted(aggregates.items())
+    ]
+
+
+def update_aggregates(
+    *,
+    session: Session,
+    answer_types: dict[uuid.UUID, AnswerEnum],
+    answers: Iterable[tuple[uuid.UUID, str]]
+) -> None:
+    aggregates = accumulate_answers(new_aggregates(), answer_types, answers)
+    question_aggregate_repository.upsert_aggregates(session=session, rows=build_aggregate_rows(aggregates))
+
+
+def get_survey_aggregates(*, session: Session, survey_id: uuid.UUID) -> dict[uuid.UUID, dict[str, QuestionAggregate]]:
+    aggregates = defaultdict(dict)
+    for aggregate in question_aggregate_repository.get_aggregates_by_survey_id(session=session, survey_id=survey_id):
+        aggregates[aggregate.question_id][aggregate.key] = aggregate
+    return aggregates
+
+
+def compute_survey_aggregates(*, session: Session, survey_id: uuid.UUID) -> dict:
+    questions = question_repository.get_questions_with_choices_by_survey_id(session=session, survey_id=survey_id)
+    answer_types = {question.id: question.answer_type for question in questions}
+    choices = {question.id: {choice.position: choice.content for choice in question.choices} for question in questions}
+    aggregates = new_aggregates()
+    for question_id, count in results_repository.count_answers_per_question(session=session, survey_id=survey_id):
+        add_to_bucket(aggregates, question_id, TOTAL_KEY, None, count)
+    for question_id, choice_position, response, count in results_repository.count_values_per_question(
+        session=session,
+        survey_id=survey_id,
+        answer_types=BUCKETED_TYPES
+    ):
+        if choice_position is not None:
+            response = choices[question_id][choice_position]
+        bucket = aggregate_bucket(answer_types[question_id], response)
+        if bucket is not None:
+            add_to_bucket(aggregates, question_id, *bucket, count)
+    return aggregates
+
+
+def bucket_matches(stored: Optional[tuple], expected: Optional[tuple]) -> bool:
+    if stored is None or expected is None:
+        return stored is expected
+    return stored[0] == expected[0] and all(
+        math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6) for a, b in zip(stored[1:], expected[1:])
+    )
+
+
+def find_mismatches(*, session: Session, survey_id: uuid.UUID, expected: dict) -> list[AggregateMismatch]:
+    stored = {
+        (aggregate.question_id, aggregate.key): (aggregate.count, aggregate.sum, aggregate.sum_squares)
+        for aggregate in question_aggregate_repository.get_aggregates_by_survey_id(session=session, survey_id=survey_id)
+    }
+    mismatches = []
+    for question_id, key in sorted(stored.keys() | expected.keys()):
+        stored_bucket = stored.get((question_id, key))
+        expected_bucket = tuple(expected[(question_id, key)]) if (question_id, key) in expected else None
+        if not bucket_matches(stored_bucket, expected_bucket):
+            mismatches.append(AggregateMismatch(question_id, key, stored_bucket, expected_bucket))
+    return mismatches
+
+
+def verify_survey_aggregates(*, session: Session, survey_id: uuid.UUID) -> list[AggregateMismatch]:
+    expected = compute_survey_aggregates(session=session, survey_id=survey_id)
+    return find_mismatches(session=session, survey_id=survey_id, expected=expected)
+@transactional()
+
+
+def rebuild_survey_aggregates(*, session: Session, survey_id: uuid.UUID) -> list[AggregateMismatch]:
+    survey_repository.lock_survey(session=session, survey_id=survey_id)
+    expected = compute_survey_aggregates(session=session, survey_id=survey_id)
+    mismatches = find_mismatches(session=session, survey_id=survey_id, expected=expected)
+    if mismatches:
+        question_aggregate_repository.delete_aggregates_by_survey_id(session=session, survey_id=survey_id)
+        question_aggregate_repository.insert_aggregates(session=session, rows=build_aggregate_rows(expected))
+    return mismatches
+
+
+def rebuild_aggregates(
+    *,
+    session: Session,
+    survey_ids: Optional[list[uuid.UUID]] = None,
+    check_only: bool = False
+) -> dict[uuid.UUID, list[AggregateMismatch]]:
+    if survey_ids is None:
+        survey_ids = survey_repository.get_all_survey_ids(session=session)
+    rebuild = verify_survey_aggregates if check_only else rebuild_survey_aggregates
+    return {survey_id: rebuild(session=session, survey_id=survey_id) for survey_id in survey_ids}
@@ -0,0 +1,239 @@
+import math
+import uuid
+from typing import Optional
+import numpy as np
+from sqlmodel import Session
+from ...models.question import Question, AnswerEnum
+from ...models.survey import Survey
+from ...models.results import (
+    SurveyStatistics,
+    QuestionStatistics,
+    HistogramBin,
+    ConfidenceInterval,
+    NetPromoterScore,
+    CrossTabRequest,
+    CrossTab,
+    ChiSquareTest
+)
+from ...core.exceptions import BadRequestError
+from ..repositories import question_repository, results_repository
+from .aggregate_service import HISTOGRAM_TYPES, NUMERIC_TYPES, get_survey_aggregates
+
+CROSSTAB_TYPES = {AnswerEnum.close, AnswerEnum.dropdown, AnswerEnum.yes_no}
+STATISTICS_PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+MAX_HISTOGRAM_BINS = 50
+CONFIDENCE_LEVEL = 0.95
+Z_CRITICAL = 1.959964
+T_CRITICAL = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+)
+
+
+def t_critical(degrees_of_freedom: int) -> float:
+    if degrees_of_freedom <= len(T_CRITICAL):
+        return T_CRITICAL[degrees_of_freedom - 1]
+    return Z_CRITICAL + (Z_CRITICAL ** 3 + Z_CRITICAL) / (4 * degrees_of_freedom)
+
+
+def regularized_gamma_q(a: float, x: float) -> float:
+    if x <= 0:
+        return 1.0
+    prefactor = math.exp(-x + a * math.log(x) - math.lgamma(a))
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        for _ in range(1000):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * prefactor)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    fraction = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        fraction *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return prefactor * fraction
+
+
+def chi_square_test(counts: np.ndarray) -> Optional[ChiSquareTest]:
+    counts = counts[counts.sum(axis=1) > 0][:, counts.sum(axis=0) > 0]
+    degrees_of_freedom = (counts.shape[0] - 1) * (counts.shape[1] - 1)
+    if degrees_of_freedom < 1:
+        return None
+    expected = np.outer(counts.sum(axis=1), counts.sum(axis=0)) / counts.sum()
+    statistic = float(((counts - expected) ** 2 / expected).sum())
+    return ChiSquareTest(
+        statistic=statistic,
+        degrees_of_freedom=degrees_of_freedom,
+        p_value=regularized_gamma_q(degrees_of_freedom / 2, statistic / 2)
+    )
+
+
+def is_nps_question(question: Question) -> bool:
+    settings = question.settings or {}
+    return question.answer_type == AnswerEnum.scale and settings.get("min") == 0 and settings.get("max") == 10
+
+
+def net_promoter_score(values: np.ndarray) -> NetPromoterScore:
+    promoters = int(np.count_nonzero(values >= 9))
+    detractors = int(np.count_nonzero(values <= 6))
+    return NetPromoterScore(
+        score=100.0 * (promoters - detractors) / len(values),
+        promoters=promoters,
+        passives=len(values) - promoters - detractors,
+        detractors=detractors
+    )
+
+
+def build_histogram(values: np.ndarray, discrete: bool) -> list[HistogramBin]:
+    if discrete and np.all(values == np.round(values)):
+        points, counts = np.unique(values, return_counts=True)
+        return [
+            HistogramBin(lower=point, upper=point, count=count)
+            for point, count in zip(points.tolist(), counts.tolist())
+        ]
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if len(edges) > MAX_HISTOGRAM_BINS + 1:
+        edges = np.linspace(values[0], values[-1], MAX_HISTOGRAM_BINS + 1)
+    counts, edges = np.histogram(values, bins=edges)
+    return [
+        HistogramBin(lower=lower, upper=upper, count=count)
+        for lower, upper, count in zip(edges[:-1].tolist(), edges[1:].tolist(), counts.tolist())
+    ]
+
+
+def describe_question(question: Question, values: np.ndarray) -> QuestionStatistics:
+    statistics = QuestionStatistics(
+        question_id=question.id,
+        content=question.content,
+        position=question.position,
+        answer_type=question.answer_type,
+        count=len(values)
+    )
+    if not len(values):
+        return statistics
+    values = np.sort(values)
+    count = len(values)
+    mean = float(values.mean())
+    stddev = float(values.std(ddof=1)) if count > 1 else 0.0
+    percentiles = np.percentile(values, STATISTICS_PERCENTILES)
+    statistics.mean = mean
+    statistics.median = float(np.median(values))
+    statistics.stddev = stddev
+    statistics.min = float(values[0])
+    statistics.max = float(values[-1])
+    statistics.percentiles = {f"p{p}": float(value) for p, value in zip(STATISTICS_PERCENTILES, percentiles)}
+    if count > 1:
+        margin = t_critical(count - 1) * stddev / math.sqrt(count)
+        statistics.confidence_interval = ConfidenceInterval(
+            level=CONFIDENCE_LEVEL,
+            lower=mean - margin,
+            upper=mean + margin
+        )
+    statistics.histogram = build_histogram(values, discrete=question.answer_type in HISTOGRAM_TYPES)
+    if is_nps_question(question):
+        statistics.nps = net_promoter_score(values)
+    return statistics
+
+
+def bucket_number(key: str) -> Optional[float]:
+    try:
+        value = float(key)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def load_numeric_values(*, session: Session, survey_id: uuid.UUID) -> dict[uuid.UUID, np.ndarray]:
+    arrays = {}
+    for question_id, buckets in get_survey_aggregates(session=session, survey_id=survey_id).items():
+        values, counts = [], []
+        for key, bucket in buckets.items():
+            value = bucket_number(key)
+            if value is not None:
+                values.append(value)
+                counts.append(bucket.count)
+        arrays[question_id] = np.repeat(np.array(values, dtype=np.float64), np.array(counts, dtype=np.int64))
+    return arrays
+
+
+def get_survey_statistics(*, session: Session, survey: Survey) -> SurveyStatistics:
+    questions = [
+        question
+        for question in question_repository.get_questions_by_survey_id(session=session, survey_id=survey.id)
+        if question.answer_type in NUMERIC_TYPES
+    ]
+    arrays = load_numeric_values(session=session, survey_id=survey.id)
+    empty = np.empty(0, dtype=np.float64)
+    return SurveyStatistics(
+        survey_id=survey.id,
+        questions=[describe_question(question, arrays.get(question.id, empty)) for question in questions]
+    )
+
+
+def crosstab_labels(question: Question, observed: set[str]) -> list[str]:
+    known = [choice.content for choice in sorted(question.choices, key=lambda choice: choice.position)]
+    return known + sorted(observed - set(known))
+
+
+def get_crosstab(*, session: Session, survey: Survey, crosstab_request: CrossTabRequest) -> CrossTab:
+    questions = {
+        question.id: question
+        for question in question_repository.get_questions_with_choices_by_survey_id(session=session, survey_id=survey.id)
+    }
+    row_question = questions.get(crosstab_request.row_question_id)
+    column_question = questions.get(crosstab_request.column_question_id)
+    if row_question is None or column_question is None or row_question.id == column_question.id:
+        raise BadRequestError("Tabela krzyżowa wymaga dwóch różnych pytań z tej ankiety")
+    if row_question.answer_type not in CROSSTAB_TYPES or column_question.answer_type not in CROSSTAB_TYPES:
+        raise BadRequestError("Tabela krzyżowa jest dostępna tylko dla pytań jednokrotnego wyboru, list i tak/nie")
+    if any(segment.question_id not in questions for segment in crosstab_request.filters):
+        raise BadRequestError("Filtr dotyczy pytania spoza tej ankiety")
+    cells = results_repository.count_crosstab(
+        session=session,
+        row_question_id=row_question.id,
+        column_question_id=column_question.id,
+        filters=[(segment.question_id, segment.values) for segment in crosstab_request.filters]
+    )
+    row_choices = {choice.position: choice.content for choice in row_question.choices}
+    column_choices = {choice.position: choice.content for choice in column_question.choices}
+    labelled = [
+        (
+            row_choices[row_position] if row_position is not None else row_text,
+            column_choices[column_position] if column_position is not None else column_text,
+            count
+        )
+        for row_position, row_text, column_position, column_text, count in cells
+    ]
+    rows = crosstab_labels(row_question, {row for row, _, _ in labelled})
+    columns = crosstab_labels(column_question, {column for _, column, _ in labelled})
+    row_index = {label: index for index, label in enumerate(rows)}
+    column_index = {label: index for index, label in enumerate(columns)}
+    counts = np.zeros((len(rows), len(columns)), dtype=np.int64)
+    for row, column, count in labelled:
+        counts[row_index[row], column_index[column]] += count
+    return CrossTab(
+        row_question_id=row_question.id,
+        column_question_id=column_question.id,
+        rows=rows,
+        columns=columns,
+        counts=counts.tolist(),
+        total=int(counts.sum()),
+        chi_square=chi_square_test(counts)
+    )
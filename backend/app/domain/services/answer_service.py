@@ -1,53 +1,179 @@
 from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
 import uuid
 from ...models.answer import AnswerCreate, Answer
 from sqlmodel import Session
-from ...core.transaction import transactional   
+from ...core.cache import LRUCache
+from ...core.config import settings
 from ...models.question import Question
+from ...models.survey import Survey
 from ...core.exceptions import CouldNotCreateResource, SurveyModifiedException
-from ..repositories import answer_repository    
+from ..repositories import answer_repository, question_repository
 from ...models.question import AnswerEnum
-@transactional()
+from .aggregate_service import NUMERIC_TYPES, numeric_value, parse_date
 
+CHOICES_CHANGED_MESSAGE = (
+    "Ankieta została zmodyfikowana od momentu jej otwarcia. "
+    "Opcje odpowiedzi zostały zmienione. "
+    "Odśwież stronę aby zobaczyć aktualną wersję."
+)
 
-def submit_answers(session: Session, answers_create: list[AnswerCreate], submission_id: uuid.UUID) -> list[Answer]:
-    answers = [Answer.model_validate(answer_create, update={"submission_id": submission_id}) for answer_create in answers_create]
+
+def submit_answers(
+    session: Session,
+    answers_create: list[AnswerCreate],
+    submission_id: uuid.UUID,
+    validator: Optional["CompiledSurveyValidator"] = None
+) -> list[Answer]:
+    answers = [
+        Answer.model_validate(
+            answer_create,
+            update={"submission_id": submission_id, **(validator.typed_values(answer_create) if validator else {})}
+        )
+        for answer_create in answers_create
+    ]
     answer_repository.submit_answers(session=session, answers=answers)
     return answers
 
 
-def validate_answers_creation(answers_create: list[AnswerCreate], questions: list[Question]) -> None:
-    question_ids = {q.id for q in questions}
-    missing_question_ids = []
-    for answer in answers_create:
-        if answer.question_id not in question_ids:
-            missing_question_ids.append(str(answer.question_id))
-    if missing_question_ids:
-        raise SurveyModifiedException(
-            message="Ankieta została zmodyfikowana od momentu jej otwarcia. "
-                    "Niektóre pytania zostały usunięte lub zmienione. "
-                    "Odśwież stronę aby zobaczyć aktualną wersję."
+def build_answer_rows(
+    answers_create: list[AnswerCreate],
+    submission_id: uuid.UUID,
+    validator: Optional["CompiledSurveyValidator"] = None
+) -> list[dict]:
+    return [
+        {
+            "question_id": answer.question_id,
+            "response": answer.response,
+            "submission_id": submission_id,
+            **(validator.typed_values(answer) if validator else {})
+        }
+        for answer in answers_create
+    ]
+
+
+def is_choice_reference(answer: AnswerCreate) -> bool:
+    return answer.choice_id is not None or answer.choice_position is not None
+
+
+@dataclass(frozen=True)
+class QuestionRule:
+    question_id: uuid.UUID
+    answer_type: AnswerEnum
+    choices: frozenset[str]
+    choice_ids: Mapping[str, uuid.UUID] = field(default_factory=dict)
+    choices_by_id: Mapping[uuid.UUID, tuple[int, str]] = field(default_factory=dict)
+    choice_ids_by_position: Mapping[int, uuid.UUID] = field(default_factory=dict)
+
+    def resolve_reference(self, answer: AnswerCreate) -> uuid.UUID:
+        choice_id = answer.choice_id
+        if answer.choice_position is not None:
+            by_position = self.choice_ids_by_position.get(answer.choice_position)
+            choice_id = by_position if choice_id is None or choice_id == by_position else None
+        if choice_id not in self.choices_by_id:
+            raise SurveyModifiedException(message=CHOICES_CHANGED_MESSAGE)
+        return choice_id
+
+    def response_text(self, answer: AnswerCreate) -> str:
+        if is_choice_reference(answer):
+            return self.choices_by_id[self.resolve_reference(answer)][1]
+        return answer.response
+
+    def typed_values(self, answer: AnswerCreate) -> dict:
+        response = answer.response
+        choice_id = self.resolve_reference(answer) if is_choice_reference(answer) else self.choice_ids.get(response)
+        return {
+            "response": self.choices_by_id[choice_id][1] if choice_id is not None else response,
+            "value_num": numeric_value(response) if self.answer_type in NUMERIC_TYPES else None,
+            "value_date": parse_date(response) if self.answer_type == AnswerEnum.date else None,
+            "choice_id": choice_id,
+            "choice_position": self.choices_by_id[choice_id][0] if choice_id is not None else None
+        }
+
+
+@dataclass(frozen=True)
+class CompiledSurveyValidator:
+    question_ids: frozenset[uuid.UUID]
+    rules: tuple[QuestionRule, ...]
+    rules_by_question: Mapping[uuid.UUID, QuestionRule] = field(default_factory=dict)
+
+    @classmethod
+    def compile(cls, questions: list[Question]) -> "CompiledSurveyValidator":
+        rules = tuple(
+            QuestionRule(
+                question_id=question.id,
+                answer_type=question.answer_type,
+                choices=frozenset(choice.content for choice in question.choices)
+                if question.answer_type in {AnswerEnum.close, AnswerEnum.multiple} else frozenset(),
+                choice_ids={choice.content: choice.id for choice in question.choices},
+                choices_by_id={choice.id: (choice.position, choice.content) for choice in question.choices},
+                choice_ids_by_position={choice.position: choice.id for choice in question.choices}
+            )
+            for question in questions
+        )
+        return cls(
+            question_ids=frozenset(rule.question_id for rule in rules),
+            rules=rules,
+            rules_by_question={rule.question_id: rule for rule in rules}
         )
-    answers_by_question = defaultdict(list)
-    for a in answers_create:
-        answers_by_question[a.question_id].append(a)
-    for question in questions:
-        answers = answers_by_question.get(question.id, [])
-        if question.answer_type == AnswerEnum.open:
-            if len(answers) != 1:
-                raise CouldNotCreateResource(f"Open question {question.id} must have exactly one answer.")
-        elif question.answer_type == AnswerEnum.close:
-            if len(answers) != 1:
-                raise CouldNotCreateResource(f"Close question {question.id} must have exactly one answer.")
-        elif question.answer_type == AnswerEnum.multiple:
-            if len(answers) < 1:
-                raise CouldNotCreateResource(f"Multiple question {question.id} must have at least one answer.")
-        if question.answer_type in {AnswerEnum.close, AnswerEnum.multiple}:
-            choices = {choice.content for choice in question.choices}
+
+    @property
+    def answer_types(self) -> dict[uuid.UUID, AnswerEnum]:
+        return {rule.question_id: rule.answer_type for rule in self.rules}
+
+    def typed_values(self, answer: AnswerCreate) -> dict:
+        return self.rules_by_question[answer.question_id].typed_values(answer)
+
+    def response_text(self, answer: AnswerCreate) -> str:
+        return self.rules_by_question[answer.question_id].response_text(answer)
+
+    def validate(self, answers_create: list[AnswerCreate]) -> None:
+        if any(answer.question_id not in self.question_ids for answer in answers_create):
+            raise SurveyModifiedException(
+                message="Ankieta została zmodyfikowana od momentu jej otwarcia. "
+                        "Niektóre pytania zostały usunięte lub zmienione. "
+                        "Odśwież stronę aby zobaczyć aktualną wersję."
+            )
+        answers_by_question = defaultdict(list)
+        for a in answers_create:
+            answers_by_question[a.question_id].append(a)
+        for rule in self.rules:
+            answers = answers_by_question.get(rule.question_id, [])
+            if rule.answer_type == AnswerEnum.open:
+                if len(answers) != 1:
+                    raise CouldNotCreateResource(f"Open question {rule.question_id} must have exactly one answer.")
+            elif rule.answer_type == AnswerEnum.close:
+                if len(answers) != 1:
+                    raise CouldNotCreateResource(f"Close question {rule.question_id} must have exactly one answer.")
+            elif rule.answer_type == AnswerEnum.multiple:
+                if len(answers) < 1:
+                    raise CouldNotCreateResource(f"Multiple question {rule.question_id} must have at least one answer.")
+            if len(answers) > 1:
+                raise CouldNotCreateResource(f"Question {rule.question_id} must not have more than one answer.")
             for a in answers:
-                if a.response not in choices:
-                    raise SurveyModifiedException(
-                        message="Ankieta została zmodyfikowana od momentu jej otwarcia. "
-                                "Opcje odpowiedzi zostały zmienione. "
-                                "Odśwież stronę aby zobaczyć aktualną wersję."
-                    )
+                if is_choice_reference(a):
+                    rule.resolve_reference(a)
+                elif rule.answer_type in {AnswerEnum.close, AnswerEnum.multiple} and a.response not in rule.choices:
+                    raise SurveyModifiedException(message=CHOICES_CHANGED_MESSAGE)
+
+
+survey_validator_cache = LRUCache(max_size=settings.VALIDATOR_CACHE_SIZE)
+
+
+def validate_answers_creation(answers_create: list[AnswerCreate], questions: list[Question]) -> None:
+    CompiledSurveyValidator.compile(questions).validate(answers_create)
+
+
+def get_survey_validator(*, session: Session, survey: Survey) -> CompiledSurveyValidator:
+    cached = survey_validator_cache.get(survey.id)
+    if cached is not None and cached[0] == survey.last_updated:
+        return cached[1]
+    questions = question_repository.get_questions_with_choices_by_survey_id(session=session, survey_id=survey.id)
+    validator = CompiledSurveyValidator.compile(questions)
+    survey_validator_cache.set(survey.id, (survey.last_updated, validator))
+    return validator
+
+
+def invalidate_survey_validator(survey_id: uuid.UUID) -> None:
+    survey_validator_cache.delete(survey_id)
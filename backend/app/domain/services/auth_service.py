@@ -1,17 +1,31 @@
 from typing import Optional
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from fastapi.concurrency import run_in_threadpool
 from ...models.user import User
 from ..repositories.user_repository import get_user_by_email
+from ..repositories import async_user_repository
 from ...core.password_hashing import verify_password
 from ...core.exceptions import UnauthorizedError
 
 
-def authenticate_user(session: Session, email: str, password: str) -> Optional[User]:
-    user = get_user_by_email(session, email)
-    if not user or not verify_password(password, user.hashed_password):
-        return None
+def check_user_can_log_in(user: User) -> User:
     if user.email_confirmed is False:
         raise UnauthorizedError("Email nie został potwierdzony")
     if user.is_active is False:
         raise UnauthorizedError("Użytkownik nie jest aktywny")
     return user
+
+
+def authenticate_user(session: Session, email: str, password: str) -> Optional[User]:
+    user = get_user_by_email(session, email)
+    if not user or not verify_password(password, user.hashed_password):
+        return None
+    return check_user_can_log_in(user)
+
+
+async def authenticate_user_async(session: AsyncSession, email: str, password: str) -> Optional[User]:
+    user = await async_user_repository.get_user_by_email(session, email)
+    if not user or not await run_in_threadpool(verify_password, password, user.hashed_password):
+        return None
+    return check_user_can_log_in(user)
@@ -0,0 +1,152 @@
+import csv
+import io
+import uuid
+from typing import Iterator, Optional
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlmodel import Session
+from ...core.config import settings
+from ...models.results import ExportFormat
+from ..repositories import question_repository, submission_repository
+from .aggregate_service import CHOICE_TYPES
+from .submission_service import iter_survey_submission_answers
+
+CSV_BOM = "\ufeff"
+ANSWER_EXPORT_SCHEMA = pa.schema([
+    ("survey_id", pa.string()),
+    ("submission_id", pa.string()),
+    ("created_at", pa.timestamp("us")),
+    ("question_id", pa.string()),
+    ("question_position", pa.int32()),
+    ("answer_type", pa.dictionary(pa.int32(), pa.string())),
+    ("response", pa.string()),
+    ("choice_position", pa.int16()),
+    ("value_number", pa.float64()),
+    ("value_date", pa.date32()),
+    ("value_choice", pa.dictionary(pa.int32(), pa.string()))
+])
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.parquet: "application/vnd.apache.parquet",
+    ExportFormat.arrow: "application/vnd.apache.arrow.stream"
+}
+
+
+def export_survey_csv(*, session: Session, survey_id: uuid.UUID) -> Iterator[str]:
+    questions = question_repository.get_questions_by_survey_id(session=session, survey_id=survey_id)
+    columns = {question.id: index for index, question in enumerate(questions)}
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([
+        "submission_id",
+        "created_at",
+        *(f"{index}. {question.content}" for index, question in enumerate(questions, start=1))
+    ])
+    yield CSV_BOM + buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    rows = 0
+    for submission_id, created_at, answers in iter_survey_submission_answers(session=session, survey_id=survey_id):
+        row = [""] * len(columns)
+        for question_id, response in answers:
+            if question_id in columns:
+                row[columns[question_id]] = response
+        writer.writerow([submission_id, created_at.isoformat(), *row])
+        rows += 1
+        if rows % settings.SUBMISSION_STREAM_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+class ChunkSink:
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def build_answer_batch(rows: list[tuple]) -> pa.RecordBatch:
+    columns = [[] for _ in ANSWER_EXPORT_SCHEMA]
+    for (
+        survey_id, submission_id, created_at, question_id, position,
+        answer_type, response, choice_position, value_num, value_date
+    ) in rows:
+        columns[0].append(str(survey_id))
+        columns[1].append(str(submission_id))
+        columns[2].append(created_at)
+        columns[3].append(str(question_id))
+        columns[4].append(position)
+        columns[5].append(answer_type.value)
+        columns[6].append(response)
+        columns[7].append(choice_position)
+        columns[8].append(value_num)
+        columns[9].append(value_date)
+        columns[10].append(response if answer_type in CHOICE_TYPES and response else None)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(values, type=field.type.value_type).dictionary_encode()
+            if pa.types.is_dictionary(field.type) else pa.array(values, type=field.type)
+            for values, field in zip(columns, ANSWER_EXPORT_SCHEMA)
+        ],
+        schema=ANSWER_EXPORT_SCHEMA
+    )
+
+
+def iter_answer_batches(
+    *,
+    session: Session,
+    survey_id: Optional[uuid.UUID] = None,
+    user_id: Optional[uuid.UUID] = None
+) -> Iterator[pa.RecordBatch]:
+    rows = submission_repository.iter_answer_export_rows(
+        session=session,
+        batch_size=settings.EXPORT_BATCH_SIZE,
+        survey_id=survey_id,
+        user_id=user_id
+    )
+    for partition in rows.partitions():
+        yield build_answer_batch(partition)
+
+
+def open_export_writer(export_format: ExportFormat, sink: ChunkSink):
+    if export_format == ExportFormat.parquet:
+        return pq.ParquetWriter(sink, ANSWER_EXPORT_SCHEMA, compression="zstd")
+    return pa.ipc.new_stream(sink, ANSWER_EXPORT_SCHEMA)
+
+
+def export_answers(
+    *,
+    session: Session,
+    export_format: ExportFormat,
+    survey_id: Optional[uuid.UUID] = None,
+    user_id: Optional[uuid.UUID] = None
+) -> Iterator[bytes]:
+    sink = ChunkSink()
+    writer = open_export_writer(export_format, sink)
+    for batch in iter_answer_batches(session=session, survey_id=survey_id, user_id=user_id):
+        writer.write_batch(batch)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
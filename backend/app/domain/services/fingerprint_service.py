@@ -0,0 +1,96 @@
+from sqlmodel import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession, SessionTransaction
+from ..repositories import submission_repository
+from ...core.cache import LRUCache
+from ...core.config import settings
+from ...core.sketches import BloomFilter
+from ...models.survey import Survey
+from dataclasses import dataclass
+import hashlib
+import threading
+import uuid
+
+fingerprint_filters = LRUCache(
+    max_size=max(1, settings.FINGERPRINT_FILTER_MEMORY_BYTES // settings.FINGERPRINT_FILTER_SIZE_BYTES),
+    ttl=settings.FINGERPRINT_FILTER_REBUILD_SECONDS
+)
+filter_lock = threading.Lock()
+PENDING_FINGERPRINTS = "pending_fingerprints"
+
+
+@dataclass
+class FingerprintFilter:
+    bloom: BloomFilter
+    submission_count: int
+
+    def is_current(self, survey: Survey) -> bool:
+        return survey.submission_count == self.submission_count
+
+
+def fingerprint_hash(fingerprint_data: dict) -> str:
+    if fingerprint_data.get('fingerprint_advanced'):
+        fingerprint_string = f"{fingerprint_data['fingerprint_advanced']}|{fingerprint_data['survey_id']}"
+    else:
+        fingerprint_string = f"{fingerprint_data['ip']}|{fingerprint_data['user_agent']}|{fingerprint_data['survey_id']}"
+    return hashlib.sha256(fingerprint_string.encode()).hexdigest()
+
+
+def build_fingerprint_filter(*, session: Session, survey: Survey) -> FingerprintFilter:
+    bloom = BloomFilter(
+        size_bytes=settings.FINGERPRINT_FILTER_SIZE_BYTES,
+        hashes=settings.FINGERPRINT_FILTER_HASHES
+    )
+    for fingerprint_hash in submission_repository.iter_recent_fingerprint_hashes(
+        session=session,
+        survey_id=survey.id,
+        batch_size=settings.SUBMISSION_STREAM_BATCH_SIZE
+    ):
+        bloom.add(fingerprint_hash)
+    return FingerprintFilter(bloom=bloom, submission_count=survey.submission_count)
+
+
+def get_fingerprint_filter(*, session: Session, survey: Survey) -> FingerprintFilter:
+    fingerprint_filter = fingerprint_filters.get(survey.id)
+    if fingerprint_filter is None:
+        fingerprint_filter = build_fingerprint_filter(session=session, survey=survey)
+        fingerprint_filters.set(survey.id, fingerprint_filter)
+    return fingerprint_filter
+
+
+def fingerprint_exists(*, session: Session, survey: Survey, fingerprint_hash: str) -> bool:
+    fingerprint_filter = get_fingerprint_filter(session=session, survey=survey)
+    if fingerprint_filter.is_current(survey) and fingerprint_hash not in fingerprint_filter.bloom:
+        return False
+    return submission_repository.check_fingerprint_exists(
+        session=session,
+        survey_id=survey.id,
+        fingerprint_hash=fingerprint_hash
+    )
+
+
+def claim_fingerprint(*, session: Session, survey_id: uuid.UUID, fingerprint_hash: str) -> bool:
+    claimed = submission_repository.claim_fingerprint(
+        session=session,
+        survey_id=survey_id,
+        fingerprint_hash=fingerprint_hash
+    )
+    if claimed:
+        session.info.setdefault(PENDING_FINGERPRINTS, []).append((survey_id, fingerprint_hash))
+    return claimed
+
+
+@event.listens_for(OrmSession, "after_commit")
+def apply_pending_fingerprints(session: OrmSession) -> None:
+    for survey_id, fingerprint_hash in session.info.pop(PENDING_FINGERPRINTS, []):
+        fingerprint_filter = fingerprint_filters.get(survey_id)
+        if fingerprint_filter is not None:
+            with filter_lock:
+                fingerprint_filter.bloom.add(fingerprint_hash)
+                fingerprint_filter.submission_count += 1
+
+
+@event.listens_for(OrmSession, "after_transaction_end")
+def discard_pending_fingerprints(session: OrmSession, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(PENDING_FINGERPRINTS, None)
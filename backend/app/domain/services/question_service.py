@@ -6,6 +6,8 @@ from ..services.survey_service import update_survey_last_updated
 from ...core.exceptions import CouldNotCreateResource, NotFoundError
 from ...core.transaction import transactional
 from ..services.choice_service import create_choices
+from ..services.answer_service import invalidate_survey_validator
+from ..services.survey_snapshot_service import invalidate_survey_snapshot
 import uuid 
 
 
@@ -81,6 +83,8 @@ def create_or_update_questions_for_survey(*, session: Session, questions: list[Q
         if question_base.choices:
             create_choices(session=session, choices_create=question_base.choices, question_id=new_question.id)
     update_survey_last_updated(session=session, survey_id=survey.id)
+    invalidate_survey_validator(survey.id)
+    invalidate_survey_snapshot(survey.id)
     return created
 @transactional()
 
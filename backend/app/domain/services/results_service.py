@@ -0,0 +1,80 @@
+import math
+from datetime import date
+from typing import Optional
+from sqlmodel import Session
+from ...models.question import AnswerEnum
+from ...models.question_aggregate import QuestionAggregate
+from ...models.survey import Survey
+from ...models.results import SurveyResults, QuestionResults, ValueCount, DayCount, NumberStats
+from ..repositories import question_repository
+from .aggregate_service import CHOICE_TYPES, HISTOGRAM_TYPES, TOTAL_KEY, get_survey_aggregates
+
+PERCENTILES = (25, 50, 75, 90)
+
+
+def histogram_sort_key(value_count: ValueCount):
+    try:
+        return (0, float(value_count.value), value_count.value)
+    except ValueError:
+        return (1, 0.0, value_count.value)
+
+
+def get_number_stats(buckets: list[QuestionAggregate]) -> Optional[NumberStats]:
+    if not buckets:
+        return None
+    buckets = sorted(buckets, key=lambda bucket: float(bucket.key))
+    count = sum(bucket.count for bucket in buckets)
+    mean = sum(bucket.sum for bucket in buckets) / count
+    variance = max(sum(bucket.sum_squares for bucket in buckets) / count - mean * mean, 0.0)
+    percentiles = {}
+    for p in PERCENTILES:
+        rank = (count * p + 99) // 100
+        seen = 0
+        for bucket in buckets:
+            seen += bucket.count
+            if seen >= rank:
+                percentiles[f"p{p}"] = float(bucket.key)
+                break
+    return NumberStats(
+        count=count,
+        min=float(buckets[0].key),
+        max=float(buckets[-1].key),
+        mean=mean,
+        stddev=math.sqrt(variance),
+        **percentiles
+    )
+
+
+def get_survey_results(*, session: Session, survey: Survey) -> SurveyResults:
+    questions = question_repository.get_questions_with_choices_by_survey_id(session=session, survey_id=survey.id)
+    aggregates = get_survey_aggregates(session=session, survey_id=survey.id)
+    results = []
+    for question in questions:
+        buckets = dict(aggregates.get(question.id, {}))
+        total = buckets.pop(TOTAL_KEY, None)
+        question_results = QuestionResults(
+            question_id=question.id,
+            content=question.content,
+            position=question.position,
+            answer_type=question.answer_type,
+            total=total.count if total else 0
+        )
+        counts = {key: bucket.count for key, bucket in buckets.items()}
+        if question.answer_type in CHOICE_TYPES:
+            known = [choice.content for choice in sorted(question.choices, key=lambda c: c.position)]
+            question_results.choices = [ValueCount(value=value, count=counts.get(value, 0)) for value in known] + [
+                ValueCount(value=value, count=count) for value, count in counts.items() if value not in known
+            ]
+        elif question.answer_type in HISTOGRAM_TYPES:
+            question_results.histogram = sorted(
+                (ValueCount(value=value, count=count) for value, count in counts.items()),
+                key=histogram_sort_key
+            )
+        elif question.answer_type == AnswerEnum.number:
+            question_results.stats = get_number_stats(list(buckets.values()))
+        elif question.answer_type == AnswerEnum.date:
+            question_results.per_day = [
+                DayCount(day=date.fromisoformat(key), count=count) for key, count in sorted(counts.items())
+            ]
+        results.append(question_results)
+    return SurveyResults(survey_id=survey.id, submission_count=survey.submission_count, questions=results)
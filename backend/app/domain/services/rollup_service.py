@@ -0,0 +1,96 @@
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlmodel import Session
+from ...core.config import settings
+from ...core.exceptions import BadRequestError
+from ...core.transaction import transactional
+from ...models.results import SubmissionTimeline, TimelinePoint
+from ...models.submission_rollup import RollupGranularity
+from ...models.survey import Survey
+from ..repositories import rollup_repository
+
+COMPACTION_STEPS = (
+    (RollupGranularity.minute, RollupGranularity.hour, timedelta(hours=settings.ROLLUP_MINUTE_RETENTION_HOURS)),
+    (RollupGranularity.hour, RollupGranularity.day, timedelta(days=settings.ROLLUP_HOUR_RETENTION_DAYS))
+)
+
+
+def utc_naive(moment: datetime) -> datetime:
+    if moment.tzinfo is not None:
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def truncate(moment: datetime, granularity: RollupGranularity) -> datetime:
+    moment = utc_naive(moment).replace(second=0, microsecond=0)
+    if granularity == RollupGranularity.minute:
+        return moment
+    moment = moment.replace(minute=0)
+    if granularity == RollupGranularity.hour:
+        return moment
+    return moment.replace(hour=0)
+
+
+def record_submissions(*, session: Session, survey_id: uuid.UUID, created_at: datetime, count: int = 1) -> None:
+    rollup_repository.upsert_rollups(
+        session=session,
+        rows=[{
+            "survey_id": survey_id,
+            "granularity": RollupGranularity.minute,
+            "bucket_start": truncate(created_at, RollupGranularity.minute),
+            "count": count
+        }]
+    )
+@transactional()
+
+
+def compact_submission_rollups(*, session: Session, now: datetime) -> int:
+    compacted = 0
+    for source, target, retention in COMPACTION_STEPS:
+        cutoff = truncate(now - retention, target)
+        totals = defaultdict(int)
+        rows = rollup_repository.get_rollups_before(session=session, granularity=source, cutoff=cutoff)
+        for survey_id, bucket_start, count in rows:
+            totals[(survey_id, truncate(bucket_start, target))] += count
+        rollup_repository.upsert_rollups(
+            session=session,
+            rows=[
+                {"survey_id": survey_id, "granularity": target, "bucket_start": bucket_start, "count": count}
+                for (survey_id, bucket_start), count in sorted(totals.items())
+            ]
+        )
+        rollup_repository.delete_rollups_before(session=session, granularity=source, cutoff=cutoff)
+        compacted += len(rows)
+    return compacted
+
+
+def get_submission_timeline(
+    *,
+    session: Session,
+    survey: Survey,
+    granularity: RollupGranularity,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> SubmissionTimeline:
+    start = truncate(start or survey.created_at, granularity)
+    end = utc_naive(end) if end else datetime.utcnow()
+    if start >= end:
+        raise BadRequestError("Początek zakresu musi być wcześniejszy niż jego koniec")
+    counts = defaultdict(int)
+    for bucket_start, count in rollup_repository.get_survey_rollups(
+        session=session,
+        survey_id=survey.id,
+        start=start,
+        end=end
+    ):
+        counts[truncate(bucket_start, granularity)] += count
+    return SubmissionTimeline(
+        survey_id=survey.id,
+        granularity=granularity,
+        start=start,
+        end=end,
+        total=sum(counts.values()),
+        points=[TimelinePoint(bucket_start=bucket_start, count=count) for bucket_start, count in sorted(counts.items())]
+    )
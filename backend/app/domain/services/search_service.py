@@ -0,0 +1,223 @@
+import base64
+import math
+import re
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterator, Optional
+from sqlmodel import Session
+from ...core.cache import LRUCache
+from ...core.config import settings
+from ...core.exceptions import BadRequestError, NotFoundError
+from ...core.sketches import SpaceSaving
+from ...models.question import AnswerEnum, Question
+from ...models.results import SearchHighlight, SearchHit, SearchPage, TermFrequency, TermSummary
+from ...models.survey import Survey
+from ..repositories import answer_repository, question_repository
+
+TOKEN_PATTERN = re.compile(r"\w+")
+HIGHLIGHT_PATTERN = re.compile("\x02(.*?)\x03", re.DOTALL)
+SEARCHABLE_TYPES = {AnswerEnum.open}
+STOPWORDS = frozenset("""
+    a aby ale albo ani by być bo był była było były co czy dla do gdy gdzie go i ich ile im jak jako
+    jednak jest jego jej jeśli już ja je jestem ku lub ma mi mnie mam może mój na nad nam nas nie nic
+    niż no o od on ona one oni oraz po pod przez przy się są ta tak takie także tam te tego tej ten
+    to tu tylko tym u w we więc wszystko z za ze że żeby
+""".split())
+
+term_summary_cache = LRUCache(max_size=settings.TERM_SUMMARY_CACHE_SIZE)
+
+
+def tokenize(text: str) -> list[str]:
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+
+
+def mark_terms(text: str, terms: set[str]) -> str:
+    return TOKEN_PATTERN.sub(
+        lambda match: f"\x02{match.group()}\x03" if match.group().lower() in terms else match.group(),
+        text
+    )
+
+
+def split_highlights(headline: str) -> list[SearchHighlight]:
+    highlights = []
+    position = 0
+    for match in HIGHLIGHT_PATTERN.finditer(headline):
+        if match.start() > position:
+            highlights.append(SearchHighlight(text=headline[position:match.start()], match=False))
+        highlights.append(SearchHighlight(text=match.group(1), match=True))
+        position = match.end()
+    if position < len(headline):
+        highlights.append(SearchHighlight(text=headline[position:], match=False))
+    return highlights
+
+
+class InvertedIndex:
+
+    def __init__(self, documents: list[tuple[uuid.UUID, datetime, str]]):
+        self.documents = documents
+        self.lengths = []
+        self.postings = defaultdict(dict)
+        for index, (_, _, text) in enumerate(documents):
+            tokens = tokenize(text)
+            self.lengths.append(len(tokens))
+            for token in tokens:
+                self.postings[token][index] = self.postings[token].get(index, 0) + 1
+
+    def search(self, terms: list[str]) -> list[tuple[float, int]]:
+        postings = sorted((self.postings.get(term, {}) for term in set(terms)), key=len)
+        if not postings or not postings[0]:
+            return []
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches &= posting.keys()
+        return [
+            (sum(posting[index] for posting in postings) / (1 + math.log(self.lengths[index])), index)
+            for index in matches
+        ]
+
+
+def index_submission_answers(
+    *,
+    session: Session,
+    answer_types: dict[uuid.UUID, AnswerEnum],
+    submission_ids: list[uuid.UUID]
+) -> None:
+    answer_repository.index_answer_text(
+        session=session,
+        question_ids={question_id for question_id, answer_type in answer_types.items() if answer_type in SEARCHABLE_TYPES},
+        submission_ids=submission_ids
+    )
+
+
+def encode_search_cursor(rank: float, submission_id: uuid.UUID) -> str:
+    return base64.urlsafe_b64encode(f"{rank!r}|{submission_id}".encode()).decode()
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    try:
+        rank, submission_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return float(rank), uuid.UUID(submission_id)
+    except ValueError:
+        raise BadRequestError("Nieprawidłowy kursor stronicowania")
+
+
+def search_in_memory(
+    *,
+    session: Session,
+    question_id: uuid.UUID,
+    terms: list[str],
+    limit: int,
+    after: Optional[tuple[float, uuid.UUID]]
+) -> list[tuple]:
+    index = InvertedIndex(answer_repository.get_question_answer_texts(session=session, question_id=question_id))
+    ranked = [
+        (rank, index.documents[position])
+        for rank, position in index.search(terms)
+    ]
+    ranked.sort(key=lambda item: (item[0], str(item[1][0])), reverse=True)
+    if after:
+        ranked = [item for item in ranked if (item[0], str(item[1][0])) < (after[0], str(after[1]))]
+    return [
+        (submission_id, created_at, response, rank, mark_terms(response, set(terms)))
+        for rank, (submission_id, created_at, response) in ranked[:limit]
+    ]
+
+
+def get_open_question(*, session: Session, survey: Survey, question_id: uuid.UUID) -> Question:
+    question = question_repository.get_question_by_id(session=session, question_id=question_id)
+    if question is None or question.survey_id != survey.id:
+        raise NotFoundError("Pytanie nie zostało znalezione")
+    if question.answer_type not in SEARCHABLE_TYPES:
+        raise BadRequestError("Wyszukiwanie jest dostępne tylko dla pytań otwartych")
+    return question
+
+
+def search_answers(
+    *,
+    session: Session,
+    survey: Survey,
+    question_id: uuid.UUID,
+    query: str,
+    limit: int,
+    cursor: Optional[str] = None
+) -> SearchPage:
+    question = get_open_question(session=session, survey=survey, question_id=question_id)
+    terms = tokenize(query)
+    if not terms:
+        raise BadRequestError("Zapytanie nie zawiera słów do wyszukania")
+    after = decode_search_cursor(cursor) if cursor else None
+    if answer_repository.supports_text_search(session):
+        rows = answer_repository.search_answers(
+            session=session,
+            question_id=question.id,
+            query=query,
+            limit=limit + 1,
+            after=after
+        )
+    else:
+        rows = search_in_memory(session=session, question_id=question.id, terms=terms, limit=limit + 1, after=after)
+    items = [
+        SearchHit(
+            submission_id=submission_id,
+            created_at=created_at,
+            response=response,
+            rank=rank,
+            highlights=split_highlights(headline)
+        )
+        for submission_id, created_at, response, rank, headline in rows[:limit]
+    ]
+    next_cursor = encode_search_cursor(items[-1].rank, items[-1].submission_id) if len(rows) > limit else None
+    return SearchPage(items=items, next_cursor=next_cursor)
+
+
+def summarize_responses(question_id: uuid.UUID, responses: Iterator[str]) -> TermSummary:
+    terms = SpaceSaving(settings.TERM_SKETCH_CAPACITY)
+    bigrams = SpaceSaving(settings.TERM_SKETCH_CAPACITY)
+    response_count = 0
+    token_count = 0
+    for response in responses:
+        response_count += 1
+        tokens = tokenize(response)
+        token_count += len(tokens)
+        previous = None
+        for token in tokens:
+            if token in STOPWORDS or len(token) < 2:
+                previous = None
+                continue
+            terms.add(token)
+            if previous is not None:
+                bigrams.add(f"{previous} {token}")
+            previous = token
+    return TermSummary(
+        question_id=question_id,
+        response_count=response_count,
+        token_count=token_count,
+        terms=[
+            TermFrequency(term=term, count=count, error=error)
+            for term, count, error in terms.top(settings.TERM_SUMMARY_MAX_TERMS)
+        ],
+        bigrams=[
+            TermFrequency(term=term, count=count, error=error)
+            for term, count, error in bigrams.top(settings.TERM_SUMMARY_MAX_TERMS)
+        ]
+    )
+
+
+def get_term_summary(*, session: Session, survey: Survey, question_id: uuid.UUID, limit: int) -> TermSummary:
+    question = get_open_question(session=session, survey=survey, question_id=question_id)
+    version = (survey.submission_count, survey.last_updated)
+    cached = term_summary_cache.get((survey.id, question.id))
+    if cached is not None and cached[0] == version:
+        summary = cached[1]
+    else:
+        summary = summarize_responses(
+            question.id,
+            answer_repository.iter_question_responses(
+                session=session,
+                question_id=question.id,
+                batch_size=settings.SUBMISSION_STREAM_BATCH_SIZE
+            )
+        )
+        term_summary_cache.set((survey.id, question.id), (version, summary))
+    return summary.model_copy(update={"terms": summary.terms[:limit], "bigrams": summary.bigrams[:limit]})
@@ -1,19 +1,151 @@
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ...models.share_link import ShareLink, ShareLinkCreate
-from ..repositories import share_link_repository
+from ..repositories import share_link_repository, async_share_link_repository
 from ...core.transaction import transactional
 from datetime import datetime, timezone
+from ...core.click_buffer import ClickBuffer
+from ...core.cache import LRUCache
+from ...core.config import settings
+from ...core.password_hashing import hash_password, verify_password
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from dataclasses import dataclass, field
+from typing import Optional
+import hashlib
+import hmac
+import secrets
 import uuid
+
+click_buffer = ClickBuffer(max_links=settings.SHARE_CLICK_BUFFER_SIZE)
+share_link_cache = LRUCache(max_size=settings.SHARE_LINK_CACHE_SIZE, ttl=settings.SHARE_LINK_CACHE_TTL)
+verification_secret = secrets.token_bytes(32)
+
+
+@dataclass
+class CachedShareLink:
+    id: uuid.UUID
+    survey_id: uuid.UUID
+    share_token: str
+    is_active: bool
+    max_responses: Optional[int]
+    expires_at: Optional[datetime]
+    password_hash: Optional[str]
+    verified_passwords: set[str] = field(default_factory=set)
+
+
+def cache_share_link(share_link: Optional[ShareLink], token: str) -> Optional[CachedShareLink]:
+    if not share_link:
+        return None
+    cached = CachedShareLink(
+        id=share_link.id,
+        survey_id=share_link.survey_id,
+        share_token=share_link.share_token,
+        is_active=share_link.is_active,
+        max_responses=share_link.max_responses,
+        expires_at=share_link.expires_at,
+        password_hash=share_link.password_hash
+    )
+    share_link_cache.set(token, cached)
+    return cached
+
+
+def invalidate_share_link(token: str) -> None:
+    share_link_cache.delete(token)
+
+
+def is_expired(share_link: CachedShareLink) -> bool:
+    if share_link.expires_at is None:
+        return False
+    expires_at = share_link.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= datetime.now(timezone.utc)
+
+
+def verification_key(share_link: CachedShareLink, password: str) -> str:
+    message = f"{share_link.id}|{share_link.password_hash}|{password}".encode()
+    return hmac.new(verification_secret, message, hashlib.sha256).hexdigest()
+
+
+def pending_password_check(share_link: CachedShareLink, password: Optional[str]) -> Optional[str]:
+    if share_link.password_hash is None:
+        return None
+    if not password:
+        raise HTTPException(status_code=401, detail="Ten link jest chroniony hasłem")
+    key = verification_key(share_link, password)
+    return None if key in share_link.verified_passwords else key
+
+
+def record_password_check(share_link: CachedShareLink, key: str, verified: bool) -> None:
+    if not verified:
+        raise HTTPException(status_code=403, detail="Nieprawidłowe hasło do linku")
+    if len(share_link.verified_passwords) >= settings.SHARE_LINK_VERIFIED_PASSWORDS:
+        share_link.verified_passwords.pop()
+    share_link.verified_passwords.add(key)
+
+
+def check_share_link(share_link: Optional[CachedShareLink]) -> CachedShareLink:
+    if not share_link or not share_link.is_active:
+        raise HTTPException(status_code=404, detail="Link nie został znaleziony lub wygasł")
+    if is_expired(share_link):
+        raise HTTPException(status_code=410, detail="Link wygasł")
+    return share_link
+
+
+async def get_cached_share_link_async(*, session: AsyncSession, token: str) -> Optional[CachedShareLink]:
+    cached = share_link_cache.get(token)
+    if cached is not None:
+        return cached
+    share_link = await async_share_link_repository.get_share_link_by_token(session=session, token=token)
+    return cache_share_link(share_link, token)
+
+
+def consume_response(*, session: Session, share_link: CachedShareLink) -> int:
+    response_count = share_link_repository.consume_response(session=session, link_id=share_link.id)
+    if response_count is None:
+        raise HTTPException(status_code=410, detail="Limit odpowiedzi dla tego linku został wyczerpany")
+    return response_count
+
+
+async def authorize_share_link_async(
+    *,
+    session: AsyncSession,
+    token: str,
+    password: Optional[str]
+) -> CachedShareLink:
+    share_link = check_share_link(await get_cached_share_link_async(session=session, token=token))
+    key = pending_password_check(share_link, password)
+    if key is not None:
+        record_password_check(
+            share_link,
+            key,
+            await run_in_threadpool(verify_password, password, share_link.password_hash)
+        )
+    return share_link
+
+
+async def authorize_submission_async(
+    *,
+    session: AsyncSession,
+    token: str,
+    survey_id: uuid.UUID,
+    password: Optional[str]
+) -> CachedShareLink:
+    share_link = await authorize_share_link_async(session=session, token=token, password=password)
+    if share_link.survey_id != survey_id:
+        raise HTTPException(status_code=400, detail="Link dotyczy innej ankiety")
+    return share_link
 @transactional(refresh_returned_instance=True)
 
 
 def create_share_link(*, session: Session, survey_id: uuid.UUID, share_link_create: ShareLinkCreate) -> ShareLink:
     share_link = ShareLink.model_validate(
-        share_link_create,
+        share_link_create.model_dump(exclude={"password"}),
         update={
             "survey_id": survey_id,
-            "created_at": datetime.now(timezone.utc)
+            "created_at": datetime.now(timezone.utc),
+            "password_hash": hash_password(share_link_create.password) if share_link_create.password else None
         }
     )
     new_share_link = share_link_repository.create_share_link(session=session, share_link=share_link)
@@ -40,9 +172,30 @@ def get_share_link_by_id(*, session: Session, link_id: uuid.UUID) -> ShareLink:
 
 
 def delete_share_link(*, session: Session, link_id: uuid.UUID) -> None:
+    link = share_link_repository.get_share_link_by_id(session=session, link_id=link_id)
+    if link:
+        invalidate_share_link(link.share_token)
     share_link_repository.delete_share_link(session=session, link_id=link_id)
-@transactional()
 
 
-def increment_clicks(*, session: Session, link_id: uuid.UUID) -> None:
-    share_link_repository.increment_clicks(session=session, link_id=link_id)
+def record_click(link_id: uuid.UUID) -> bool:
+    return click_buffer.record(link_id)
+
+
+def flush_clicks(*, session: Session) -> int:
+    pending = click_buffer.drain()
+    if not pending:
+        return 0
+    try:
+        share_link_repository.add_clicks(session=session, clicks=pending)
+        session.commit()
+    except Exception:
+        session.rollback()
+        click_buffer.restore(pending)
+        raise
+    click_buffer.record_flush(pending)
+    return len(pending)
+
+
+async def get_share_link_by_token_async(*, session: AsyncSession, token: str) -> ShareLink:
+    return await async_share_link_repository.get_share_link_by_token(session=session, token=token)
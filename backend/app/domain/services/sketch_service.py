@@ -0,0 +1,256 @@
+import math
+import random
+import uuid
+from collections import defaultdict
+from typing import Iterable, Optional
+import numpy as np
+from sqlmodel import Session
+from ...core.config import settings
+from ...core.sketches import HyperLogLog, TDigest
+from ...core.transaction import transactional
+from ...models.question import AnswerEnum, Question
+from ...models.results import ApproximateResults, ApproximateQuestionResults, Estimate, ValueEstimate
+from ...models.survey import Survey
+from ..repositories import answer_repository, question_repository, results_repository, sketch_repository, survey_repository
+from .aggregate_service import CHOICE_TYPES, NUMERIC_TYPES, TOTAL_KEY, get_survey_aggregates, numeric_value
+from .analytics_service import CONFIDENCE_LEVEL, STATISTICS_PERCENTILES, Z_CRITICAL, crosstab_labels, load_numeric_values
+
+DISTINCT_TYPES = {AnswerEnum.open, AnswerEnum.email, AnswerEnum.number, AnswerEnum.date}
+DIGEST_TYPES = NUMERIC_TYPES
+SKETCHED_TYPES = DISTINCT_TYPES | DIGEST_TYPES
+
+
+def reservoir_slots(
+    *,
+    submission_ids: list[uuid.UUID],
+    submission_count: int,
+    size: int,
+    random_index=random.randrange
+) -> dict[int, uuid.UUID]:
+    slots = {}
+    first = submission_count - len(submission_ids)
+    for offset, submission_id in enumerate(submission_ids):
+        seen = first + offset
+        slot = seen if seen < size else random_index(seen + 1)
+        if slot < size:
+            slots[slot] = submission_id
+    return slots
+
+
+def build_sketch_row(
+    question_id: uuid.UUID,
+    answer_type: AnswerEnum,
+    stored: tuple[int, Optional[bytes], Optional[bytes]],
+    responses: list[str]
+) -> dict:
+    count, distinct, digest = stored
+    hyperloglog = HyperLogLog(settings.SKETCH_HLL_PRECISION, distinct) if answer_type in DISTINCT_TYPES else None
+    tdigest = None
+    if answer_type in DIGEST_TYPES:
+        tdigest = (
+            TDigest.from_bytes(settings.SKETCH_DIGEST_COMPRESSION, digest)
+            if digest else TDigest(settings.SKETCH_DIGEST_COMPRESSION)
+        )
+    if hyperloglog:
+        for response in set(responses):
+            hyperloglog.add(response)
+    if tdigest:
+        for response in responses:
+            value = numeric_value(response)
+            if value is not None:
+                tdigest.add(value)
+    return {
+        "question_id": question_id,
+        "count": count + len(responses),
+        "hyperloglog": hyperloglog.to_bytes() if hyperloglog else None,
+        "tdigest": tdigest.to_bytes() if tdigest else None
+    }
+
+
+def update_sketches(
+    *,
+    session: Session,
+    survey_id: uuid.UUID,
+    submission_count: int,
+    submission_ids: list[uuid.UUID],
+    answer_types: dict[uuid.UUID, AnswerEnum],
+    answers: Iterable[tuple[uuid.UUID, str]]
+) -> None:
+    slots = reservoir_slots(
+        submission_ids=submission_ids,
+        submission_count=submission_count,
+        size=settings.SAMPLE_RESERVOIR_SIZE
+    )
+    sketch_repository.save_sample_slots(
+        session=session,
+        rows=[
+            {"survey_id": survey_id, "slot": slot, "submission_id": submission_id}
+            for slot, submission_id in sorted(slots.items())
+        ]
+    )
+    responses = defaultdict(list)
+    for question_id, response in answers:
+        if response and answer_types.get(question_id) in SKETCHED_TYPES:
+            responses[question_id].append(response)
+    if not responses:
+        return
+    stored = sketch_repository.get_question_sketches(session=session, question_ids=sorted(responses))
+    sketch_repository.save_question_sketches(
+        session=session,
+        rows=[
+            build_sketch_row(question_id, answer_types[question_id], stored.get(question_id, (0, None, None)), values)
+            for question_id, values in sorted(responses.items())
+        ]
+    )
+@transactional()
+
+
+def rebuild_survey_sketches(*, session: Session, survey_id: uuid.UUID) -> None:
+    survey_repository.lock_survey(session=session, survey_id=survey_id)
+    sketch_repository.delete_survey_sketches(session=session, survey_id=survey_id)
+    sample = sketch_repository.get_random_submission_ids(
+        session=session,
+        survey_id=survey_id,
+        limit=settings.SAMPLE_RESERVOIR_SIZE
+    )
+    sketch_repository.save_sample_slots(
+        session=session,
+        rows=[
+            {"survey_id": survey_id, "slot": slot, "submission_id": submission_id}
+            for slot, submission_id in enumerate(sample)
+        ]
+    )
+    rows = []
+    for question in question_repository.get_questions_by_survey_id(session=session, survey_id=survey_id):
+        if question.answer_type not in SKETCHED_TYPES:
+            continue
+        responses = list(answer_repository.iter_question_responses(
+            session=session,
+            question_id=question.id,
+            batch_size=settings.SUBMISSION_STREAM_BATCH_SIZE
+        ))
+        if responses:
+            rows.append(build_sketch_row(question.id, question.answer_type, (0, None, None), responses))
+    sketch_repository.save_question_sketches(session=session, rows=rows)
+
+
+def scale_sample_count(count: int, sample_size: int, population: int) -> Estimate:
+    if not sample_size:
+        return Estimate(value=0.0)
+    proportion = count / sample_size
+    error = 0.0
+    if population > 1 and sample_size < population:
+        error = Z_CRITICAL * population * math.sqrt(
+            proportion * (1 - proportion) / sample_size * (population - sample_size) / (population - 1)
+        )
+    return Estimate(value=proportion * population, error=error)
+
+
+def digest_percentiles(digest: TDigest) -> dict[str, Estimate]:
+    percentiles = {}
+    for p in STATISTICS_PERCENTILES:
+        q = p / 100
+        value = digest.quantile(q)
+        spread = digest.rank_error(q)
+        lower = digest.quantile(max(q - spread, 0.0))
+        upper = digest.quantile(min(q + spread, 1.0))
+        percentiles[f"p{p}"] = Estimate(value=value, error=max(value - lower, upper - value))
+    return percentiles
+
+
+def question_results(question: Question, **fields) -> ApproximateQuestionResults:
+    return ApproximateQuestionResults(
+        question_id=question.id,
+        content=question.content,
+        position=question.position,
+        answer_type=question.answer_type,
+        **fields
+    )
+
+
+def get_sketched_results(
+    *,
+    session: Session,
+    survey: Survey,
+    questions: list[Question]
+) -> tuple[list[ApproximateQuestionResults], int]:
+    sketches = sketch_repository.get_question_sketches_by_survey_id(session=session, survey_id=survey.id)
+    sample_size = sketch_repository.count_sample(session=session, survey_id=survey.id)
+    choices = {question.id: {choice.position: choice.content for choice in question.choices} for question in questions}
+    answered = defaultdict(int)
+    sampled = defaultdict(lambda: defaultdict(int))
+    for question_id, choice_position, response, count in results_repository.count_sampled_values(
+        session=session,
+        survey_id=survey.id
+    ):
+        answered[question_id] += count
+        label = choices[question_id][choice_position] if choice_position is not None else response
+        sampled[question_id][label] += count
+    results = []
+    for question in questions:
+        count, distinct, digest = sketches.get(question.id, (0, None, None))
+        if question.answer_type in SKETCHED_TYPES:
+            fields = {"total": Estimate(value=count)}
+        else:
+            fields = {"total": scale_sample_count(answered[question.id], sample_size, survey.submission_count)}
+        if question.answer_type in DISTINCT_TYPES:
+            hyperloglog = HyperLogLog(settings.SKETCH_HLL_PRECISION, distinct)
+            estimate = hyperloglog.count() if count else 0.0
+            fields["distinct"] = Estimate(value=estimate, error=Z_CRITICAL * hyperloglog.relative_error * estimate)
+        if question.answer_type in DIGEST_TYPES and digest:
+            fields["percentiles"] = digest_percentiles(TDigest.from_bytes(settings.SKETCH_DIGEST_COMPRESSION, digest))
+        if question.answer_type in CHOICE_TYPES:
+            counts = sampled[question.id]
+            fields["choices"] = [
+                ValueEstimate(value=label, count=scale_sample_count(counts.get(label, 0), sample_size, survey.submission_count))
+                for label in crosstab_labels(question, set(counts))
+            ]
+        results.append(question_results(question, **fields))
+    return results, sample_size
+
+
+def get_exact_results(*, session: Session, survey: Survey, questions: list[Question]) -> list[ApproximateQuestionResults]:
+    aggregates = get_survey_aggregates(session=session, survey_id=survey.id)
+    distinct = dict(results_repository.count_distinct_responses(
+        session=session,
+        question_ids=[question.id for question in questions if question.answer_type in DISTINCT_TYPES]
+    ))
+    arrays = load_numeric_values(session=session, survey_id=survey.id)
+    results = []
+    for question in questions:
+        buckets = dict(aggregates.get(question.id, {}))
+        total = buckets.pop(TOTAL_KEY, None)
+        fields = {"total": Estimate(value=total.count if total else 0)}
+        if question.answer_type in DISTINCT_TYPES:
+            fields["distinct"] = Estimate(value=distinct.get(question.id, 0))
+        values = arrays.get(question.id)
+        if question.answer_type in DIGEST_TYPES and values is not None and len(values):
+            fields["percentiles"] = {
+                f"p{p}": Estimate(value=float(value))
+                for p, value in zip(STATISTICS_PERCENTILES, np.percentile(values, STATISTICS_PERCENTILES))
+            }
+        if question.answer_type in CHOICE_TYPES:
+            counts = {key: bucket.count for key, bucket in buckets.items()}
+            fields["choices"] = [
+                ValueEstimate(value=label, count=Estimate(value=counts.get(label, 0)))
+                for label in crosstab_labels(question, set(counts))
+            ]
+        results.append(question_results(question, **fields))
+    return results
+
+
+def get_approximate_results(*, session: Session, survey: Survey, exact: bool = False) -> ApproximateResults:
+    questions = question_repository.get_questions_with_choices_by_survey_id(session=session, survey_id=survey.id)
+    if exact:
+        results = get_exact_results(session=session, survey=survey, questions=questions)
+        sample_size = survey.submission_count
+    else:
+        results, sample_size = get_sketched_results(session=session, survey=survey, questions=questions)
+    return ApproximateResults(
+        survey_id=survey.id,
+        submission_count=survey.submission_count,
+        exact=exact,
+        sample_size=sample_size,
+        confidence_level=CONFIDENCE_LEVEL,
+        questions=results
+    )
@@ -1,15 +1,29 @@
 from sqlmodel import Session
-from ...models.submission import SubmissionCreate, Submission
-from ...models.submission_fingerprint import SubmissionFingerprint
-from .answer_service import submit_answers, validate_answers_creation
-from ...core.transaction import transactional
+from ...models.submission import (
+    SubmissionCreate,
+    Submission,
+    SubmissionPublic,
+    SubmissionPage,
+    BulkSubmissionItemResult,
+    BulkSubmissionResult
+)
+from ...models.answer import AnswerPublic
+from ...models.survey import Survey
+from .answer_service import submit_answers, build_answer_rows, get_survey_validator
+from .aggregate_service import update_aggregates
+from .search_service import index_submission_answers
+from .sketch_service import update_sketches
+from .rollup_service import record_submissions
+from . import share_link_service, fingerprint_service
+from ..repositories import answer_repository
 from ..repositories import submission_repository
-from ..services.question_service import get_questions_by_survey_id
 from fastapi import HTTPException
-from ...core.exceptions import SurveyModifiedException
+from ...core.exceptions import SurveyModifiedException, ApplicationException, CouldNotCreateResource, BadRequestError
+from ...core.config import settings
 import uuid
-import hashlib
-from typing import Optional
+import base64
+from itertools import groupby
+from typing import Iterator, Optional
 from datetime import datetime, timedelta
 
 
@@ -24,15 +38,10 @@ def check_already_submitted(
         return False
     if not survey.prevent_duplicates:
         return False
-    if fingerprint_data.get('fingerprint_advanced'):
-        fingerprint_string = f"{fingerprint_data['fingerprint_advanced']}|{fingerprint_data['survey_id']}"
-    else:
-        fingerprint_string = f"{fingerprint_data['ip']}|{fingerprint_data['user_agent']}|{fingerprint_data['survey_id']}"
-    fingerprint_hash = hashlib.sha256(fingerprint_string.encode()).hexdigest()
-    return submission_repository.check_fingerprint_exists(
+    return fingerprint_service.fingerprint_exists(
         session=session,
-        survey_id=survey_id,
-        fingerprint_hash=fingerprint_hash
+        survey=survey,
+        fingerprint_hash=fingerprint_service.fingerprint_hash(fingerprint_data)
     )
 
 
@@ -40,7 +49,8 @@ def submit_submission(
     *,
     session: Session,
     submission_create: SubmissionCreate,
-    fingerprint_data: dict
+    fingerprint_data: dict,
+    share_link: Optional[share_link_service.CachedShareLink] = None
 ):
     try:
         survey = submission_repository.get_survey_by_id(
@@ -54,47 +64,56 @@ def submit_submission(
                 status_code=410,
                 detail="Ta ankieta wygasła i nie można już jej wypełnić"
             )
-        questions = get_questions_by_survey_id(session=session, survey_id=submission_create.survey_id)
-        validate_answers_creation(
-            answers_create=submission_create.answers,
-            questions=questions
-        )
-        if survey.prevent_duplicates:
-            if fingerprint_data.get('fingerprint_advanced'):
-                fingerprint_string = f"{fingerprint_data['fingerprint_advanced']}|{fingerprint_data['survey_id']}"
-            else:
-                fingerprint_string = f"{fingerprint_data['ip']}|{fingerprint_data['user_agent']}|{fingerprint_data['survey_id']}"
-            fingerprint_hash = hashlib.sha256(fingerprint_string.encode()).hexdigest()
-            if submission_repository.check_fingerprint_exists(
-                session=session,
-                survey_id=submission_create.survey_id,
-                fingerprint_hash=fingerprint_hash
-            ):
-                raise HTTPException(
-                    status_code=409,
-                    detail="Już wypełniłeś tę ankietę. Wielokrotne przesyłanie jest zablokowane."
-                )
-            new_fingerprint = SubmissionFingerprint(
-                survey_id=submission_create.survey_id,
-                fingerprint_hash=fingerprint_hash
+        if survey.status != 'public' and share_link is None:
+            raise HTTPException(
+                status_code=403,
+                detail="Ta ankieta jest dostępna tylko przez link udostępniający"
             )
-            submission_repository.create_fingerprint(session=session, fingerprint=new_fingerprint)
-            session.commit()
+        validator = get_survey_validator(session=session, survey=survey)
+        validator.validate(submission_create.answers)
+        if survey.prevent_duplicates and not fingerprint_service.claim_fingerprint(
+            session=session,
+            survey_id=survey.id,
+            fingerprint_hash=fingerprint_service.fingerprint_hash(fingerprint_data)
+        ):
+            raise HTTPException(
+                status_code=409,
+                detail="Już wypełniłeś tę ankietę. Wielokrotne przesyłanie jest zablokowane."
+            )
+        if share_link:
+            share_link_service.consume_response(session=session, share_link=share_link)
         submission = Submission.model_validate(
-            submission_create.model_dump(exclude={"answers"})
+            submission_create.model_dump(exclude={"answers", "share_token", "share_password"})
         )
         created_submission = submission_repository.create_submission(session=session, submission=submission)
         answers = submission_create.answers
         submit_answers(
             session=session,
             answers_create=answers,
-            submission_id=created_submission.id
+            submission_id=created_submission.id,
+            validator=validator
+        )
+        index_submission_answers(
+            session=session,
+            answer_types=validator.answer_types,
+            submission_ids=[created_submission.id]
+        )
+        record_submissions(session=session, survey_id=survey.id, created_at=created_submission.created_at)
+        responses = [(answer.question_id, validator.response_text(answer)) for answer in answers]
+        update_aggregates(
+            session=session,
+            answer_types=validator.answer_types,
+            answers=responses
+        )
+        submission_count = submission_repository.increment_submission_count(session=session, survey_id=survey.id)
+        update_sketches(
+            session=session,
+            survey_id=survey.id,
+            submission_count=submission_count,
+            submission_ids=[created_submission.id],
+            answer_types=validator.answer_types,
+            answers=responses
         )
-        survey.submission_count += 1
-        if survey.submission_count == 1:
-            survey.is_locked = True
-            survey.locked_at = datetime.utcnow()
-        session.add(survey)
         session.commit()
         return created_submission
     except (HTTPException, SurveyModifiedException):
@@ -102,8 +121,141 @@ def submit_submission(
     except Exception as e:
         session.rollback()
         raise
-@transactional()
+
+
+def submit_submissions_bulk(
+    *,
+    session: Session,
+    survey: Survey,
+    submissions_create: list[SubmissionCreate]
+) -> BulkSubmissionResult:
+    if survey.status == 'expired':
+        raise HTTPException(
+            status_code=410,
+            detail="Ta ankieta wygasła i nie można już jej wypełnić"
+        )
+    if len(submissions_create) > settings.BULK_SUBMISSION_MAX_ITEMS:
+        raise CouldNotCreateResource(
+            f"Jednorazowo można przesłać maksymalnie {settings.BULK_SUBMISSION_MAX_ITEMS} odpowiedzi"
+        )
+    validator = get_survey_validator(session=session, survey=survey)
+    created_at = datetime.utcnow()
+    results = []
+    submissions = []
+    answers = []
+    responses = []
+    for index, submission_create in enumerate(submissions_create):
+        try:
+            if submission_create.survey_id != survey.id:
+                raise CouldNotCreateResource("Odpowiedź dotyczy innej ankiety")
+            validator.validate(submission_create.answers)
+        except ApplicationException as e:
+            results.append(BulkSubmissionItemResult(index=index, accepted=False, error=e.message))
+            continue
+        submission_id = uuid.uuid4()
+        submissions.append({"id": submission_id, "survey_id": survey.id, "created_at": created_at})
+        answers.extend(build_answer_rows(submission_create.answers, submission_id, validator))
+        responses.extend((answer.question_id, validator.response_text(answer)) for answer in submission_create.answers)
+        results.append(BulkSubmissionItemResult(index=index, accepted=True, submission_id=submission_id))
+    if submissions:
+        try:
+            submission_repository.insert_submissions(session=session, rows=submissions)
+            answer_repository.insert_answers(session=session, rows=answers)
+            index_submission_answers(
+                session=session,
+                answer_types=validator.answer_types,
+                submission_ids=[submission["id"] for submission in submissions]
+            )
+            record_submissions(
+                session=session,
+                survey_id=survey.id,
+                created_at=created_at,
+                count=len(submissions)
+            )
+            update_aggregates(
+                session=session,
+                answer_types=validator.answer_types,
+                answers=responses
+            )
+            submission_count = submission_repository.increment_submission_count(
+                session=session,
+                survey_id=survey.id,
+                count=len(submissions)
+            )
+            update_sketches(
+                session=session,
+                survey_id=survey.id,
+                submission_count=submission_count,
+                submission_ids=[submission["id"] for submission in submissions],
+                answer_types=validator.answer_types,
+                answers=responses
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+    return BulkSubmissionResult(
+        accepted=len(submissions),
+        rejected=len(results) - len(submissions),
+        results=results
+    )
 
 
 def get_survey_submissions(*, session: Session, survey_id: uuid.UUID):
     return submission_repository.get_all_survey_submissions(session=session, survey_id=survey_id)
+
+
+def encode_submission_cursor(submission: Submission) -> str:
+    return base64.urlsafe_b64encode(f"{submission.created_at.isoformat()}|{submission.id}".encode()).decode()
+
+
+def decode_submission_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        created_at, submission_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(submission_id)
+    except ValueError:
+        raise BadRequestError("Nieprawidłowy kursor stronicowania")
+
+
+def get_survey_submissions_page(
+    *,
+    session: Session,
+    survey_id: uuid.UUID,
+    limit: int,
+    cursor: Optional[str] = None
+) -> SubmissionPage:
+    submissions = submission_repository.get_survey_submissions_page(
+        session=session,
+        survey_id=survey_id,
+        limit=limit + 1,
+        after=decode_submission_cursor(cursor) if cursor else None
+    )
+    items = submissions[:limit]
+    next_cursor = encode_submission_cursor(items[-1]) if len(submissions) > limit else None
+    return SubmissionPage(items=items, next_cursor=next_cursor)
+
+
+def iter_survey_submission_answers(
+    *,
+    session: Session,
+    survey_id: uuid.UUID
+) -> Iterator[tuple[uuid.UUID, datetime, list[tuple[uuid.UUID, str]]]]:
+    rows = submission_repository.iter_survey_submission_answers(
+        session=session,
+        survey_id=survey_id,
+        batch_size=settings.SUBMISSION_STREAM_BATCH_SIZE
+    )
+    for (submission_id, created_at), answers in groupby(rows, key=lambda row: (row[0], row[1])):
+        yield submission_id, created_at, [
+            (question_id, response) for _, _, question_id, response in answers if question_id is not None
+        ]
+
+
+def stream_survey_submissions(*, session: Session, survey_id: uuid.UUID) -> Iterator[SubmissionPublic]:
+    for submission_id, created_at, answers in iter_survey_submission_answers(session=session, survey_id=survey_id):
+        yield SubmissionPublic(
+            id=submission_id,
+            survey_id=survey_id,
+            created_at=created_at,
+            answers=[AnswerPublic(question_id=question_id, response=response) for question_id, response in answers]
+        )
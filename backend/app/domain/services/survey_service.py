@@ -5,6 +5,8 @@ from ...core.transaction import transactional
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from ...core.exceptions import AccessDeniedError
+from .answer_service import invalidate_survey_validator
+from .survey_snapshot_service import invalidate_survey_snapshot
 import uuid 
 @transactional(refresh_returned_instance=True)
 
@@ -58,6 +60,8 @@ def update_survey_last_updated(*, session: Session, survey_id: uuid.UUID):
 
 def delete_survey(*, session: Session, survey_id: uuid.UUID) -> None:
     survey_repository.delete_survey(session=session, survey_id=survey_id)
+    invalidate_survey_validator(survey_id)
+    invalidate_survey_snapshot(survey_id)
 @transactional(refresh_returned_instance=True)
 
 
@@ -66,6 +70,8 @@ def update_survey_status(*, session: Session, survey_id: uuid.UUID, new_status:
     survey.status = new_status
     survey.last_updated = datetime.now(timezone.utc)
     session.add(survey)
+    invalidate_survey_validator(survey_id)
+    invalidate_survey_snapshot(survey_id)
     return survey
 @transactional()
 
@@ -0,0 +1,107 @@
+import hashlib
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from fastapi import Response
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ...core.cache import LRUCache, RedisCache
+from ...core.config import settings
+from ...models.survey import Survey, SurveyPublic, StatusEnum
+from ..repositories import survey_repository, async_survey_repository
+
+SNAPSHOT_CACHE_CONTROL = "no-cache"
+
+
+@dataclass(frozen=True)
+class SurveySnapshot:
+    version: str
+    etag: str
+    body: bytes
+
+    def to_bytes(self) -> bytes:
+        return f"{self.version}\n{self.etag}\n".encode() + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SurveySnapshot":
+        version, etag, body = data.split(b"\n", 2)
+        return cls(version=version.decode(), etag=etag.decode(), body=body)
+
+
+survey_snapshot_cache = LRUCache(max_size=settings.SURVEY_SNAPSHOT_CACHE_SIZE, ttl=settings.SURVEY_SNAPSHOT_CACHE_TTL)
+shared_snapshot_cache = (
+    RedisCache(settings.CACHE_REDIS_URL, prefix="survey-snapshot", ttl=settings.SURVEY_SNAPSHOT_CACHE_TTL)
+    if settings.CACHE_REDIS_URL else None
+)
+
+
+def snapshot_version(last_updated: datetime, status: StatusEnum) -> str:
+    return f"{last_updated.isoformat()}|{status.value}"
+
+
+def get_cached_snapshot(survey_id: uuid.UUID, version: str) -> Optional[SurveySnapshot]:
+    snapshot = survey_snapshot_cache.get(survey_id)
+    if snapshot is None and shared_snapshot_cache is not None:
+        data = shared_snapshot_cache.get(survey_id)
+        if data is not None:
+            snapshot = SurveySnapshot.from_bytes(data)
+            survey_snapshot_cache.set(survey_id, snapshot)
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    return None
+
+
+def store_snapshot(survey: Survey, version: str) -> SurveySnapshot:
+    body = SurveyPublic.model_validate(survey).model_dump_json().encode()
+    snapshot = SurveySnapshot(version=version, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"', body=body)
+    survey_snapshot_cache.set(survey.id, snapshot)
+    if shared_snapshot_cache is not None:
+        shared_snapshot_cache.set(survey.id, snapshot.to_bytes())
+    return snapshot
+
+
+def invalidate_survey_snapshot(survey_id: uuid.UUID) -> None:
+    survey_snapshot_cache.delete(survey_id)
+    if shared_snapshot_cache is not None:
+        shared_snapshot_cache.delete(survey_id)
+
+
+def get_survey_snapshot(*, session: Session, survey_id: uuid.UUID, public_only: bool = False) -> Optional[SurveySnapshot]:
+    row = survey_repository.get_survey_version(session=session, survey_id=survey_id)
+    if row is None or (public_only and row[1] != StatusEnum.public):
+        return None
+    version = snapshot_version(*row)
+    snapshot = get_cached_snapshot(survey_id, version)
+    if snapshot is None:
+        survey = survey_repository.get_survey_tree(session=session, survey_id=survey_id)
+        if survey is None:
+            return None
+        snapshot = store_snapshot(survey, snapshot_version(survey.last_updated, survey.status))
+    return snapshot
+
+
+async def get_survey_snapshot_async(*, session: AsyncSession, survey_id: uuid.UUID) -> Optional[SurveySnapshot]:
+    row = await async_survey_repository.get_survey_version(session=session, survey_id=survey_id)
+    if row is None:
+        return None
+    version = snapshot_version(*row)
+    snapshot = get_cached_snapshot(survey_id, version)
+    if snapshot is None:
+        survey = await async_survey_repository.get_survey_by_id(session=session, survey_id=survey_id)
+        snapshot = store_snapshot(survey, snapshot_version(survey.last_updated, survey.status))
+    return snapshot
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def snapshot_response(snapshot: SurveySnapshot, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": snapshot.etag, "Cache-Control": SNAPSHOT_CACHE_CONTROL}
+    if etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
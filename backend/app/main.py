@@ -1,4 +1,4 @@
-from .api.v1 import auth, question, submission, user, share_link, survey_template, gdpr
+from .api.v1 import auth, question, submission, user, share_link, survey_template, gdpr, metrics, results
 from .core.config import settings
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -6,20 +6,56 @@ from fastapi.middleware.cors import CORSMiddleware
 from .api.v1 import survey
 from .core.db import engine
 from . import models
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, Session
 from .core.exceptions import ApplicationException
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from contextlib import asynccontextmanager
+from .commands.compact_rollups import run_compaction
+from .domain.services import share_link_service
+import asyncio
+import logging
 
 limiter = Limiter(key_func=get_remote_address)
+logger = logging.getLogger(__name__)
+
+
+def flush_share_link_clicks():
+    with Session(engine) as session:
+        return share_link_service.flush_clicks(session=session)
+
+
+async def run_periodically(job, interval: float, failure_message: str):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(job)
+        except Exception:
+            logger.exception(failure_message)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    tasks = []
     if settings.ENV != "test":
         SQLModel.metadata.create_all(engine)
+        tasks = [
+            asyncio.create_task(run_periodically(
+                run_compaction,
+                settings.ROLLUP_COMPACTION_INTERVAL_SECONDS,
+                "Scalanie liczników odpowiedzi nie powiodło się"
+            )),
+            asyncio.create_task(run_periodically(
+                flush_share_link_clicks,
+                settings.SHARE_CLICK_FLUSH_INTERVAL_SECONDS,
+                "Zapis kliknięć linków nie powiódł się"
+            ))
+        ]
     yield
+    for task in tasks:
+        task.cancel()
+    if settings.ENV != "test":
+        await asyncio.to_thread(flush_share_link_clicks)
 
 app = FastAPI(
     title="Ankietio API",
@@ -66,6 +102,8 @@ app.include_router(submission.router, prefix="/v1")
 app.include_router(share_link.router, prefix="/v1")
 app.include_router(survey_template.router, prefix="/v1")
 app.include_router(gdpr.router, prefix="/v1")
+app.include_router(metrics.router, prefix="/v1")
+app.include_router(results.router, prefix="/v1")
 @app.get("/")
 
 
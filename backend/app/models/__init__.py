@@ -1,11 +1,15 @@
 from .question import Question, QuestionCreate, QuestionPublic
 from .choice import ChoiceCreate, ChoicePublic
 from .survey import Survey, SurveyPublic
-from .submission import Submission, SubmissionCreate, SubmissionPublic
+from .submission import Submission, SubmissionCreate, SubmissionPublic, SubmissionPage, BulkSubmissionCreate, BulkSubmissionResult
 from .answer import Answer, AnswerCreate, AnswerPublic
 from .share_link import ShareLink, ShareLinkCreate, ShareLinkPublic
 from .survey_template import SurveyTemplate, SurveyTemplateCreate, SurveyTemplatePublic
 from .submission_fingerprint import SubmissionFingerprint
+from .question_aggregate import QuestionAggregate
+from .question_sketch import QuestionSketch
+from .survey_sample import SurveySample
+from .submission_rollup import SubmissionRollup
 from .user import User
 
 User.model_rebuild()
@@ -14,7 +18,9 @@ Answer.model_rebuild()
 AnswerCreate.model_rebuild()
 AnswerPublic.model_rebuild()
 SubmissionCreate.model_rebuild()
+BulkSubmissionCreate.model_rebuild()
 SubmissionPublic.model_rebuild()
+SubmissionPage.model_rebuild()
 Question.model_rebuild()
 QuestionPublic.model_rebuild()
 QuestionCreate.model_rebuild()
@@ -1,6 +1,9 @@
 import uuid
+from datetime import date
 from sqlmodel import SQLModel, Field, Relationship
-from typing import TYPE_CHECKING
+from sqlalchemy import Index, SmallInteger, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
 
     from .submission import Submission
@@ -9,10 +12,12 @@ if TYPE_CHECKING:
 class AnswerBase(SQLModel):
     question_id: uuid.UUID = Field(foreign_key="question.id", primary_key=True)
     response: str
+    choice_id: Optional[uuid.UUID] = None
+    choice_position: Optional[int] = None
 
 
 class AnswerCreate(AnswerBase):
-    pass
+    response: str = ""
 
 
 class AnswerPublic(AnswerBase):
@@ -20,5 +25,16 @@ class AnswerPublic(AnswerBase):
 
 
 class Answer(AnswerBase, table = True):
-    submission_id: uuid.UUID = Field(foreign_key="submission.id", primary_key=True)
+    __table_args__ = (
+        Index("ix_answer_question_id_value_num", "question_id", "value_num"),
+        Index("ix_answer_question_id_value_date", "question_id", "value_date"),
+        Index("ix_answer_question_id_choice_position", "question_id", "choice_position"),
+        Index("ix_answer_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    submission_id: uuid.UUID = Field(foreign_key="submission.id", primary_key=True, index=True)
+    value_num: Optional[float] = None
+    value_date: Optional[date] = None
+    choice_id: Optional[uuid.UUID] = Field(default=None, foreign_key="choice.id")
+    choice_position: Optional[int] = Field(default=None, sa_type=SmallInteger)
+    search_vector: Optional[str] = Field(default=None, sa_type=Text().with_variant(TSVECTOR(), "postgresql"))
     submission: "Submission" = Relationship(back_populates="answers")
@@ -1,5 +1,6 @@
 import uuid
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
 
@@ -16,10 +17,13 @@ class ChoiceCreate(ChoiceBase):
 
 
 class ChoicePublic(ChoiceBase):
-    pass
+    id: uuid.UUID
 
 
 class Choice(ChoiceBase, table=True):
+    __table_args__ = (
+        Index("ix_choice_question_id_position", "question_id", "position"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     question_id: uuid.UUID = Field(foreign_key="question.id")
     question: "Question" = Relationship(back_populates="choices")
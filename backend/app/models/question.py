@@ -1,12 +1,14 @@
 import uuid
 from sqlmodel import SQLModel, Field, Relationship, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional, Dict, Any
 if TYPE_CHECKING:
 
     from .survey import Survey
     from .choice import Choice, ChoiceCreate, ChoicePublic 
+    from .question_aggregate import QuestionAggregate
+    from .question_sketch import QuestionSketch
 
 
 class AnswerEnum(str, Enum):
@@ -39,8 +41,15 @@ class QuestionPublic(QuestionBase):
 
 
 class Question(QuestionBase, table=True):
+    __table_args__ = (
+        Index("ix_question_survey_id_position", "survey_id", "position"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     survey_id: uuid.UUID = Field(foreign_key="survey.id")
     choices: List["Choice"] = Relationship(back_populates="question",
                                            sa_relationship_kwargs={"cascade": "all, delete"})
+    aggregates: List["QuestionAggregate"] = Relationship(back_populates="question",
+                                                        sa_relationship_kwargs={"cascade": "all, delete"})
+    sketch: Optional["QuestionSketch"] = Relationship(back_populates="question",
+                                                      sa_relationship_kwargs={"cascade": "all, delete", "uselist": False})
     survey: "Survey" = Relationship(back_populates="questions")
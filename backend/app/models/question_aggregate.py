@@ -0,0 +1,15 @@
+import uuid
+from sqlmodel import SQLModel, Field, Relationship
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+
+    from .question import Question
+
+
+class QuestionAggregate(SQLModel, table=True):
+    question_id: uuid.UUID = Field(foreign_key="question.id", primary_key=True)
+    key: str = Field(primary_key=True)
+    count: int = Field(default=0)
+    sum: float = Field(default=0.0)
+    sum_squares: float = Field(default=0.0)
+    question: "Question" = Relationship(back_populates="aggregates")
@@ -0,0 +1,14 @@
+import uuid
+from typing import TYPE_CHECKING, Optional
+from sqlmodel import SQLModel, Field, Relationship
+if TYPE_CHECKING:
+
+    from .question import Question
+
+
+class QuestionSketch(SQLModel, table=True):
+    question_id: uuid.UUID = Field(foreign_key="question.id", primary_key=True)
+    count: int = Field(default=0)
+    hyperloglog: Optional[bytes] = None
+    tdigest: Optional[bytes] = None
+    question: "Question" = Relationship(back_populates="sketch")
@@ -0,0 +1,196 @@
+import uuid
+from datetime import date, datetime
+from enum import Enum
+from typing import Optional
+from sqlmodel import SQLModel
+from .question import AnswerEnum
+from .submission_rollup import RollupGranularity
+
+
+class ExportFormat(str, Enum):
+    parquet = "parquet"
+    arrow = "arrow"
+
+
+class ValueCount(SQLModel):
+    value: str
+    count: int
+
+
+class DayCount(SQLModel):
+    day: date
+    count: int
+
+
+class NumberStats(SQLModel):
+    count: int
+    min: float
+    max: float
+    mean: float
+    stddev: float
+    p25: float
+    p50: float
+    p75: float
+    p90: float
+
+
+class QuestionResults(SQLModel):
+    question_id: uuid.UUID
+    content: str
+    position: int
+    answer_type: AnswerEnum
+    total: int
+    choices: Optional[list[ValueCount]] = None
+    histogram: Optional[list[ValueCount]] = None
+    stats: Optional[NumberStats] = None
+    per_day: Optional[list[DayCount]] = None
+
+
+class SurveyResults(SQLModel):
+    survey_id: uuid.UUID
+    submission_count: int
+    questions: list[QuestionResults]
+
+
+class HistogramBin(SQLModel):
+    lower: float
+    upper: float
+    count: int
+
+
+class ConfidenceInterval(SQLModel):
+    level: float
+    lower: float
+    upper: float
+
+
+class NetPromoterScore(SQLModel):
+    score: float
+    promoters: int
+    passives: int
+    detractors: int
+
+
+class QuestionStatistics(SQLModel):
+    question_id: uuid.UUID
+    content: str
+    position: int
+    answer_type: AnswerEnum
+    count: int
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    stddev: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: dict[str, float] = {}
+    confidence_interval: Optional[ConfidenceInterval] = None
+    histogram: list[HistogramBin] = []
+    nps: Optional[NetPromoterScore] = None
+
+
+class SurveyStatistics(SQLModel):
+    survey_id: uuid.UUID
+    questions: list[QuestionStatistics]
+
+
+class CrossTabFilter(SQLModel):
+    question_id: uuid.UUID
+    values: list[str]
+
+
+class CrossTabRequest(SQLModel):
+    row_question_id: uuid.UUID
+    column_question_id: uuid.UUID
+    filters: list[CrossTabFilter] = []
+
+
+class ChiSquareTest(SQLModel):
+    statistic: float
+    degrees_of_freedom: int
+    p_value: float
+
+
+class CrossTab(SQLModel):
+    row_question_id: uuid.UUID
+    column_question_id: uuid.UUID
+    rows: list[str]
+    columns: list[str]
+    counts: list[list[int]]
+    total: int
+    chi_square: Optional[ChiSquareTest] = None
+
+
+class SearchHighlight(SQLModel):
+    text: str
+    match: bool
+
+
+class SearchHit(SQLModel):
+    submission_id: uuid.UUID
+    created_at: datetime
+    response: str
+    rank: float
+    highlights: list[SearchHighlight]
+
+
+class SearchPage(SQLModel):
+    items: list[SearchHit]
+    next_cursor: Optional[str] = None
+
+
+class TermFrequency(SQLModel):
+    term: str
+    count: int
+    error: int
+
+
+class TermSummary(SQLModel):
+    question_id: uuid.UUID
+    response_count: int
+    token_count: int
+    terms: list[TermFrequency]
+    bigrams: list[TermFrequency]
+
+
+class Estimate(SQLModel):
+    value: float
+    error: float = 0.0
+
+
+class ValueEstimate(SQLModel):
+    value: str
+    count: Estimate
+
+
+class ApproximateQuestionResults(SQLModel):
+    question_id: uuid.UUID
+    content: str
+    position: int
+    answer_type: AnswerEnum
+    total: Estimate
+    distinct: Optional[Estimate] = None
+    percentiles: dict[str, Estimate] = {}
+    choices: list[ValueEstimate] = []
+
+
+class ApproximateResults(SQLModel):
+    survey_id: uuid.UUID
+    submission_count: int
+    exact: bool
+    sample_size: int
+    confidence_level: float
+    questions: list[ApproximateQuestionResults]
+
+
+class TimelinePoint(SQLModel):
+    bucket_start: datetime
+    count: int
+
+
+class SubmissionTimeline(SQLModel):
+    survey_id: uuid.UUID
+    granularity: RollupGranularity
+    start: datetime
+    end: datetime
+    total: int
+    points: list[TimelinePoint]
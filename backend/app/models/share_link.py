@@ -15,22 +15,27 @@ def generate_share_token() -> str:
 class ShareLinkBase(SQLModel):
     is_active: bool = Field(default=True)
     max_responses: Optional[int] = None
-    password: Optional[str] = None
     expires_at: Optional[datetime] = None
 
 
 class ShareLinkCreate(ShareLinkBase):
-    pass
+    password: Optional[str] = None
 
 
 class ShareLink(ShareLinkBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    survey_id: uuid.UUID = Field(foreign_key="survey.id")
+    survey_id: uuid.UUID = Field(foreign_key="survey.id", index=True)
     share_token: str = Field(default_factory=generate_share_token, unique=True, index=True)
     created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
     clicks: int = Field(default=0)
+    response_count: int = Field(default=0)
+    password_hash: Optional[str] = None
     survey: "Survey" = Relationship(back_populates="share_links")
 
+    @property
+    def has_password(self) -> bool:
+        return self.password_hash is not None
+
 
 class ShareLinkPublic(ShareLinkBase):
     id: uuid.UUID
@@ -38,3 +43,5 @@ class ShareLinkPublic(ShareLinkBase):
     share_token: str
     created_at: datetime
     clicks: int
+    response_count: int
+    has_password: bool
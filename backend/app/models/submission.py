@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 if TYPE_CHECKING:
 
     from .answer import AnswerCreate, Answer, AnswerPublic
@@ -14,6 +15,8 @@ class SubmissionBase(SQLModel):
 class SubmissionCreate(SubmissionBase):
     answers: list["AnswerCreate"]
     fingerprint_advanced: Optional[str] = None
+    share_token: Optional[str] = None
+    share_password: Optional[str] = None
 
 
 class SubmissionPublic(SubmissionBase):
@@ -22,7 +25,32 @@ class SubmissionPublic(SubmissionBase):
     answers: list["AnswerPublic"]
 
 
+class SubmissionPage(SQLModel):
+    items: list[SubmissionPublic]
+    next_cursor: Optional[str] = None
+
+
+class BulkSubmissionCreate(SQLModel):
+    submissions: list[SubmissionCreate]
+
+
+class BulkSubmissionItemResult(SQLModel):
+    index: int
+    accepted: bool
+    submission_id: Optional[uuid.UUID] = None
+    error: Optional[str] = None
+
+
+class BulkSubmissionResult(SQLModel):
+    accepted: int
+    rejected: int
+    results: list[BulkSubmissionItemResult]
+
+
 class Submission(SubmissionBase, table = True):
+    __table_args__ = (
+        Index("ix_submission_survey_id_created_at_id", "survey_id", "created_at", "id"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
     answers: list["Answer"] = Relationship(back_populates="submission")
@@ -1,10 +1,14 @@
 import uuid
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from datetime import datetime
 
 
 class SubmissionFingerprint(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_submissionfingerprint_survey_id_hash", "survey_id", "fingerprint_hash", unique=True),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    survey_id: uuid.UUID = Field(foreign_key="survey.id", index=True)
-    fingerprint_hash: str = Field(max_length=64, index=True)
+    survey_id: uuid.UUID = Field(foreign_key="survey.id")
+    fingerprint_hash: str = Field(max_length=64)
     submitted_at: datetime = Field(default_factory=lambda: datetime.utcnow())
@@ -0,0 +1,26 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING
+from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
+if TYPE_CHECKING:
+
+    from .survey import Survey
+
+
+class RollupGranularity(str, Enum):
+    minute = "minute"
+    hour = "hour"
+    day = "day"
+
+
+class SubmissionRollup(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_submissionrollup_granularity_bucket_start", "granularity", "bucket_start"),
+    )
+    survey_id: uuid.UUID = Field(foreign_key="survey.id", primary_key=True)
+    granularity: RollupGranularity = Field(primary_key=True)
+    bucket_start: datetime = Field(primary_key=True)
+    count: int = Field(default=0)
+    survey: "Survey" = Relationship(back_populates="rollups")
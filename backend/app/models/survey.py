@@ -1,5 +1,6 @@
 import uuid
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from enum import Enum
@@ -8,6 +9,8 @@ if TYPE_CHECKING:
     from .user import User
     from .question import Question, QuestionPublic
     from .share_link import ShareLink
+    from .survey_sample import SurveySample
+    from .submission_rollup import SubmissionRollup
 
 
 class StatusEnum(str, Enum):
@@ -27,12 +30,15 @@ class SurveyCreate(SurveyBase):
 
 
 class Survey(SurveyBase, table = True):
+    __table_args__ = (
+        Index("ix_survey_status_expires_at", "status", "expires_at"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime
     expires_at: datetime
     last_updated: datetime
     status: StatusEnum = Field(default=StatusEnum.private)
-    user_id: uuid.UUID = Field(foreign_key="user.id")
+    user_id: uuid.UUID = Field(foreign_key="user.id", index=True)
     submission_count: int = Field(default=0)
     is_locked: bool = Field(default=False)
     locked_at: Optional[datetime] = None
@@ -45,6 +51,14 @@ class Survey(SurveyBase, table = True):
                                             back_populates="survey",
                                             sa_relationship_kwargs={"cascade": "all, delete"}
                                             )
+    samples: list["SurveySample"] = Relationship(
+                                            back_populates="survey",
+                                            sa_relationship_kwargs={"cascade": "all, delete"}
+                                            )
+    rollups: list["SubmissionRollup"] = Relationship(
+                                            back_populates="survey",
+                                            sa_relationship_kwargs={"cascade": "all, delete"}
+                                            )
 
 
 class SurveyPublic(SurveyBase):
@@ -0,0 +1,13 @@
+import uuid
+from typing import TYPE_CHECKING
+from sqlmodel import SQLModel, Field, Relationship
+if TYPE_CHECKING:
+
+    from .survey import Survey
+
+
+class SurveySample(SQLModel, table=True):
+    survey_id: uuid.UUID = Field(foreign_key="survey.id", primary_key=True)
+    slot: int = Field(primary_key=True)
+    submission_id: uuid.UUID
+    survey: "Survey" = Relationship(back_populates="samples")
@@ -1,6 +1,6 @@
 import uuid
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index
 from datetime import datetime
 from typing import Optional, List, Any
 from enum import Enum
@@ -29,6 +29,10 @@ class SurveyTemplateCreate(SurveyTemplateBase):
 
 
 class SurveyTemplate(SurveyTemplateBase, table=True):
+    __table_args__ = (
+        Index("ix_surveytemplate_user_id_created_at", "user_id", "created_at"),
+        Index("ix_surveytemplate_is_public_usage_count", "is_public", "usage_count"),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: Optional[uuid.UUID] = Field(foreign_key="user.id", default=None)
     created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
@@ -5,13 +5,16 @@ os.environ["DATABASE_URL"] = "sqlite://"
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import SQLModel, Session, create_engine
-from sqlalchemy.pool import StaticPool
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.api.authenticate_user import get_current_user
 from app.main import app
-from app.core.db import get_session
+from app.core.db import get_session, get_async_session
 from app.models import *
 from app.api.v1 import survey as survey_api
+from app.api.v1 import submission as submission_api
 from app.core.password_hashing import hash_password
 from app.models.survey import StatusEnum
 
@@ -22,11 +25,15 @@ from app.domain.policies import survey_owner_required
 
 
 @pytest.fixture(scope="function")
-def client():
+def client(tmp_path):
+    database = tmp_path / "test.db"
     engine = create_engine(
-        "sqlite://",
+        f"sqlite:///{database}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+    )
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database}",
+        poolclass=NullPool,
     )
     SQLModel.metadata.create_all(engine)
     
@@ -34,14 +41,21 @@ def client():
         with Session(engine) as session:
             yield session
 
+    async def override_get_async_session():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
     
+    submission_api.limiter.reset()
     test_client = TestClient(app)
     test_client.engine = engine 
 
     yield test_client
 
     app.dependency_overrides.clear()
+    engine.dispose()
 
 
 @pytest.fixture
@@ -0,0 +1,479 @@
+def test_get_survey_results(client, authenticated_user):
+    survey_id = client.post(
+        "/v1/survey/",
+        json={
+            "name": "Results survey",
+            "prevent_duplicates": False
+        }
+    ).json()["id"]
+    question_id = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {
+                "content": "Tak czy nie?",
+                "position": 0,
+                "answer_type": "close",
+                "choices": [
+                    {"position": 0, "content": "Tak"},
+                    {"position": 1, "content": "Nie"}
+                ]
+            }
+        ]
+    ).json()[0]["id"]
+    client.patch(f"/v1/survey/{survey_id}/status", json={"status": "public"})
+    for response in ["Tak", "Tak", "Nie"]:
+        client.post(
+            "/v1/submissions/",
+            json={"survey_id": survey_id, "answers": [{"question_id": question_id, "response": response}]}
+        )
+
+    response = client.get(f"/v1/results/{survey_id}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["submission_count"] == 3
+    assert data["questions"][0]["choices"] == [{"value": "Tak", "count": 2}, {"value": "Nie", "count": 1}]
+
+
+def test_get_survey_results_requires_owner(client):
+    import uuid
+
+    response = client.get(f"/v1/results/{uuid.uuid4()}")
+
+    assert response.status_code == 401
+
+
+def test_export_survey_csv_has_one_column_per_question(client, authenticated_user):
+    import csv
+    import io
+
+    survey_id = client.post("/v1/survey/", json={"name": "Eksport", "prevent_duplicates": False}).json()["id"]
+    questions = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {"content": "Uwagi, sugestie", "position": 0, "answer_type": "open"},
+            {
+                "content": "Kolor",
+                "position": 1,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "Żółty"}, {"position": 1, "content": "Biały"}]
+            },
+            {
+                "content": "Kolor",
+                "position": 2,
+                "answer_type": "multiple",
+                "choices": [{"position": 0, "content": "Czarny"}, {"position": 1, "content": "Zielony"}]
+            }
+        ]
+    ).json()
+    open_id, close_id, multiple_id = (question["id"] for question in questions)
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [
+                {"question_id": open_id, "response": "linia 1\nlinia 2"},
+                {"question_id": close_id, "response": "Żółty"},
+                {"question_id": multiple_id, "response": "Czarny"}
+            ]},
+            {"survey_id": survey_id, "answers": [
+                {"question_id": open_id, "response": ""},
+                {"question_id": close_id, "response": "Biały"},
+                {"question_id": multiple_id, "choice_position": 1}
+            ]}
+        ]}
+    )
+
+    response = client.get(f"/v1/results/{survey_id}/export.csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert f"ankieta-{survey_id}.csv" in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0] == ["submission_id", "created_at", "1. Uwagi, sugestie", "2. Kolor", "3. Kolor"]
+    assert sorted(row[2:] for row in rows[1:]) == [["", "Biały", "Zielony"], ["linia 1\nlinia 2", "Żółty", "Czarny"]]
+
+
+def create_typed_survey(client, name):
+    survey_id = client.post("/v1/survey/", json={"name": name, "prevent_duplicates": False}).json()["id"]
+    questions = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {"content": "Wiek", "position": 0, "answer_type": "number"},
+            {"content": "Data", "position": 1, "answer_type": "date"},
+            {
+                "content": "Kolor",
+                "position": 2,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "Żółty"}, {"position": 1, "content": "Biały"}]
+            }
+        ]
+    ).json()
+    ids = [question["id"] for question in questions]
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [
+                {"question_id": ids[0], "response": age},
+                {"question_id": ids[1], "response": day},
+                {"question_id": ids[2], "response": color}
+            ]}
+            for age, day, color in [("31", "2025-03-01", "Żółty"), ("abc", "2025-03-02", "Biały"), ("4.5", "", "Żółty")]
+        ]}
+    )
+    return survey_id
+
+
+def test_export_survey_answers_as_parquet_and_arrow(client, authenticated_user):
+    import io
+    from datetime import date
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    survey_id = create_typed_survey(client, "Eksport kolumnowy")
+
+    parquet = client.get(f"/v1/results/{survey_id}/export")
+    arrow = client.get(f"/v1/results/{survey_id}/export", params={"format": "arrow"})
+
+    assert parquet.status_code == 200
+    assert parquet.headers["content-type"] == "application/vnd.apache.parquet"
+    assert arrow.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pq.read_table(io.BytesIO(parquet.content))
+    assert table.equals(pa.ipc.open_stream(arrow.content).read_all().cast(table.schema))
+    assert table.num_rows == 9
+    assert table.schema.field("value_number").type == pa.float64()
+    assert table.schema.field("value_date").type == pa.date32()
+    assert pa.types.is_dictionary(table.schema.field("value_choice").type)
+    rows = table.to_pylist()
+    assert sorted(
+        (row["value_number"] for row in rows if row["answer_type"] == "number"),
+        key=lambda value: (value is None, value)
+    ) == [4.5, 31.0, None]
+    assert sorted(row["value_date"] for row in rows if row["value_date"]) == [date(2025, 3, 1), date(2025, 3, 2)]
+    assert sorted(row["value_choice"] for row in rows if row["answer_type"] == "close") == ["Biały", "Żółty", "Żółty"]
+
+
+def test_export_user_answers_covers_all_owned_surveys(client, authenticated_user):
+    import io
+    import pyarrow.parquet as pq
+
+    survey_ids = {create_typed_survey(client, "Pierwsza"), create_typed_survey(client, "Druga")}
+
+    response = client.get("/v1/results/export")
+
+    table = pq.read_table(io.BytesIO(response.content))
+    assert set(table.column("survey_id").to_pylist()) == survey_ids
+    assert table.num_rows == 18
+
+
+def test_get_survey_statistics(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "NPS", "prevent_duplicates": False}).json()["id"]
+    question_id = client.post(
+        f"/v1/question/{survey_id}",
+        json=[{"content": "Czy polecisz nas?", "position": 0, "answer_type": "scale", "settings": {"min": 0, "max": 10, "step": 1}}]
+    ).json()[0]["id"]
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [{"question_id": question_id, "response": response}]}
+            for response in ["10", "9", "8", "3", "10"]
+        ]}
+    )
+
+    response = client.get(f"/v1/results/{survey_id}/statistics")
+
+    assert response.status_code == 200
+    statistics = response.json()["questions"][0]
+    assert (statistics["count"], statistics["mean"], statistics["median"]) == (5, 8.0, 9.0)
+    assert statistics["nps"] == {"score": 40.0, "promoters": 3, "passives": 1, "detractors": 1}
+    assert statistics["confidence_interval"]["level"] == 0.95
+
+
+def test_statistics_include_very_small_and_large_numbers(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Pomiary", "prevent_duplicates": False}).json()["id"]
+    question_id = client.post(
+        f"/v1/question/{survey_id}",
+        json=[{"content": "Wynik", "position": 0, "answer_type": "number"}]
+    ).json()[0]["id"]
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [{"question_id": question_id, "response": response}]}
+            for response in ["0.00001", "5", "100000000000000000000"]
+        ]}
+    )
+
+    statistics = client.get(f"/v1/results/{survey_id}/statistics").json()["questions"][0]
+    exact = client.get(f"/v1/results/{survey_id}/approximate", params={"exact": True}).json()
+
+    assert statistics["count"] == 3
+    assert (statistics["min"], statistics["median"], statistics["max"]) == (0.00001, 5.0, 1e20)
+    assert exact["questions"][0]["percentiles"]["p50"]["value"] == 5.0
+
+
+def test_crosstab_with_segment_filter(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Działy", "prevent_duplicates": False}).json()["id"]
+    questions = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {
+                "content": "Dział",
+                "position": 0,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "IT"}, {"position": 1, "content": "HR"}]
+            },
+            {
+                "content": "Zadowolenie",
+                "position": 1,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "Tak"}, {"position": 1, "content": "Nie"}, {"position": 2, "content": "Nie wiem"}]
+            },
+            {
+                "content": "Staż",
+                "position": 2,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "Krótki"}, {"position": 1, "content": "Długi"}]
+            }
+        ]
+    ).json()
+    department, satisfaction, tenure = (question["id"] for question in questions)
+    rows = [("IT", "Tak", "Krótki")] * 6 + [("IT", "Nie", "Długi")] * 2 + [("HR", "Tak", "Długi")] * 1 + [("HR", "Nie", "Długi")] * 5
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [
+                {"question_id": department, "response": a},
+                {"question_id": satisfaction, "response": b},
+                {"question_id": tenure, "response": c}
+            ]}
+            for a, b, c in rows
+        ]}
+    )
+
+    full = client.post(
+        f"/v1/results/{survey_id}/crosstab",
+        json={"row_question_id": department, "column_question_id": satisfaction}
+    ).json()
+    segment = client.post(
+        f"/v1/results/{survey_id}/crosstab",
+        json={
+            "row_question_id": department,
+            "column_question_id": satisfaction,
+            "filters": [{"question_id": tenure, "values": ["Długi"]}]
+        }
+    ).json()
+    invalid = client.post(
+        f"/v1/results/{survey_id}/crosstab",
+        json={"row_question_id": department, "column_question_id": department}
+    )
+
+    assert full["rows"] == ["IT", "HR"]
+    assert full["columns"] == ["Tak", "Nie", "Nie wiem"]
+    assert full["counts"] == [[6, 2, 0], [1, 5, 0]]
+    assert full["total"] == 14
+    assert full["chi_square"]["degrees_of_freedom"] == 1
+    assert abs(full["chi_square"]["statistic"] - 14 / 3) < 1e-9
+    assert 0.030 < full["chi_square"]["p_value"] < 0.031
+    assert segment["counts"] == [[0, 2, 0], [1, 5, 0]]
+    assert invalid.status_code == 400
+
+
+def test_choice_references_are_reported_as_choice_text(client, authenticated_user):
+    import csv
+    import io
+
+    survey_id = client.post("/v1/survey/", json={"name": "Referencje", "prevent_duplicates": False}).json()["id"]
+    questions = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {
+                "content": "Dział",
+                "position": 0,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "IT"}, {"position": 1, "content": "HR"}]
+            },
+            {
+                "content": "Zadowolenie",
+                "position": 1,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "Tak"}, {"position": 1, "content": "Nie"}]
+            }
+        ]
+    ).json()
+    department, satisfaction = (question["id"] for question in questions)
+    department_choices = {choice["content"]: choice["id"] for choice in questions[0]["choices"]}
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [
+                {"question_id": department, "choice_id": department_choices["IT"]},
+                {"question_id": satisfaction, "choice_position": 0}
+            ]},
+            {"survey_id": survey_id, "answers": [
+                {"question_id": department, "response": "IT"},
+                {"question_id": satisfaction, "response": "Nie"}
+            ]},
+            {"survey_id": survey_id, "answers": [
+                {"question_id": department, "choice_position": 1},
+                {"question_id": satisfaction, "choice_id": questions[1]["choices"][0]["id"]}
+            ]}
+        ]}
+    )
+
+    results = client.get(f"/v1/results/{survey_id}").json()
+    crosstab = client.post(
+        f"/v1/results/{survey_id}/crosstab",
+        json={
+            "row_question_id": department,
+            "column_question_id": satisfaction,
+            "filters": [{"question_id": department, "values": ["IT", "HR"]}]
+        }
+    ).json()
+    export = client.get(f"/v1/results/{survey_id}/export.csv")
+
+    assert results["questions"][0]["choices"] == [{"value": "IT", "count": 2}, {"value": "HR", "count": 1}]
+    assert results["questions"][1]["choices"] == [{"value": "Tak", "count": 2}, {"value": "Nie", "count": 1}]
+    assert crosstab["counts"] == [[1, 1], [1, 0]]
+    rows = list(csv.reader(io.StringIO(export.content.decode("utf-8-sig"))))
+    assert sorted(row[2:] for row in rows[1:]) == [["HR", "Tak"], ["IT", "Nie"], ["IT", "Tak"]]
+
+
+def test_search_open_answers_ranks_highlights_and_paginates(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Komentarze", "prevent_duplicates": False}).json()["id"]
+    questions = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {"content": "Uwagi", "position": 0, "answer_type": "open"},
+            {"content": "Wiek", "position": 1, "answer_type": "number"}
+        ]
+    ).json()
+    open_id, number_id = questions[0]["id"], questions[1]["id"]
+    comments = [
+        "Obsługa była miła",
+        "Dostawa spóźniona, obsługa niemiła, obsługa do poprawy",
+        "Wszystko w porządku",
+        "Szybka dostawa"
+    ]
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [{"question_id": open_id, "response": comment}]}
+            for comment in comments
+        ]}
+    )
+    url = f"/v1/results/{survey_id}/questions/{open_id}/search"
+
+    first = client.get(url, params={"q": "OBSŁUGA", "limit": 1}).json()
+    second = client.get(url, params={"q": "obsługa", "limit": 1, "cursor": first["next_cursor"]}).json()
+    both = client.get(url, params={"q": "dostawa obsługa"}).json()
+    not_open = client.get(f"/v1/results/{survey_id}/questions/{number_id}/search", params={"q": "1"})
+
+    assert first["items"][0]["response"] == comments[1]
+    assert [part["text"] for part in first["items"][0]["highlights"] if part["match"]] == ["obsługa", "obsługa"]
+    assert second["items"][0]["response"] == comments[0]
+    assert second["next_cursor"] is None
+    assert [item["response"] for item in both["items"]] == [comments[1]]
+    assert not_open.status_code == 400
+
+
+def test_term_summary_is_refreshed_after_new_submission(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Opinie", "prevent_duplicates": False}).json()["id"]
+    question_id = client.post(
+        f"/v1/question/{survey_id}",
+        json=[{"content": "Co poprawić?", "position": 0, "answer_type": "open"}]
+    ).json()[0]["id"]
+
+    def submit(*responses):
+        client.post(
+            f"/v1/submissions/bulk/{survey_id}",
+            json={"submissions": [
+                {"survey_id": survey_id, "answers": [{"question_id": question_id, "response": response}]}
+                for response in responses
+            ]}
+        )
+
+    submit("Długi czas dostawy", "Czas dostawy jest za długi", "Miła obsługa")
+    url = f"/v1/results/{survey_id}/questions/{question_id}/terms"
+
+    first = client.get(url, params={"limit": 2}).json()
+    submit("Obsługa miła i obsługa szybka")
+    second = client.get(url).json()
+
+    assert (first["response_count"], first["token_count"]) == (3, 10)
+    assert [(term["term"], term["count"]) for term in first["terms"]] == [("czas", 2), ("dostawy", 2)]
+    assert first["bigrams"][0] == {"term": "czas dostawy", "count": 2, "error": 0}
+    assert second["response_count"] == 4
+    assert second["terms"][0] == {"term": "obsługa", "count": 3, "error": 0}
+
+
+def test_approximate_results_match_exact_results_for_small_survey(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Szkice", "prevent_duplicates": False}).json()["id"]
+    questions = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {"content": "Wiek", "position": 0, "answer_type": "number"},
+            {"content": "Miasto", "position": 1, "answer_type": "open"},
+            {
+                "content": "Kolor",
+                "position": 2,
+                "answer_type": "close",
+                "choices": [{"position": 0, "content": "Żółty"}, {"position": 1, "content": "Biały"}]
+            }
+        ]
+    ).json()
+    age, city, color = (question["id"] for question in questions)
+    rows = [(str(20 + index), ["Kraków", "Gdańsk", "Łódź"][index % 3], ["Żółty", "Biały"][index % 4 == 0]) for index in range(40)]
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [
+                {"question_id": age, "response": a},
+                {"question_id": city, "response": b},
+                {"question_id": color, "response": c}
+            ]}
+            for a, b, c in rows
+        ]}
+    )
+
+    approximate = client.get(f"/v1/results/{survey_id}/approximate").json()
+    exact = client.get(f"/v1/results/{survey_id}/approximate", params={"exact": True}).json()
+
+    assert (approximate["exact"], approximate["sample_size"]) == (False, 40)
+    assert exact["exact"] is True
+    by_content = {question["content"]: question for question in approximate["questions"]}
+    exact_by_content = {question["content"]: question for question in exact["questions"]}
+    assert by_content["Wiek"]["total"] == {"value": 40.0, "error": 0.0}
+    assert abs(by_content["Wiek"]["distinct"]["value"] - 40) <= by_content["Wiek"]["distinct"]["error"]
+    assert exact_by_content["Miasto"]["distinct"] == {"value": 3.0, "error": 0.0}
+    assert round(by_content["Miasto"]["distinct"]["value"]) == 3
+    median = by_content["Wiek"]["percentiles"]["p50"]
+    assert abs(median["value"] - exact_by_content["Wiek"]["percentiles"]["p50"]["value"]) <= median["error"] + 0.5
+    assert by_content["Kolor"]["choices"] == exact_by_content["Kolor"]["choices"] == [
+        {"value": "Żółty", "count": {"value": 30.0, "error": 0.0}},
+        {"value": "Biały", "count": {"value": 10.0, "error": 0.0}}
+    ]
+
+
+def test_submission_timeline_counts_per_minute(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Tempo", "prevent_duplicates": False}).json()["id"]
+    question_id = client.post(
+        f"/v1/question/{survey_id}",
+        json=[{"content": "Uwagi", "position": 0, "answer_type": "open"}]
+    ).json()[0]["id"]
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [{"question_id": question_id, "response": "ok"}]}
+            for _ in range(3)
+        ]}
+    )
+
+    timeline = client.get(f"/v1/results/{survey_id}/timeline", params={"granularity": "minute"}).json()
+    invalid = client.get(
+        f"/v1/results/{survey_id}/timeline",
+        params={"start": "2030-01-01T00:00:00", "end": "2029-01-01T00:00:00"}
+    )
+
+    assert timeline["granularity"] == "minute"
+    assert timeline["total"] == 3
+    assert [point["count"] for point in timeline["points"]] == [3]
+    assert invalid.status_code == 400
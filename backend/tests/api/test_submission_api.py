@@ -1,3 +1,4 @@
+import json
 import uuid
 
 def test_check_duplicate_false(client):
@@ -33,6 +34,7 @@ def test_submit_submission_success(client, authenticated_user):
         }
     )
     survey_id = survey_response.json()["id"]
+    client.patch(f"/v1/survey/{survey_id}/status", json={"status": "public"})
 
     submission_payload = {
         "survey_id": survey_id,
@@ -47,3 +49,257 @@ def test_submit_submission_success(client, authenticated_user):
 
     assert response.status_code == 200
     
+
+
+def test_get_survey_by_share_token(client, authenticated_user):
+    survey_response = client.post(
+        "/v1/survey/",
+        json={
+            "name": "Shared survey",
+            "prevent_duplicates": False
+        }
+    )
+    survey_id = survey_response.json()["id"]
+    link_response = client.post(f"/v1/share/{survey_id}", json={})
+    token = link_response.json()["share_token"]
+
+    from sqlmodel import Session
+    from app.domain.services import share_link_service
+
+    response = client.get(f"/v1/share/token/{token}/survey")
+    client.get(f"/v1/share/token/{token}/survey")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == survey_id
+    assert client.get(f"/v1/share/survey/{survey_id}").json()[0]["clicks"] == 0
+    with Session(client.engine) as session:
+        share_link_service.flush_clicks(session=session)
+    links = client.get(f"/v1/share/survey/{survey_id}").json()
+    assert links[0]["clicks"] == 2
+
+
+def test_share_link_enforces_password_and_response_limit(client, authenticated_user):
+    survey_id = client.post(
+        "/v1/survey/",
+        json={
+            "name": "Limited survey",
+            "prevent_duplicates": False
+        }
+    ).json()["id"]
+    link = client.post(
+        f"/v1/share/{survey_id}",
+        json={"max_responses": 2, "password": "tajne-haslo"}
+    ).json()
+    token = link["share_token"]
+
+    assert link["has_password"] is True
+    assert "password" not in link
+    assert client.get(f"/v1/share/token/{token}/survey").status_code == 401
+    assert client.get(
+        f"/v1/share/token/{token}/survey",
+        headers={"X-Share-Password": "zle-haslo"}
+    ).status_code == 403
+    assert client.get(
+        f"/v1/share/token/{token}/survey",
+        headers={"X-Share-Password": "tajne-haslo"}
+    ).status_code == 200
+
+    payload = {"survey_id": survey_id, "answers": [], "share_token": token, "share_password": "tajne-haslo"}
+    statuses = [client.post("/v1/submissions/", json=payload).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 410]
+    assert client.post("/v1/submissions/", json={"survey_id": survey_id, "answers": []}).status_code == 403
+    assert client.post("/v1/submissions/", json={**payload, "share_password": None}).status_code == 401
+    assert client.get(f"/v1/share/survey/{survey_id}").json()[0]["response_count"] == 2
+
+
+def test_expired_share_link_is_rejected(client, authenticated_user):
+    survey_id = client.post(
+        "/v1/survey/",
+        json={
+            "name": "Expired link survey",
+            "prevent_duplicates": False
+        }
+    ).json()["id"]
+    token = client.post(
+        f"/v1/share/{survey_id}",
+        json={"expires_at": "2000-01-01T00:00:00Z"}
+    ).json()["share_token"]
+
+    assert client.get(f"/v1/share/token/{token}/survey").status_code == 410
+    response = client.post(
+        "/v1/submissions/",
+        json={"survey_id": survey_id, "answers": [], "share_token": token}
+    )
+    assert response.status_code == 410
+
+
+def test_bulk_submission_ingest(client, authenticated_user):
+    survey_id = client.post(
+        "/v1/survey/",
+        json={
+            "name": "Kiosk survey",
+            "prevent_duplicates": True
+        }
+    ).json()["id"]
+    questions = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {
+                "content": "Ocena",
+                "position": 0,
+                "answer_type": "close",
+                "choices": [
+                    {"position": 0, "content": "Dobra"},
+                    {"position": 1, "content": "Zła"}
+                ]
+            }
+        ]
+    ).json()
+    question_id = questions[0]["id"]
+    submissions = [
+        {
+            "survey_id": survey_id,
+            "answers": [{"question_id": question_id, "response": "Dobra" if i % 2 else "Zła"}]
+        }
+        for i in range(2000)
+    ]
+    submissions[5]["answers"][0]["response"] = "Nieznana"
+    submissions[7]["survey_id"] = str(uuid.uuid4())
+
+    response = client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": submissions}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["accepted"] == 1998
+    assert data["rejected"] == 2
+    assert [r["index"] for r in data["results"] if not r["accepted"]] == [5, 7]
+    assert client.get(f"/v1/survey/{survey_id}").json()["submission_count"] == 1998
+    assert len(client.get(f"/v1/submissions/survey/{survey_id}").json()) == 1998
+
+
+def test_submissions_keyset_pages_and_stream(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Paged survey"}).json()["id"]
+    question_id = client.post(
+        f"/v1/question/{survey_id}",
+        json=[{"content": "Uwagi", "position": 0, "answer_type": "open"}]
+    ).json()[0]["id"]
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [{"question_id": question_id, "response": str(i)}]}
+            for i in range(250)
+        ]}
+    )
+
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": 100, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"/v1/submissions/survey/{survey_id}/page", params=params).json()
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    streamed = client.get(f"/v1/submissions/survey/{survey_id}/stream")
+
+    paged_ids = [item["id"] for page in pages for item in page]
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert len(set(paged_ids)) == 250
+    assert paged_ids == [item["id"] for item in client.get(f"/v1/submissions/survey/{survey_id}").json()]
+    assert streamed.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in streamed.text.splitlines()]
+    assert [line["id"] for line in lines] == paged_ids
+    assert sorted(int(line["answers"][0]["response"]) for line in lines) == list(range(250))
+    invalid = client.get(f"/v1/submissions/survey/{survey_id}/page", params={"cursor": "nie-kursor"})
+    assert invalid.status_code == 400
+
+
+def test_choice_reference_submissions_are_listed_with_choice_text(client, authenticated_user):
+    survey_id = client.post(
+        "/v1/survey/",
+        json={
+            "name": "Reference listing survey",
+            "prevent_duplicates": False
+        }
+    ).json()["id"]
+    question = client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {
+                "content": "Ocena",
+                "position": 0,
+                "answer_type": "close",
+                "choices": [
+                    {"position": 0, "content": "Dobra"},
+                    {"position": 1, "content": "Zła"}
+                ]
+            }
+        ]
+    ).json()[0]
+    client.patch(f"/v1/survey/{survey_id}/status", json={"status": "public"})
+    client.post(
+        "/v1/submissions/",
+        json={"survey_id": survey_id, "answers": [{"question_id": question["id"], "choice_id": question["choices"][1]["id"]}]}
+    )
+    client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [{"question_id": question["id"], "choice_position": 0}]}
+        ]}
+    )
+
+    listed = client.get(f"/v1/submissions/survey/{survey_id}").json()
+    page = client.get(f"/v1/submissions/survey/{survey_id}/page").json()
+
+    assert sorted(submission["answers"][0]["response"] for submission in listed) == ["Dobra", "Zła"]
+    assert sorted(submission["answers"][0]["response"] for submission in page["items"]) == ["Dobra", "Zła"]
+
+
+def test_bulk_submission_rejects_repeated_question_per_item(client, authenticated_user):
+    survey_id = client.post(
+        "/v1/survey/",
+        json={
+            "name": "Repeated answers survey",
+            "prevent_duplicates": False
+        }
+    ).json()["id"]
+    number_id, multiple_id = (question["id"] for question in client.post(
+        f"/v1/question/{survey_id}",
+        json=[
+            {"content": "Wiek", "position": 0, "answer_type": "number"},
+            {
+                "content": "Języki",
+                "position": 1,
+                "answer_type": "multiple",
+                "choices": [{"position": 0, "content": "Python"}, {"position": 1, "content": "Go"}]
+            }
+        ]
+    ).json())
+
+    response = client.post(
+        f"/v1/submissions/bulk/{survey_id}",
+        json={"submissions": [
+            {"survey_id": survey_id, "answers": [
+                {"question_id": number_id, "response": "30"},
+                {"question_id": multiple_id, "response": "Python"}
+            ]},
+            {"survey_id": survey_id, "answers": [
+                {"question_id": number_id, "response": "30"},
+                {"question_id": number_id, "response": "31"},
+                {"question_id": multiple_id, "response": "Go"}
+            ]},
+            {"survey_id": survey_id, "answers": [
+                {"question_id": number_id, "response": "40"},
+                {"question_id": multiple_id, "response": "Python"},
+                {"question_id": multiple_id, "response": "Go"}
+            ]}
+        ]}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["accepted"] == 1
+    assert [r["index"] for r in response.json()["results"] if not r["accepted"]] == [1, 2]
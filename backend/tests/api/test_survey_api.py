@@ -77,3 +77,28 @@ def test_get_public_survey_not_found(client):
     response = client.get(f"/v1/survey/{uuid.uuid4()}/public")
 
     assert response.status_code == 404
+
+
+def test_public_survey_snapshot_revalidates_with_etag(client, authenticated_user):
+    survey_id = client.post("/v1/survey/", json={"name": "Migawka", "prevent_duplicates": False}).json()["id"]
+    client.patch(f"/v1/survey/{survey_id}/status", json={"status": "public"})
+
+    first = client.get(f"/v1/survey/{survey_id}/public")
+    cached = client.get(f"/v1/survey/{survey_id}/public", headers={"If-None-Match": first.headers["etag"]})
+    client.post(
+        f"/v1/question/{survey_id}",
+        json=[{"content": "Nowe pytanie", "position": 0, "answer_type": "open"}]
+    )
+    edited = client.get(f"/v1/survey/{survey_id}/public", headers={"If-None-Match": first.headers["etag"]})
+    client.patch(f"/v1/survey/{survey_id}/status", json={"status": "private"})
+    hidden = client.get(f"/v1/survey/{survey_id}/public")
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+    assert first.json()["questions"] == []
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert edited.status_code == 200
+    assert edited.headers["etag"] != first.headers["etag"]
+    assert edited.json()["questions"][0]["content"] == "Nowe pytanie"
+    assert hidden.status_code == 404
@@ -1,5 +1,9 @@
 import pytest
+from contextlib import contextmanager
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.models import * 
@@ -16,7 +20,36 @@ def engine():
     SQLModel.metadata.drop_all(engine)
 
 
+@pytest.fixture(scope="function")
+def capture_queries(engine):
+
+    @contextmanager
+    def capture():
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return capture
+
+
 @pytest.fixture(scope="function")
 def session(engine):
     with Session(engine) as session:
         yield session
+
+
+@pytest.fixture(scope="function")
+async def async_session():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
@@ -0,0 +1,71 @@
+import pytest
+import uuid
+from datetime import datetime, timezone, timedelta
+from app.domain.repositories import async_share_link_repository, async_survey_repository, async_user_repository
+from app.core.exceptions import NotFoundError
+from app.models.choice import Choice
+from app.models.question import Question, AnswerEnum
+from app.models.share_link import ShareLink
+from app.models.survey import Survey, StatusEnum
+from app.models.user import User
+
+
+def make_survey(user_id: uuid.UUID) -> Survey:
+    return Survey(
+        name="Async survey",
+        status=StatusEnum.public,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=user_id
+    )
+
+
+@pytest.mark.anyio
+async def test_get_user_by_email(async_session):
+    user = User(email="async@example.com", hashed_password="x", created_at=datetime.now(timezone.utc))
+    async_session.add(user)
+    await async_session.commit()
+
+    found = await async_user_repository.get_user_by_email(async_session, "async@example.com")
+    missing = await async_user_repository.get_user_by_email(async_session, "nope@example.com")
+
+    assert found.id == user.id
+    assert missing is None
+
+
+@pytest.mark.anyio
+async def test_get_survey_by_id_loads_questions_and_choices(async_session):
+    survey = make_survey(uuid.uuid4())
+    question = Question(content="Q", position=0, answer_type=AnswerEnum.close, survey_id=survey.id)
+    async_session.add_all([
+        survey,
+        question,
+        Choice(position=0, content="A", question_id=question.id),
+        Choice(position=1, content="B", question_id=question.id)
+    ])
+    await async_session.commit()
+    async_session.expunge_all()
+
+    loaded = await async_survey_repository.get_survey_by_id(async_session, survey.id)
+
+    assert [q.id for q in loaded.questions] == [question.id]
+    assert {c.content for c in loaded.questions[0].choices} == {"A", "B"}
+
+
+@pytest.mark.anyio
+async def test_get_survey_by_id_not_found(async_session):
+    with pytest.raises(NotFoundError):
+        await async_survey_repository.get_survey_by_id(async_session, uuid.uuid4())
+
+
+@pytest.mark.anyio
+async def test_share_link_lookup_by_token(async_session):
+    survey = make_survey(uuid.uuid4())
+    link = ShareLink(survey_id=survey.id)
+    async_session.add_all([survey, link])
+    await async_session.commit()
+
+    found = await async_share_link_repository.get_share_link_by_token(async_session, link.share_token)
+
+    assert found.id == link.id
@@ -0,0 +1,33 @@
+import pytest
+import uuid
+from datetime import datetime
+from app.domain.repositories import question_repository, submission_repository, survey_repository
+from app.services import survey_template_service
+
+
+def query_plan(engine, statement, parameters) -> list[str]:
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize("repository_call, index_name", [
+    (lambda s: question_repository.get_questions_by_survey_id(session=s, survey_id=uuid.uuid4()), "ix_question_survey_id_position"),
+    (lambda s: submission_repository.get_all_survey_submissions(session=s, survey_id=uuid.uuid4()), "ix_submission_survey_id_created_at_id"),
+    (lambda s: submission_repository.get_survey_submissions_page(session=s, survey_id=uuid.uuid4(), limit=10, after=(datetime.utcnow(), uuid.uuid4())), "ix_submission_survey_id_created_at_id"),
+    (lambda s: survey_repository.get_all_user_surveys(session=s, user_id=uuid.uuid4()), "ix_survey_user_id"),
+    (lambda s: survey_repository.get_public_surveys(session=s), "ix_survey_status_expires_at"),
+    (lambda s: survey_repository.get_expired_surveys(session=s), "ix_survey_status_expires_at"),
+    (lambda s: submission_repository.check_fingerprint_exists(session=s, survey_id=uuid.uuid4(), fingerprint_hash="a" * 64), "ix_submissionfingerprint_survey_id_hash"),
+    (lambda s: survey_template_service.get_all_public_templates(s), "ix_surveytemplate_is_public_usage_count"),
+    (lambda s: survey_template_service.get_user_templates(uuid.uuid4(), s), "ix_surveytemplate_user_id_created_at"),
+])
+def test_repository_query_uses_index(engine, session, capture_queries, repository_call, index_name):
+    with capture_queries() as queries:
+        repository_call(session)
+
+    assert queries
+    for statement, parameters in queries:
+        plan = query_plan(engine, statement, parameters)
+        assert any(f"INDEX {index_name}" in step for step in plan), plan
+        assert all("USING" in step for step in plan if step.startswith("SCAN")), plan
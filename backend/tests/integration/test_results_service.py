@@ -0,0 +1,145 @@
+import uuid
+from datetime import datetime, timezone, timedelta, date
+from app.domain.services.results_service import get_survey_results
+from app.domain.services.aggregate_service import rebuild_survey_aggregates, verify_survey_aggregates
+from app.domain.services.submission_service import submit_submission
+from app.models.answer import AnswerCreate
+from app.models.question_aggregate import QuestionAggregate
+from app.models.submission import SubmissionCreate
+from app.models.answer import Answer
+from app.models.choice import Choice
+from app.models.question import Question, AnswerEnum
+from app.models.submission import Submission
+from app.models.survey import Survey, StatusEnum
+
+
+def create_survey_with_answers(session, rows):
+    survey = Survey(
+        name="Results",
+        status=StatusEnum.public,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4(),
+        submission_count=len(rows)
+    )
+    questions = {
+        "close": Question(content="Kolor", position=0, answer_type=AnswerEnum.close, survey_id=survey.id),
+        "scale": Question(content="Skala", position=1, answer_type=AnswerEnum.scale, survey_id=survey.id),
+        "number": Question(content="Wiek", position=2, answer_type=AnswerEnum.number, survey_id=survey.id),
+        "date": Question(content="Data", position=3, answer_type=AnswerEnum.date, survey_id=survey.id),
+        "open": Question(content="Uwagi", position=4, answer_type=AnswerEnum.open, survey_id=survey.id)
+    }
+    session.add(survey)
+    session.add_all(questions.values())
+    session.add_all([
+        Choice(position=0, content="Czerwony", question_id=questions["close"].id),
+        Choice(position=1, content="Zielony", question_id=questions["close"].id),
+        Choice(position=2, content="Niebieski", question_id=questions["close"].id)
+    ])
+    for row in rows:
+        submission = Submission(survey_id=survey.id)
+        session.add(submission)
+        session.add_all([
+            Answer(question_id=questions[key].id, submission_id=submission.id, response=value)
+            for key, value in row.items()
+        ])
+    session.commit()
+    rebuild_survey_aggregates(session=session, survey_id=survey.id)
+    return survey
+
+
+def test_get_survey_results_aggregates_each_question_type(session):
+    survey = create_survey_with_answers(session, [
+        {"close": "Czerwony", "scale": "5", "number": "10", "date": "2025-03-01", "open": "ok"},
+        {"close": "Czerwony", "scale": "10", "number": "20", "date": "2025-03-01", "open": ""},
+        {"close": "Zielony", "scale": "5", "number": "30", "date": "2025-03-02", "open": "super"},
+        {"close": "Zielony", "scale": "2", "number": "40", "date": "2025-03-04", "open": "x"}
+    ])
+
+    results = get_survey_results(session=session, survey=survey)
+
+    by_type = {q.answer_type: q for q in results.questions}
+    assert results.submission_count == 4
+    assert [q.position for q in results.questions] == [0, 1, 2, 3, 4]
+    assert [(c.value, c.count) for c in by_type[AnswerEnum.close].choices] == [
+        ("Czerwony", 2), ("Zielony", 2), ("Niebieski", 0)
+    ]
+    assert [(h.value, h.count) for h in by_type[AnswerEnum.scale].histogram] == [("2", 1), ("5", 2), ("10", 1)]
+    stats = by_type[AnswerEnum.number].stats
+    assert (stats.count, stats.min, stats.max, stats.mean) == (4, 10.0, 40.0, 25.0)
+    assert (stats.p25, stats.p50, stats.p75, stats.p90) == (10.0, 20.0, 30.0, 40.0)
+    assert [(d.day, d.count) for d in by_type[AnswerEnum.date].per_day] == [
+        (date(2025, 3, 1), 2), (date(2025, 3, 2), 1), (date(2025, 3, 4), 1)
+    ]
+    assert by_type[AnswerEnum.open].total == 3
+
+
+def test_get_survey_results_ignores_non_numeric_number_answers(session):
+    survey = create_survey_with_answers(session, [{"number": "abc"}, {"number": "7"}])
+
+    results = get_survey_results(session=session, survey=survey)
+
+    stats = next(q for q in results.questions if q.answer_type == AnswerEnum.number).stats
+    assert (stats.count, stats.p50) == (1, 7.0)
+
+
+def test_submissions_keep_aggregates_in_sync_with_answers(session):
+    survey = create_survey_with_answers(session, [])
+    questions = {q.answer_type: q.id for q in survey.questions}
+    for ip, (color, age) in enumerate([("Czerwony", "2"), ("Zielony", "4"), ("Czerwony", "4"), ("Niebieski", "x")]):
+        submit_submission(
+            session=session,
+            submission_create=SubmissionCreate(survey_id=survey.id, answers=[
+                AnswerCreate(question_id=questions[AnswerEnum.close], response=color),
+                AnswerCreate(question_id=questions[AnswerEnum.number], response=age),
+                AnswerCreate(question_id=questions[AnswerEnum.open], response="ok")
+            ]),
+            fingerprint_data={"ip": f"10.0.0.{ip}", "user_agent": "pytest", "survey_id": str(survey.id)}
+        )
+
+    results = get_survey_results(session=session, survey=survey)
+
+    assert verify_survey_aggregates(session=session, survey_id=survey.id) == []
+    by_type = {q.answer_type: q for q in results.questions}
+    assert [(c.value, c.count) for c in by_type[AnswerEnum.close].choices] == [
+        ("Czerwony", 2), ("Zielony", 1), ("Niebieski", 1)
+    ]
+    stats = by_type[AnswerEnum.number].stats
+    assert (by_type[AnswerEnum.number].total, stats.count, stats.mean, stats.p50) == (4, 3, 10 / 3, 4.0)
+    assert abs(stats.stddev - (8 / 9) ** 0.5) < 1e-9
+
+
+def test_rebuild_repairs_drifted_aggregates(session):
+    survey = create_survey_with_answers(session, [{"close": "Czerwony"}, {"close": "Zielony"}])
+    close_id = next(q.id for q in survey.questions if q.answer_type == AnswerEnum.close)
+    session.get(QuestionAggregate, (close_id, "Czerwony")).count = 7
+    session.add(QuestionAggregate(question_id=close_id, key="Fioletowy", count=1))
+    session.commit()
+
+    mismatches = verify_survey_aggregates(session=session, survey_id=survey.id)
+    repaired = rebuild_survey_aggregates(session=session, survey_id=survey.id)
+
+    assert [(m.key, m.stored[0], m.expected) for m in mismatches] == [
+        ("Czerwony", 7, (1, 0.0, 0.0)), ("Fioletowy", 1, None)
+    ]
+    assert repaired == mismatches
+    assert verify_survey_aggregates(session=session, survey_id=survey.id) == []
+    choices = next(q for q in get_survey_results(session=session, survey=survey).questions if q.question_id == close_id).choices
+    assert [(c.value, c.count) for c in choices] == [("Czerwony", 1), ("Zielony", 1), ("Niebieski", 0)]
+
+
+def test_deleting_question_removes_all_its_aggregates(session):
+    from sqlmodel import select
+
+    survey = create_survey_with_answers(session, [{"scale": "2"}, {"scale": "5"}, {"scale": "10"}])
+    question = session.exec(
+        select(Question).where(Question.survey_id == survey.id, Question.answer_type == AnswerEnum.scale)
+    ).one()
+    question_id = question.id
+
+    assert len(question.aggregates) > 1
+    session.delete(question)
+    session.commit()
+
+    assert session.exec(select(QuestionAggregate).where(QuestionAggregate.question_id == question_id)).all() == []
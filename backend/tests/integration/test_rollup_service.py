@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlmodel import select
+from app.domain.services.rollup_service import (
+    compact_submission_rollups,
+    get_submission_timeline,
+    record_submissions
+)
+from app.models.submission_rollup import SubmissionRollup, RollupGranularity
+from app.models.survey import Survey, StatusEnum
+
+
+def create_survey(session, created_at):
+    survey = Survey(
+        name="Tempo",
+        status=StatusEnum.public,
+        created_at=created_at,
+        last_updated=created_at,
+        expires_at=created_at + timedelta(days=365),
+        user_id=uuid.uuid4()
+    )
+    session.add(survey)
+    session.commit()
+    return survey
+
+
+def test_compaction_keeps_totals_and_coarsens_old_buckets(session):
+    now = datetime(2025, 6, 30, 12, 30)
+    survey = create_survey(session, datetime(2025, 1, 1, tzinfo=timezone.utc))
+    moments = [
+        datetime(2025, 1, 10, 8, 5), datetime(2025, 1, 10, 8, 59), datetime(2025, 1, 10, 17, 1),
+        datetime(2025, 6, 27, 9, 15), datetime(2025, 6, 27, 9, 45),
+        datetime(2025, 6, 30, 12, 10), datetime(2025, 6, 30, 12, 10, 30)
+    ]
+    for moment in moments:
+        record_submissions(session=session, survey_id=survey.id, created_at=moment)
+    session.commit()
+
+    compacted = compact_submission_rollups(session=session, now=now)
+
+    rows = session.exec(select(SubmissionRollup.granularity, SubmissionRollup.bucket_start, SubmissionRollup.count)).all()
+    assert compacted == 7
+    assert sorted(rows, key=lambda row: row[1]) == [
+        (RollupGranularity.day, datetime(2025, 1, 10), 3),
+        (RollupGranularity.hour, datetime(2025, 6, 27, 9), 2),
+        (RollupGranularity.minute, datetime(2025, 6, 30, 12, 10), 2)
+    ]
+    timeline = get_submission_timeline(
+        session=session,
+        survey=survey,
+        granularity=RollupGranularity.hour,
+        end=now
+    )
+    assert timeline.total == len(moments)
+    assert [(point.bucket_start, point.count) for point in timeline.points] == [
+        (datetime(2025, 1, 10), 3),
+        (datetime(2025, 6, 27, 9), 2),
+        (datetime(2025, 6, 30, 12), 2)
+    ]
@@ -1,5 +1,7 @@
+from app.core.password_hashing import hash_password
 from app.domain.services.share_link_service import create_share_link
 from app.models.share_link import ShareLinkCreate
+import pytest
 import uuid
 
 
@@ -19,3 +21,30 @@ def test_create_share_link_integration(session):
     assert link.id is not None
     assert link.survey_id == survey_id
     assert link.created_at is not None
+
+
+@pytest.mark.anyio
+async def test_async_password_check_verifies_off_the_event_loop(async_session, mocker):
+    from app.domain.services import share_link_service
+    from app.models.share_link import ShareLink
+    from fastapi import HTTPException
+    import hashlib
+
+    link = ShareLink(survey_id=uuid.uuid4(), password_hash=hash_password("sekret"))
+    async_session.add(link)
+    await async_session.commit()
+    threadpool = mocker.spy(share_link_service, "run_in_threadpool")
+
+    with pytest.raises(HTTPException) as exc:
+        await share_link_service.authorize_share_link_async(session=async_session, token=link.share_token, password="zle")
+    await share_link_service.authorize_share_link_async(session=async_session, token=link.share_token, password="sekret")
+    cached = await share_link_service.authorize_share_link_async(
+        session=async_session,
+        token=link.share_token,
+        password="sekret"
+    )
+
+    assert exc.value.status_code == 403
+    assert threadpool.call_count == 2
+    assert len(cached.verified_passwords) == 1
+    assert hashlib.sha256(b"sekret").hexdigest() not in cached.verified_passwords
@@ -46,3 +46,382 @@ def test_get_survey_submissions_integration(session):
     )
 
     assert submissions == []
+
+
+def test_cached_submission_skips_question_and_choice_queries(session, capture_queries):
+    from app.models.question import Question, AnswerEnum
+    from app.models.choice import Choice
+    from app.models.answer import AnswerCreate
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=False,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    question = Question(content="Q", position=0, answer_type=AnswerEnum.close, survey_id=survey.id)
+    session.add_all([
+        survey,
+        question,
+        Choice(position=0, content="A", question_id=question.id),
+        Choice(position=1, content="B", question_id=question.id)
+    ])
+    session.commit()
+    survey_id, question_id = survey.id, question.id
+
+    def submit():
+        return submit_submission(
+            session=session,
+            submission_create=SubmissionCreate(
+                survey_id=survey_id,
+                answers=[AnswerCreate(question_id=question_id, response="A")]
+            ),
+            fingerprint_data={}
+        )
+
+    submit()
+    with capture_queries() as queries:
+        submit()
+
+    selects = [statement for statement, _ in queries if statement.lstrip().upper().startswith("SELECT")]
+    assert not any("FROM question" in statement or "FROM choice" in statement for statement in selects)
+
+
+def test_concurrent_submissions_are_all_counted(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from sqlmodel import SQLModel, Session, create_engine
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'concurrency.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    SQLModel.metadata.create_all(engine)
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=False,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    with Session(engine) as setup_session:
+        setup_session.add(survey)
+        setup_session.commit()
+        survey_id = survey.id
+
+    def submit(_):
+        with Session(engine) as thread_session:
+            submit_submission(
+                session=thread_session,
+                submission_create=SubmissionCreate(survey_id=survey_id, answers=[]),
+                fingerprint_data={}
+            )
+
+    submissions = 25
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(submit, range(submissions)))
+
+    with Session(engine) as check_session:
+        stored = check_session.get(Survey, survey_id)
+        assert stored.submission_count == submissions
+        assert stored.is_locked is True
+        assert stored.locked_at is not None
+    engine.dispose()
+
+
+def test_submission_statement_count_is_pinned(session, capture_queries):
+    from app.models.question import Question, AnswerEnum
+    from app.models.choice import Choice
+    from app.models.answer import Answer, AnswerCreate
+    from app.models.submission_fingerprint import SubmissionFingerprint
+    from sqlmodel import select
+    from fastapi import HTTPException
+    import pytest
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=True,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    open_question = Question(content="Q1", position=0, answer_type=AnswerEnum.open, survey_id=survey.id)
+    multiple_question = Question(content="Q2", position=1, answer_type=AnswerEnum.multiple, survey_id=survey.id)
+    session.add_all([
+        survey,
+        open_question,
+        multiple_question,
+        Choice(position=0, content="A", question_id=multiple_question.id),
+        Choice(position=1, content="B", question_id=multiple_question.id)
+    ])
+    session.commit()
+    survey_id, open_id, multiple_id = survey.id, open_question.id, multiple_question.id
+
+    def submit(ip):
+        return submit_submission(
+            session=session,
+            submission_create=SubmissionCreate(
+                survey_id=survey_id,
+                answers=[
+                    AnswerCreate(question_id=open_id, response="text"),
+                    AnswerCreate(question_id=multiple_id, response="A")
+                ]
+            ),
+            fingerprint_data={"ip": ip, "user_agent": "pytest", "survey_id": str(survey_id)}
+        )
+
+    submit("10.0.0.1")
+    with capture_queries() as queries:
+        submit("10.0.0.2")
+
+    statements = [
+        f"SELECT {statement.split('FROM ')[1].split()[0]}" if statement.startswith("SELECT")
+        else " ".join(statement.split()[:3])
+        for statement, _ in queries
+    ]
+    assert statements == [
+        "SELECT survey",
+        "INSERT INTO submissionfingerprint",
+        "INSERT INTO submission",
+        "INSERT INTO answer",
+        "INSERT INTO submissionrollup",
+        "INSERT INTO questionaggregate",
+        "UPDATE survey SET",
+        "INSERT INTO surveysample",
+        "SELECT questionsketch",
+        "INSERT INTO questionsketch",
+    ]
+    assert len(session.exec(select(Answer)).all()) == 4
+    assert len(session.exec(select(SubmissionFingerprint)).all()) == 2
+    with pytest.raises(HTTPException) as exc:
+        submit("10.0.0.1")
+    assert exc.value.status_code == 409
+
+
+def test_failed_submission_leaves_no_fingerprint(session, mocker):
+    import pytest
+    from app.models.submission_fingerprint import SubmissionFingerprint
+    from sqlmodel import select
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=True,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    session.add(survey)
+    session.commit()
+    mocker.patch(
+        "app.domain.services.submission_service.submission_repository.increment_submission_count",
+        side_effect=RuntimeError("boom")
+    )
+
+    with pytest.raises(RuntimeError):
+        submit_submission(
+            session=session,
+            submission_create=SubmissionCreate(survey_id=survey.id, answers=[]),
+            fingerprint_data={"ip": "10.0.0.1", "user_agent": "pytest", "survey_id": str(survey.id)}
+        )
+
+    assert session.exec(select(SubmissionFingerprint)).all() == []
+
+
+def test_survey_submissions_listing_does_not_query_per_submission(session, capture_queries):
+    from app.models.question import Question, AnswerEnum
+    from app.models.submission import Submission, SubmissionPublic
+    from app.models.answer import Answer
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    question = Question(content="Q", position=0, answer_type=AnswerEnum.open, survey_id=survey.id)
+    submissions = [Submission(survey_id=survey.id) for _ in range(5)]
+    session.add_all([survey, question, *submissions])
+    session.add_all([Answer(question_id=question.id, submission_id=s.id, response="ok") for s in submissions])
+    session.commit()
+    survey_id = survey.id
+    session.expire_all()
+
+    with capture_queries() as queries:
+        listed = [
+            SubmissionPublic.model_validate(submission)
+            for submission in get_survey_submissions(session=session, survey_id=survey_id)
+        ]
+
+    assert len(listed) == 5
+    assert all(len(submission.answers) == 1 for submission in listed)
+    assert len(queries) == 2
+
+
+def test_submission_stores_typed_answer_values(session):
+    from sqlmodel import select
+    from app.models.question import Question, AnswerEnum
+    from app.models.choice import Choice
+    from app.models.answer import Answer, AnswerCreate
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=False,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    number = Question(content="Wiek", position=0, answer_type=AnswerEnum.number, survey_id=survey.id)
+    close = Question(content="Kolor", position=1, answer_type=AnswerEnum.close, survey_id=survey.id)
+    choice = Choice(position=0, content="Zielony", question_id=close.id)
+    session.add_all([survey, number, close, choice, Choice(position=1, content="Czarny", question_id=close.id)])
+    session.commit()
+    number_id, close_id, choice_id = number.id, close.id, choice.id
+
+    submit_submission(
+        session=session,
+        submission_create=SubmissionCreate(survey_id=survey.id, answers=[
+            AnswerCreate(question_id=number_id, response="42"),
+            AnswerCreate(question_id=close_id, response="Zielony")
+        ]),
+        fingerprint_data={}
+    )
+
+    answers = {answer.question_id: answer for answer in session.exec(select(Answer)).all()}
+    assert (answers[number_id].value_num, answers[number_id].choice_id) == (42.0, None)
+    assert (answers[close_id].value_num, answers[close_id].choice_id) == (None, choice_id)
+
+
+def test_stale_fingerprint_is_reclaimed(session):
+    from app.domain.services import fingerprint_service
+    from app.models.submission_fingerprint import SubmissionFingerprint
+    from sqlmodel import select
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=True,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    fingerprint_data = {"ip": "10.0.0.3", "user_agent": "pytest", "survey_id": str(survey.id)}
+    session.add_all([
+        survey,
+        SubmissionFingerprint(
+            survey_id=survey.id,
+            fingerprint_hash=fingerprint_service.fingerprint_hash(fingerprint_data),
+            submitted_at=datetime.utcnow() - timedelta(days=31)
+        )
+    ])
+    session.commit()
+
+    submit_submission(
+        session=session,
+        submission_create=SubmissionCreate(survey_id=survey.id, answers=[]),
+        fingerprint_data=fingerprint_data
+    )
+
+    fingerprints = session.exec(select(SubmissionFingerprint)).all()
+    assert len(fingerprints) == 1
+    assert fingerprints[0].submitted_at > datetime.utcnow() - timedelta(days=1)
+
+
+def test_duplicate_check_sees_fingerprints_written_by_other_workers(session, capture_queries):
+    from app.domain.services import fingerprint_service
+    from app.domain.services.submission_service import check_already_submitted
+    from app.models.submission_fingerprint import SubmissionFingerprint
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=True,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    session.add(survey)
+    session.commit()
+    survey_id = survey.id
+    local = {"ip": "10.0.0.4", "user_agent": "pytest", "survey_id": str(survey_id)}
+    remote = {"ip": "10.0.0.5", "user_agent": "pytest", "survey_id": str(survey_id)}
+
+    assert not check_already_submitted(session=session, survey_id=survey_id, fingerprint_data=local)
+    submit_submission(
+        session=session,
+        submission_create=SubmissionCreate(survey_id=survey_id, answers=[]),
+        fingerprint_data=local
+    )
+    with capture_queries() as queries:
+        assert not check_already_submitted(session=session, survey_id=survey_id, fingerprint_data=remote)
+    assert not any("submissionfingerprint" in statement for statement, _ in queries)
+
+    session.add(SubmissionFingerprint(survey_id=survey_id, fingerprint_hash=fingerprint_service.fingerprint_hash(remote)))
+    survey.submission_count += 1
+    session.commit()
+
+    assert check_already_submitted(session=session, survey_id=survey_id, fingerprint_data=remote)
+    assert check_already_submitted(session=session, survey_id=survey_id, fingerprint_data=local)
+
+
+def test_failed_submit_does_not_update_fingerprint_filter(session, monkeypatch):
+    import pytest
+    from app.domain.services import fingerprint_service, submission_service
+    from app.domain.services.submission_service import check_already_submitted
+
+    survey = Survey(
+        name="Survey",
+        status=StatusEnum.public,
+        prevent_duplicates=True,
+        created_at=datetime.now(timezone.utc),
+        last_updated=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        user_id=uuid.uuid4()
+    )
+    session.add(survey)
+    session.commit()
+    survey_id = survey.id
+    fingerprint_data = {"ip": "10.0.0.6", "user_agent": "pytest", "survey_id": str(survey_id)}
+    fingerprint_hash = fingerprint_service.fingerprint_hash(fingerprint_data)
+
+    assert not check_already_submitted(session=session, survey_id=survey_id, fingerprint_data=fingerprint_data)
+    fingerprint_filter = fingerprint_service.fingerprint_filters.get(survey_id)
+
+    def failing_update_sketches(**kwargs):
+        raise RuntimeError("sketch update failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(submission_service, "update_sketches", failing_update_sketches)
+        with pytest.raises(RuntimeError):
+            submit_submission(
+                session=session,
+                submission_create=SubmissionCreate(survey_id=survey_id, answers=[]),
+                fingerprint_data=fingerprint_data
+            )
+
+    assert fingerprint_filter.submission_count == 0
+    assert fingerprint_hash not in fingerprint_filter.bloom
+    assert not check_already_submitted(session=session, survey_id=survey_id, fingerprint_data=fingerprint_data)
+
+    submit_submission(
+        session=session,
+        submission_create=SubmissionCreate(survey_id=survey_id, answers=[]),
+        fingerprint_data=fingerprint_data
+    )
+
+    assert fingerprint_filter.submission_count == 1
+    assert fingerprint_hash in fingerprint_filter.bloom
+    assert check_already_submitted(session=session, survey_id=survey_id, fingerprint_data=fingerprint_data)
@@ -0,0 +1,37 @@
+import uuid
+
+from app.core.click_buffer import ClickBuffer
+
+
+def test_click_buffer_aggregates_per_link_and_drops_beyond_capacity():
+    buffer = ClickBuffer(max_links=2)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    accepted = [buffer.record(link_id) for link_id in (first, first, second, third, second)]
+    pending = buffer.drain()
+    buffer.record_flush(pending)
+
+    assert accepted == [True, True, True, False, True]
+    assert pending == {first: 2, second: 2}
+    assert buffer.snapshot() == {
+        "pending_links": 0,
+        "pending_clicks": 0,
+        "recorded": 4,
+        "dropped": 1,
+        "flushed": 4,
+        "flushes": 1,
+        "failed_flushes": 0
+    }
+
+
+def test_failed_flush_restores_pending_clicks():
+    buffer = ClickBuffer(max_links=10)
+    link_id = uuid.uuid4()
+    buffer.record(link_id)
+
+    pending = buffer.drain()
+    buffer.record(link_id)
+    buffer.restore(pending)
+
+    assert buffer.drain() == {link_id: 2}
+    assert buffer.snapshot()["failed_flushes"] == 1
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import StaticPool
+
+from app.core import db
+from app.core.db import create_db_engine, get_pool_status, InstrumentedQueuePool
+from app.core.metrics import pool_metrics
+
+
+def test_in_memory_sqlite_uses_static_pool():
+    engine = create_db_engine("sqlite://")
+
+    assert isinstance(engine.pool, StaticPool)
+
+
+def test_file_database_uses_tunable_queue_pool(tmp_path, mocker):
+    mocker.patch.object(db.settings, "DB_POOL_SIZE", 3)
+    mocker.patch.object(db.settings, "DB_MAX_OVERFLOW", 2)
+    mocker.patch.object(db.settings, "DB_POOL_TIMEOUT", 7)
+
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+    assert engine.pool._timeout == 7
+
+
+def test_checkout_wait_time_is_recorded(tmp_path):
+    pool_metrics.reset()
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    status = get_pool_status(engine)
+    assert status["metrics"]["checkouts"] == 1
+    assert status["metrics"]["max_wait_seconds"] >= 0
+    assert status["checked_out"] == 0
+
+
+def test_checkout_timeout_is_recorded(tmp_path, mocker):
+    pool_metrics.reset()
+    mocker.patch.object(db.settings, "DB_POOL_SIZE", 1)
+    mocker.patch.object(db.settings, "DB_MAX_OVERFLOW", 0)
+    mocker.patch.object(db.settings, "DB_POOL_TIMEOUT", 0)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    assert pool_metrics.snapshot()["timeouts"] == 1
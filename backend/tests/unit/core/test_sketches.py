@@ -0,0 +1,40 @@
+from collections import Counter
+import random
+
+from app.core.sketches import BloomFilter, SpaceSaving
+
+
+def test_space_saving_is_exact_below_capacity():
+    sketch = SpaceSaving(10)
+    for item in "abracadabra":
+        sketch.add(item)
+
+    assert sketch.top(3) == [("a", 5, 0), ("b", 2, 0), ("r", 2, 0)]
+
+
+def test_space_saving_keeps_heavy_hitters_within_error_bound():
+    generator = random.Random(7)
+    stream = [f"rare{generator.randrange(5000)}" for _ in range(20000)] + ["hot"] * 3000 + ["warm"] * 1500
+    generator.shuffle(stream)
+    sketch = SpaceSaving(100)
+    for item in stream:
+        sketch.add(item)
+    exact = Counter(stream)
+
+    top = sketch.top(2)
+
+    assert [item for item, _, _ in top] == ["hot", "warm"]
+    for item, count, error in top:
+        assert count - error <= exact[item] <= count
+    assert len(sketch.counts) == 100
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(size_bytes=4096, hashes=7)
+    for index in range(2000):
+        bloom.add(f"seen{index}")
+
+    false_positives = sum(f"unseen{index}" in bloom for index in range(10000))
+
+    assert all(f"seen{index}" in bloom for index in range(2000))
+    assert false_positives / 10000 < 2 * bloom.false_positive_rate + 0.005
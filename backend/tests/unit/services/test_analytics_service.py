@@ -0,0 +1,64 @@
+import uuid
+import numpy as np
+import pytest
+from app.domain.services.analytics_service import describe_question, t_critical, chi_square_test, regularized_gamma_q
+from app.models.question import Question, AnswerEnum
+
+
+def make_question(answer_type, settings=None):
+    return Question(id=uuid.uuid4(), content="Q", position=0, answer_type=answer_type, survey_id=uuid.uuid4(), settings=settings)
+
+
+def test_describe_question_computes_summary_statistics():
+    values = np.array([10.0, 20.0, 30.0, 40.0])
+
+    statistics = describe_question(make_question(AnswerEnum.number), values)
+
+    assert (statistics.count, statistics.mean, statistics.median) == (4, 25.0, 25.0)
+    assert statistics.stddev == pytest.approx(np.std(values, ddof=1))
+    assert (statistics.min, statistics.max) == (10.0, 40.0)
+    assert statistics.percentiles["p50"] == 25.0
+    margin = 3.182 * statistics.stddev / 2
+    assert statistics.confidence_interval.lower == pytest.approx(25.0 - margin)
+    assert statistics.confidence_interval.upper == pytest.approx(25.0 + margin)
+    assert sum(bin.count for bin in statistics.histogram) == 4
+    assert statistics.nps is None
+
+
+def test_describe_question_counts_scale_values_and_nps():
+    values = np.array([0, 6, 7, 8, 9, 10, 10], dtype=float)
+
+    statistics = describe_question(make_question(AnswerEnum.scale, {"min": 0, "max": 10, "step": 1}), values)
+
+    assert [(bin.lower, bin.count) for bin in statistics.histogram] == [
+        (0.0, 1), (6.0, 1), (7.0, 1), (8.0, 1), (9.0, 1), (10.0, 2)
+    ]
+    assert (statistics.nps.promoters, statistics.nps.passives, statistics.nps.detractors) == (3, 2, 2)
+    assert statistics.nps.score == pytest.approx(100 / 7)
+
+
+def test_describe_question_without_answers_returns_only_count():
+    statistics = describe_question(make_question(AnswerEnum.rating, {"min": 1, "max": 5}), np.empty(0))
+
+    assert statistics.count == 0
+    assert statistics.mean is None
+    assert statistics.histogram == []
+
+
+def test_t_critical_approaches_normal_quantile():
+    assert t_critical(1) == 12.706
+    assert t_critical(1000) == pytest.approx(1.962, abs=1e-3)
+
+
+@pytest.mark.parametrize("degrees_of_freedom, critical_value", [(1, 3.841), (2, 5.991), (5, 11.070), (10, 18.307)])
+def test_chi_square_p_value_matches_critical_values(degrees_of_freedom, critical_value):
+    assert regularized_gamma_q(degrees_of_freedom / 2, critical_value / 2) == pytest.approx(0.05, abs=1e-4)
+
+
+def test_chi_square_test_ignores_empty_rows_and_columns():
+    result = chi_square_test(np.array([[10, 20, 0], [30, 40, 0], [0, 0, 0]]))
+
+    assert result.degrees_of_freedom == 1
+    assert result.statistic == pytest.approx(0.79365, abs=1e-5)
+    assert result.p_value == pytest.approx(0.373, abs=1e-3)
+    assert chi_square_test(np.array([[5, 0], [3, 0]])) is None
@@ -8,8 +8,10 @@ from app.core.exceptions import CouldNotCreateResource
 from app.domain.services.answer_service import submit_answers
 
 class FakeChoice:
-    def __init__(self, content: str):
+    def __init__(self, content: str, position: int = 0):
+        self.id = uuid.uuid4()
         self.content = content
+        self.position = position
 
 
 class FakeQuestion:
@@ -109,3 +111,92 @@ def test_submit_answers_calls_repository(mocker):
     submit_mock.assert_called_once()
     assert len(result) == 1
     assert result[0].submission_id == submission_id
+
+
+def test_survey_validator_is_cached_until_last_updated_changes(mocker):
+    from datetime import datetime, timedelta
+    from app.domain.services.answer_service import get_survey_validator, survey_validator_cache
+
+    survey_validator_cache.clear()
+    q_id = uuid.uuid4()
+    survey = mocker.Mock(id=uuid.uuid4(), last_updated=datetime(2025, 1, 1))
+    load_mock = mocker.patch(
+        "app.domain.services.answer_service.question_repository.get_questions_with_choices_by_survey_id",
+        return_value=[FakeQuestion(id=q_id, answer_type=AnswerEnum.close, choices=[FakeChoice("Tak")])]
+    )
+
+    first = get_survey_validator(session=mocker.Mock(), survey=survey)
+    second = get_survey_validator(session=mocker.Mock(), survey=survey)
+    survey.last_updated += timedelta(seconds=1)
+    third = get_survey_validator(session=mocker.Mock(), survey=survey)
+
+    assert first is second
+    assert third is not first
+    assert load_mock.call_count == 2
+    assert first.question_ids == frozenset({q_id})
+    assert first.rules[0].choices == frozenset({"Tak"})
+
+
+def test_invalidate_survey_validator_forces_recompile(mocker):
+    from datetime import datetime
+    from app.domain.services.answer_service import get_survey_validator, invalidate_survey_validator
+
+    survey = mocker.Mock(id=uuid.uuid4(), last_updated=datetime(2025, 1, 1))
+    load_mock = mocker.patch(
+        "app.domain.services.answer_service.question_repository.get_questions_with_choices_by_survey_id",
+        return_value=[]
+    )
+
+    get_survey_validator(session=mocker.Mock(), survey=survey)
+    invalidate_survey_validator(survey.id)
+    get_survey_validator(session=mocker.Mock(), survey=survey)
+
+    assert load_mock.call_count == 2
+
+
+def test_typed_values_follow_question_type():
+    from app.domain.services.answer_service import CompiledSurveyValidator
+    from datetime import date
+
+    number_id, date_id, close_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    choice = FakeChoice("Tak")
+    validator = CompiledSurveyValidator.compile([
+        FakeQuestion(id=number_id, answer_type=AnswerEnum.number, choices=[]),
+        FakeQuestion(id=date_id, answer_type=AnswerEnum.date, choices=[]),
+        FakeQuestion(id=close_id, answer_type=AnswerEnum.close, choices=[choice])
+    ])
+
+    assert validator.typed_values(AnswerCreate(question_id=number_id, response=" 4.5 ")) == {
+        "response": " 4.5 ", "value_num": 4.5, "value_date": None, "choice_id": None, "choice_position": None
+    }
+    assert validator.typed_values(AnswerCreate(question_id=number_id, response="dużo"))["value_num"] is None
+    assert validator.typed_values(AnswerCreate(question_id=date_id, response="2025-02-30"))["value_date"] is None
+    assert validator.typed_values(AnswerCreate(question_id=date_id, response="2025-03-01T00:00:00Z"))["value_date"] == date(2025, 3, 1)
+    assert validator.typed_values(AnswerCreate(question_id=close_id, response="Tak"))["choice_id"] == choice.id
+
+
+def test_choice_references_by_id_or_position_are_validated_and_resolved():
+    from app.domain.services.answer_service import CompiledSurveyValidator
+
+    close_id = uuid.uuid4()
+    yes, no = FakeChoice("Tak", 0), FakeChoice("Nie", 1)
+    validator = CompiledSurveyValidator.compile([
+        FakeQuestion(id=close_id, answer_type=AnswerEnum.close, choices=[yes, no])
+    ])
+    by_id = AnswerCreate(question_id=close_id, choice_id=no.id)
+    by_position = AnswerCreate(question_id=close_id, choice_position=1)
+
+    validator.validate([by_id])
+    validator.validate([by_position])
+
+    assert validator.typed_values(by_id)["choice_id"] == no.id
+    assert validator.typed_values(by_id)["response"] == "Nie"
+    assert validator.typed_values(by_position)["choice_position"] == 1
+    assert validator.response_text(by_position) == "Nie"
+    for invalid in [
+        AnswerCreate(question_id=close_id, choice_id=uuid.uuid4()),
+        AnswerCreate(question_id=close_id, choice_position=5),
+        AnswerCreate(question_id=close_id, choice_id=yes.id, choice_position=1)
+    ]:
+        with pytest.raises(SurveyModifiedException):
+            validator.validate([invalid])
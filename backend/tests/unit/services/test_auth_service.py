@@ -1,5 +1,5 @@
 import pytest
-from app.domain.services.auth_service import authenticate_user
+from app.domain.services.auth_service import authenticate_user, authenticate_user_async
 from app.core.exceptions import UnauthorizedError
 
 
@@ -43,4 +43,45 @@ def test_authenticate_user_email_not_confirmed(mocker):
     )
 
     with pytest.raises(UnauthorizedError):
-        authenticate_user(session, "test@test.com", "password")
\ No newline at end of file
+        authenticate_user(session, "test@test.com", "password")
+
+@pytest.mark.anyio
+async def test_authenticate_user_async_success(mocker):
+    session = mocker.Mock()
+    user = mocker.Mock(
+        hashed_password="hashed",
+        email_confirmed=True,
+        is_active=True
+    )
+
+    mocker.patch(
+        "app.domain.services.auth_service.async_user_repository.get_user_by_email",
+        new=mocker.AsyncMock(return_value=user)
+    )
+    mocker.patch(
+        "app.domain.services.auth_service.verify_password",
+        return_value=True
+    )
+
+    result = await authenticate_user_async(session, "test@test.com", "password")
+
+    assert result == user
+
+
+@pytest.mark.anyio
+async def test_authenticate_user_async_wrong_password(mocker):
+    session = mocker.Mock()
+    user = mocker.Mock(hashed_password="hashed")
+
+    mocker.patch(
+        "app.domain.services.auth_service.async_user_repository.get_user_by_email",
+        new=mocker.AsyncMock(return_value=user)
+    )
+    mocker.patch(
+        "app.domain.services.auth_service.verify_password",
+        return_value=False
+    )
+
+    result = await authenticate_user_async(session, "test@test.com", "password")
+
+    assert result is None
@@ -0,0 +1,33 @@
+import uuid
+
+from app.domain.services.sketch_service import reservoir_slots, scale_sample_count
+
+
+def test_reservoir_fills_free_slots_then_replaces_by_random_index():
+    submission_ids = [uuid.uuid4() for _ in range(4)]
+    picks = iter([1, 7])
+
+    slots = reservoir_slots(
+        submission_ids=submission_ids,
+        submission_count=5,
+        size=3,
+        random_index=lambda bound: next(picks)
+    )
+
+    assert slots == {1: submission_ids[2], 2: submission_ids[1]}
+
+
+def test_reservoir_keeps_every_submission_below_capacity():
+    submission_ids = [uuid.uuid4() for _ in range(3)]
+
+    slots = reservoir_slots(submission_ids=submission_ids, submission_count=3, size=10)
+
+    assert slots == dict(enumerate(submission_ids))
+
+
+def test_scaled_sample_count_has_finite_population_error():
+    estimate = scale_sample_count(count=250, sample_size=1000, population=100000)
+
+    assert estimate.value == 25000.0
+    assert 2650 < estimate.error < 2700
+    assert scale_sample_count(count=250, sample_size=1000, population=1000).error == 0.0
@@ -49,7 +49,7 @@ def test_check_already_submitted_fingerprint_exists(mocker):
         return_value=survey
     )
     mocker.patch(
-        "app.domain.services.submission_service.submission_repository.check_fingerprint_exists",
+        "app.domain.services.submission_service.fingerprint_service.fingerprint_exists",
         return_value=True
     )
 
@@ -90,7 +90,8 @@ def test_submit_submission_duplicate_detected(mocker):
     session = mocker.Mock()
     submission_create = mocker.Mock(
         survey_id=uuid.uuid4(),
-        answers=[]
+        answers=[],
+        share_token=None
     )
 
     survey = mocker.Mock(
@@ -104,15 +105,11 @@ def test_submit_submission_duplicate_detected(mocker):
         return_value=survey
     )
     mocker.patch(
-        "app.domain.services.submission_service.get_questions_by_survey_id",
-        return_value=[]
+        "app.domain.services.submission_service.get_survey_validator"
     )
     mocker.patch(
-        "app.domain.services.submission_service.validate_answers_creation"
-    )
-    mocker.patch(
-        "app.domain.services.submission_service.submission_repository.check_fingerprint_exists",
-        return_value=True
+        "app.domain.services.submission_service.fingerprint_service.claim_fingerprint",
+        return_value=False
     )
 
     with pytest.raises(HTTPException) as exc:
@@ -27,6 +27,10 @@ export class SurveyFillComponent implements OnInit {
   AnswerType = AnswerType;
   milestone50Shown = false;
   milestone100Shown = false;
+  shareToken: string | null = null;
+  sharePassword = '';
+  passwordRequired = false;
+  passwordError = '';
   constructor(
     private fb: FormBuilder,
     private surveyService: SurveyService,
@@ -81,8 +85,11 @@ export class SurveyFillComponent implements OnInit {
   }
 
   loadSurveyByToken(token: string): void {
-    this.surveyService.getSurveyByToken(token).subscribe({
+    this.shareToken = token;
+    this.surveyService.getSurveyByToken(token, this.sharePassword || undefined).subscribe({
       next: (survey) => {
+        this.passwordRequired = false;
+        this.passwordError = '';
 
         if (survey.status === 'expired') {
           this.errorMessage = 'Ta ankieta wygasła i nie można już jej wypełnić.';
@@ -95,11 +102,26 @@ export class SurveyFillComponent implements OnInit {
         this.checkBackendFingerprint(survey);
       },
       error: (error) => {
+        if (error.status === 401 || (error.status === 403 && this.sharePassword)) {
+          this.loading = false;
+          this.passwordRequired = true;
+          this.passwordError = error.status === 403 ? 'Nieprawidłowe hasło.' : '';
+          return;
+        }
         this.handleLoadError(error);
       }
     });
   }
 
+  submitSharePassword(): void {
+    if (!this.shareToken || !this.sharePassword) {
+      return;
+    }
+    this.loading = true;
+    this.passwordError = '';
+    this.loadSurveyByToken(this.shareToken);
+  }
+
   loadPublicSurvey(surveyId: string): void {
     this.surveyService.getPublicSurveyById(surveyId).subscribe({
       next: (survey) => {
@@ -239,6 +261,8 @@ export class SurveyFillComponent implements OnInit {
       const submission = {
         survey_id: this.survey.id,
         fingerprint_advanced: advancedFingerprint,
+        share_token: this.shareToken || undefined,
+        share_password: this.sharePassword || undefined,
         answers: this.answers.controls.map((control, index) => {
           const question = this.survey!.questions[index];
 
@@ -287,6 +311,8 @@ export class SurveyFillComponent implements OnInit {
             }
           } else if (error.status === 410) {
             this.errorMessage = error.error?.detail || 'Ta ankieta wygasła i nie można już jej wypełnić.';
+          } else if (error.status === 401 || error.status === 403) {
+            this.errorMessage = error.error?.detail || 'Nie masz dostępu do tej ankiety.';
           } else {
             this.errorMessage = error.error?.message || error.error?.detail || 'Błąd podczas wysyłania ankiety';
           }
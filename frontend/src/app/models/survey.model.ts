@@ -92,6 +92,9 @@ export interface Submission {
 export interface SubmissionCreate {
   survey_id: string;
   answers: AnswerCreate[];
+  fingerprint_advanced?: string | null;
+  share_token?: string;
+  share_password?: string;
 }
 
 
@@ -113,7 +116,8 @@ export interface ShareLink {
   share_token: string;
   is_active: boolean;
   max_responses?: number;
-  password?: string;
+  has_password: boolean;
+  response_count: number;
   expires_at?: Date;
   created_at: Date;
   clicks: number;
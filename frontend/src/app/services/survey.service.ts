@@ -1,5 +1,5 @@
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpHeaders } from '@angular/common/http';
 import { Observable } from 'rxjs';
 import { Survey, SurveyCreate, QuestionCreate, Question, SubmissionCreate, Submission, ShareLink, ShareLinkCreate, SurveyStatus } from '../models/survey.model';
 import { environment } from '../../environments/environment';
@@ -25,8 +25,9 @@ export class SurveyService {
     return this.http.get<Survey>(`${this.API_URL}/v1/survey/${surveyId}`);
   }
 
-  getSurveyByToken(token: string): Observable<Survey> {
-    return this.http.get<Survey>(`${this.API_URL}/v1/share/token/${token}/survey`);
+  getSurveyByToken(token: string, password?: string): Observable<Survey> {
+    const headers = password ? new HttpHeaders({ 'X-Share-Password': password }) : undefined;
+    return this.http.get<Survey>(`${this.API_URL}/v1/share/token/${token}/survey`, { headers });
   }
 
   getPublicSurveys(): Observable<Survey[]> {